@@ -0,0 +1,102 @@
+"""Answer evaluation CPU cost: selection lists vs. bitmasks.
+
+Interactive: one ENTER press on a question, toggling a selection and checking
+if the question is complete and correct. Grading: checking one selected
+answer list of an answer sheet against the correct answers, and checking an
+answer that is already kept as a bitmask (ie. in a QuestionStore).
+
+Usage:
+    python dev_stuff/benchmarks/bench_answer_evaluation.py
+"""
+
+import os
+import sys
+from timeit import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from exam_terminal.answer_evaluation import AnswerSelection, indexes_to_mask, is_correct, selection_mask  # noqa: E402
+
+PRESSES = 200_000
+SELECTION_COUNTS = (5, 60)
+
+
+def make_question(selection_count: int) -> tuple:
+    """Correct answer indexes and bools of a question with every third selection correct"""
+    answer_indexes = list(range(0, selection_count, 3))
+    answer_bool = [index in answer_indexes for index in range(selection_count)]
+    return answer_indexes, answer_bool
+
+
+def list_presses(selection_count: int) -> float:
+    """Old behavior, selection index list and a list of correct bools compared as a whole"""
+    answer_indexes, answer_bool = make_question(selection_count)
+    answered_indexes: list = []
+    answered_correct_bool = [False] * selection_count
+    min_selection_count = sum(answer_bool)
+
+    def press(index: int = selection_count - 1) -> tuple:
+        if index not in answered_indexes:
+            answered_indexes.append(index)
+        else:
+            answered_indexes.pop(answered_indexes.index(index))
+        answered_correct_bool[index] = answer_bool[index] != answered_correct_bool[index]
+        correct_all = answer_bool == answered_correct_bool
+        return len(answered_indexes) >= min_selection_count, correct_all
+
+    return timeit(press, number=PRESSES)
+
+
+def mask_presses(selection_count: int) -> float:
+    """New behavior, AnswerSelection bitmasks"""
+    answer_indexes, _ = make_question(selection_count)
+    selection = AnswerSelection(indexes_to_mask(answer_indexes))
+
+    def press(index: int = selection_count - 1) -> tuple:
+        selection.toggle(index)
+        return selection.is_complete, selection.is_correct
+
+    return timeit(press, number=PRESSES)
+
+
+def set_grading(selection_count: int) -> float:
+    """Old grader, frozenset of the answered indexes compared with a frozenset of correct ones"""
+    answer_indexes, _ = make_question(selection_count)
+    answer_set = frozenset(answer_indexes)
+    answered = list(answer_indexes)
+    return timeit(lambda: answered is not None and frozenset(answered) == answer_set, number=PRESSES)
+
+
+def mask_grading(selection_count: int) -> float:
+    """New grader, validated bitmask of the answered indexes compared with the correct bitmask"""
+    answer_indexes, _ = make_question(selection_count)
+    answer_mask = indexes_to_mask(answer_indexes)
+    answered = list(answer_indexes)
+
+    def grade() -> bool:
+        selected_mask = selection_mask(answered, selection_count)
+        return answered is not None and selected_mask is not None and is_correct(selected_mask, answer_mask)
+
+    return timeit(grade, number=PRESSES)
+
+
+def stored_mask_grading(selection_count: int) -> float:
+    """Answer kept as a bitmask, only the comparison is left"""
+    answer_indexes, _ = make_question(selection_count)
+    answer_mask = indexes_to_mask(answer_indexes)
+    answered_mask = indexes_to_mask(answer_indexes)
+    return timeit(lambda: is_correct(answered_mask, answer_mask), number=PRESSES)
+
+
+if __name__ == '__main__':
+    for selection_count in SELECTION_COUNTS:
+        print(f'{selection_count} selections:')
+        for name, function in [
+            ('interactive, lists', list_presses),
+            ('interactive, bitmask', mask_presses),
+            ('grading, frozensets', set_grading),
+            ('grading, bitmask', mask_grading),
+            ('grading, stored bitmask', stored_mask_grading),
+        ]:
+            seconds = function(selection_count)
+            print(f'  {name:22s}: {seconds / PRESSES * 1e9:8.0f} ns/answer')
@@ -0,0 +1,60 @@
+"""Exam journal append latency, as seen by the render loop, and writer throughput.
+
+Appending only queues the event, so it should cost microseconds no matter how
+slow the disk is. Events are written and synced to disk by the writer thread.
+
+Usage:
+    python dev_stuff/benchmarks/bench_exam_journal.py [event_count]
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+from time import perf_counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from exam_terminal.exam_journal import ExamJournal, load_journal, replay_journal  # noqa: E402
+
+EVENTS = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        journal_path = os.path.join(directory, 'exam.journal')
+        journal = ExamJournal(journal_path)
+        journal.append('begin', exam_title='Benchmark', questions_count=EVENTS, exam_attempt=0)
+
+        latencies = []
+        begin = perf_counter()
+        for q in range(EVENTS):
+            start = perf_counter()
+            journal.append(
+                'answer',
+                question=q,
+                answered_indexes=[0, 2],
+                correct=True,
+                timeout=False,
+                question_time=1.5,
+                exam_time=q * 1.5,
+                paused_time=0.0,
+            )
+            latencies.append(perf_counter() - start)
+        appended = perf_counter() - begin
+        journal.close()
+        written = perf_counter() - begin
+
+        latencies.sort()
+        print(
+            f'Appended {EVENTS} events in {appended * 1000:.1f} ms, written and synced after {written * 1000:.1f} ms'
+        )
+        print(
+            f'Append latency: median {statistics.median(latencies) * 1e6:.2f} us, '
+            f'p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.2f} us, max {latencies[-1] * 1e6:.1f} us'
+        )
+        print(f'Journal size: {os.path.getsize(journal_path) / 1024:.0f} KiB')
+
+        begin = perf_counter()
+        state = replay_journal(load_journal(journal_path))
+        print(f'Replayed {len(state["answers"])} answers in {(perf_counter() - begin) * 1000:.1f} ms')
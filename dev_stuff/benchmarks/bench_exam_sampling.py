@@ -0,0 +1,87 @@
+"""Drawing and shuffling an exam from a large question pool: copied question dicts vs. an ExamOrder.
+
+Copying draws the questions, copies each one and shuffles its selection list,
+as a per-candidate exam would be built from question dicts. ExamOrder keeps
+only the drawn question indexes and works out each selection order when the
+question is presented. Both present every drawn question once.
+
+Usage:
+    python dev_stuff/benchmarks/bench_exam_sampling.py [pool_size [draw_count ...]]
+"""
+
+import copy
+import gc
+import os
+import random
+import sys
+import tracemalloc
+from time import perf_counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from bench_question_store_memory import make_questions  # noqa: E402
+
+from exam_terminal.exam_order import ExamOrder, OrderedQuestions  # noqa: E402
+from exam_terminal.question_store import QuestionStore  # noqa: E402
+
+POOL_SIZE = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+DRAW_COUNTS = [int(count) for count in sys.argv[2:]] or [50, 2_000, POOL_SIZE]
+REPEAT = 20
+
+
+def draw_copies(pool: QuestionStore, draw_count: int, seed: int) -> list:
+    """Old approach, copies of the drawn questions with their selections shuffled in place"""
+    rng = random.Random(seed)
+    questions = []
+    for index in rng.sample(range(len(pool)), draw_count):
+        question = copy.deepcopy(dict(pool[index]))
+        order = list(range(len(question['selection'])))
+        rng.shuffle(order)
+        question['selection'] = [question['selection'][i] for i in order]
+        question['question_answer_bool'] = [question['question_answer_bool'][i] for i in order]
+        question['question_answer_indexes'] = sorted(order.index(i) for i in question['question_answer_indexes'])
+        questions.append(question)
+    for question in questions:
+        question['selection']
+    return questions
+
+
+def draw_order(pool: QuestionStore, draw_count: int, seed: int) -> OrderedQuestions:
+    """New approach, drawn indexes only, each question presented through its selection order"""
+    order = ExamOrder(len(pool), seed, draw_count, shuffle_questions=True, shuffle_selections=True)
+    questions = OrderedQuestions(pool, order)
+    for position in range(len(questions)):
+        order.present(position, questions[position])['selection']
+    return questions
+
+
+def measure(draw, pool: QuestionStore, draw_count: int) -> tuple[float, int]:
+    """Seconds per exam drawn and presented, and memory kept by one drawn exam"""
+    repeat = max(1, REPEAT * 50 // draw_count)
+    start = perf_counter()
+    for seed in range(repeat):
+        draw(pool, draw_count, seed)
+    seconds = (perf_counter() - start) / repeat
+
+    gc.collect()
+    tracemalloc.start()
+    exam = draw(pool, draw_count, 0)
+    gc.collect()
+    kept = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del exam
+    return seconds, kept
+
+
+if __name__ == '__main__':
+    print(f'Building a pool of {POOL_SIZE} questions ...')
+    pool = QuestionStore(make_questions(POOL_SIZE))
+
+    print(f'{"drawn":>8} {"copies":>10} {"order":>10} {"speedup":>8} {"copies kept":>12} {"order kept":>12}')
+    for draw_count in DRAW_COUNTS:
+        copies_seconds, copies_kept = measure(draw_copies, pool, draw_count)
+        order_seconds, order_kept = measure(draw_order, pool, draw_count)
+        print(
+            f'{draw_count:>8} {copies_seconds * 1e3:>7.2f} ms {order_seconds * 1e3:>7.2f} ms {copies_seconds / order_seconds:>7.1f}x '
+            f'{copies_kept / 2**10:>8.1f} KiB {order_kept / 2**10:>8.1f} KiB'
+        )
@@ -0,0 +1,40 @@
+"""Memory of exam server sessions, compared to a whole interactive exam per candidate.
+
+Each server session only keeps its answers and timer, the parsed exam is shared.
+
+Usage:
+    python dev_stuff/benchmarks/bench_exam_server_sessions.py [session_count]
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from exam_terminal import ExamTerminal, utility  # noqa: E402
+from exam_terminal.exam_server import ExamSession, ServedExam  # noqa: E402
+
+SAMPLE_EXAM = os.path.join(os.path.dirname(__file__), '..', '..', 'exam_terminal', 'exams', 'sample_exam.yml')
+SESSIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+
+if __name__ == '__main__':
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    exam_contents = utility.load_examfile_contents_from_local_file(SAMPLE_EXAM)
+    exam = ExamTerminal.ExamTerminal(exam_contents)
+    per_candidate = sum(stat.size for stat in tracemalloc.take_snapshot().compare_to(before, 'filename'))
+    print(f'Interactive exam (parsed exam + ExamTerminal), per candidate process: {per_candidate / 1024:.1f} KiB')
+
+    served = ServedExam(utility.load_examfile_contents_from_local_file(SAMPLE_EXAM))
+    before = tracemalloc.take_snapshot()
+    sessions = []
+    for s in range(SESSIONS):
+        session = ExamSession(served, f'session-{s}')
+        session.begin()
+        for q in range(served.questions_count):
+            session.answer([0])
+        sessions.append(session)
+    total = sum(stat.size for stat in tracemalloc.take_snapshot().compare_to(before, 'filename'))
+    print(f'{SESSIONS} finished server sessions: {total / 1024:.1f} KiB, {total / SESSIONS:.0f} bytes per session')
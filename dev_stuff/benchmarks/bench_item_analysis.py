@@ -0,0 +1,48 @@
+"""Item analysis throughput and peak memory over a growing stream of exam attempts.
+
+Peak memory should stay flat as the number of attempts grows.
+
+Usage:
+    python dev_stuff/benchmarks/bench_item_analysis.py [question_count]
+"""
+
+import os
+import random
+import sys
+import tracemalloc
+from time import perf_counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from exam_terminal.analytics import ItemAnalysis  # noqa: E402
+
+QUESTIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+
+
+def generate_attempts(attempt_count: int, question_count: int):
+    """Yield random attempt records one at a time, never holding them all"""
+    rng = random.Random(0)
+    for a in range(attempt_count):
+        ability = rng.random()
+        correct = [rng.random() < 0.2 + 0.7 * ability for _ in range(question_count)]
+        yield {
+            'id': a,
+            'answers': [[0] if c else [rng.randrange(1, 5)] for c in correct],
+            'correct': correct,
+            'answer_times': [rng.expovariate(1 / 20) for _ in range(question_count)],
+        }
+
+
+if __name__ == '__main__':
+    for attempts in (1_000, 10_000, 50_000):
+        analysis = ItemAnalysis()
+        tracemalloc.start()
+        begin = perf_counter()
+        analysis.add_attempts(generate_attempts(attempts, QUESTIONS))
+        summary = analysis.get_summary()
+        seconds = perf_counter() - begin
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f'{attempts:7d} attempts x {QUESTIONS} questions: {seconds:7.2f} s  {attempts / seconds:8.0f} attempts/sec  peak {peak / 1024:8.1f} KiB  KR-20 {summary["kr20"]:.3f}'
+        )
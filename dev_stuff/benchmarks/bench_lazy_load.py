@@ -0,0 +1,37 @@
+"""Time until the exam menu can be shown: full YAML load and parse vs. lazy question bank.
+
+Usage:
+    python dev_stuff/benchmarks/bench_lazy_load.py [question_count]
+"""
+
+import os
+import sys
+import tempfile
+from time import perf_counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from make_exam_file import write_exam_file  # noqa: E402
+
+from exam_terminal import ExamTerminal, question_bank, utility  # noqa: E402
+
+QUESTIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, 'exam.yml')
+        write_exam_file(QUESTIONS, file_path)
+
+        begin = perf_counter()
+        full = ExamTerminal.ExamTerminal(utility.load_examfile_contents_from_local_file(file_path))
+        print(f'Full load and parse      : {perf_counter() - begin:8.3f} s until menu')
+
+        begin = perf_counter()
+        lazy = ExamTerminal.ExamTerminal(question_bank.load_examfile_contents_lazily(file_path))
+        print(f'Lazy question bank       : {perf_counter() - begin:8.3f} s until menu')
+        lazy.exam_contents['questions'].wait_until_indexed()
+        print(f'Lazy question bank index : {perf_counter() - begin:8.3f} s until all {QUESTIONS} questions indexed')
+
+        for index in (0, QUESTIONS // 2, QUESTIONS - 1):
+            assert lazy.exam_contents['questions'][index] == full.exam_contents['questions'][index]
@@ -0,0 +1,56 @@
+"""Throughput of batch grading in-process vs. a pool of worker processes.
+
+Results of every run must match the in-process results, line by line.
+
+Usage:
+    python dev_stuff/benchmarks/bench_parallel_grading.py [sheet_count] [question_count]
+"""
+
+import io
+import json
+import os
+import random
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from make_exam_file import make_exam_text  # noqa: E402
+
+from exam_terminal import grading, utility  # noqa: E402
+
+SHEETS = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+QUESTIONS = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+
+def make_sheets_text(sheet_count: int, question_count: int) -> str:
+    """Build a JSONL text of random answer sheets"""
+    rng = random.Random(0)
+    lines = []
+    for s in range(sheet_count):
+        answers = [sorted(rng.sample(range(5), rng.randint(1, 2))) for _ in range(question_count)]
+        lines.append(json.dumps({'id': f'student-{s}', 'answers': answers}))
+    return '\n'.join(lines) + '\n'
+
+
+def timed(function, *args, **kwargs) -> tuple[str, float]:
+    """Run a grading function on the sheets, return its output and seconds taken"""
+    output = io.StringIO()
+    begin = perf_counter()
+    function(*args, io.StringIO(sheets_text), output, **kwargs)
+    return output.getvalue(), perf_counter() - begin
+
+
+if __name__ == '__main__':
+    exam_contents = utility.load_yaml(make_exam_text(QUESTIONS))
+    sheets_text = make_sheets_text(SHEETS, QUESTIONS)
+    print(f'{SHEETS} answer sheets, {QUESTIONS} questions, {os.cpu_count()} CPUs')
+
+    expected, seconds = timed(grading.grade_answer_sheets, exam_contents)
+    print(f'in-process   : {seconds:7.3f} s  {SHEETS / seconds:10.0f} sheets/sec')
+
+    for workers in sorted({1, 2, 4, os.cpu_count() or 1}):
+        output, seconds = timed(grading.grade_answer_sheets_parallel, exam_contents, workers=workers)
+        assert output == expected, f'Results with {workers} workers differ from in-process results'
+        print(f'{workers:2d} processes : {seconds:7.3f} s  {SHEETS / seconds:10.0f} sheets/sec')
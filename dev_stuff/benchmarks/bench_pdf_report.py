@@ -0,0 +1,76 @@
+"""Render time, size and peak memory of the per-question PDF report, with and without the page chrome cache.
+
+Both renders must be byte for byte identical.
+
+Usage:
+    python dev_stuff/benchmarks/bench_pdf_report.py [question_count]
+"""
+
+import os
+import random
+import sys
+import tracemalloc
+from time import perf_counter, time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from make_exam_file import make_exam_text  # noqa: E402
+
+from exam_terminal import utility  # noqa: E402
+from exam_terminal.pdf_report import ResultsReport  # noqa: E402
+from exam_terminal.question_bank import parse_question  # noqa: E402
+
+QUESTIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+
+def make_answered_questions(question_count: int) -> list:
+    """Parse a synthetic exam and answer each question randomly"""
+    rng = random.Random(0)
+    questions = utility.load_yaml(make_exam_text(question_count))['questions']
+    for index, question in enumerate(questions):
+        parse_question(question, index)
+        question['answered'] = rng.random() > 0.05
+        question['answered_indexes'] = [rng.randrange(len(question['selection']))]
+        question['answered_correctly'] = question['answered_indexes'] == question['question_answer_indexes']
+        question['answered_question_time'] = rng.expovariate(1 / 20)
+    return questions
+
+
+def render(questions: list, cache_chrome: bool) -> tuple[bytes, int, float]:
+    """Render the report, return its bytes, page count, and seconds taken"""
+    exam = {
+        'exam_title': 'Synthetic Exam',
+        'exam_end_timestamp': time() // 60 * 60,
+        'evaluation_bool': True,
+        'evaluation_label': 'PASSED',
+    }
+    results = [{'label': 'Exam Title:', 'text': exam['exam_title'], 'font_width': '', 'skip_lines': 1}]
+    begin = perf_counter()
+    report = ResultsReport(exam, 'exam-terminal benchmark', cache_chrome=cache_chrome)
+    report.add_summary_page(results, text_width=54)
+    report.add_questions(questions)
+    pdf_bytes = report.render()
+    return pdf_bytes, report.page_no(), perf_counter() - begin
+
+
+if __name__ == '__main__':
+    questions = make_answered_questions(QUESTIONS)
+    render(questions[:10], True)  # Warm up, fpdf font metrics
+
+    outputs = {}
+    for cache_chrome in (False, True):
+        pdf_bytes, pages, seconds = render(questions, cache_chrome)
+        outputs[cache_chrome] = pdf_bytes
+        label = 'cached chrome' if cache_chrome else 'drawn chrome '
+        print(
+            f'{label}: {QUESTIONS} questions, {pages} pages, {len(pdf_bytes) / 1024:7.1f} KiB, {seconds:6.2f} s, {pages / seconds:6.1f} pages/sec'
+        )
+
+    assert outputs[False] == outputs[True], 'Cached page chrome renders different bytes'
+
+    tracemalloc.start()
+    render(questions, True)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'peak traced memory while rendering: {peak / 1024 / 1024:.1f} MiB')
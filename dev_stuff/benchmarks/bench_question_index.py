@@ -0,0 +1,86 @@
+"""Assembling an exam by tags and difficulty from a large question bank: full YAML load vs. the question bank index.
+
+Full load parses the whole bank and filters the question dicts. The index is
+built once (timed separately), later assemblies only load the index and read
+the picked questions.
+
+Usage:
+    python dev_stuff/benchmarks/bench_question_index.py [question_count]
+"""
+
+import os
+import random
+import sys
+import tempfile
+from time import perf_counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from exam_terminal import utility  # noqa: E402
+from exam_terminal.question_index import QuestionIndex, get_question_labels, parse_pick  # noqa: E402
+
+QUESTION_COUNT = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+TAGS = ('networking', 'security', 'storage', 'compute', 'databases')
+DIFFICULTIES = ('easy', 'medium', 'hard')
+PICKS = [parse_pick(pick) for pick in ('20:networking', '10:difficulty=hard', '5:security')]
+REPEAT = 5
+
+
+def write_bank(file_path: str) -> None:
+    """Write a synthetic question bank with tags and difficulties"""
+    lines = ['questions:']
+    for q in range(QUESTION_COUNT):
+        lines.append(f'  - question: "Synthetic question number {q}, which selections are correct?"')
+        lines.append(f'    question_tags: [{TAGS[q % 5]}, {TAGS[q * 7 % 5]}]')
+        lines.append(f'    question_difficulty: {DIFFICULTIES[q % 3]}')
+        lines.append('    selection:')
+        for s in range(5):
+            lines.append(f'      - "Selection {s} of question {q}"{": true" if s == q % 5 else ""}')
+    with open(file_path, 'w') as file:
+        file.write('\n'.join(lines) + '\n')
+
+
+def assemble_full_load(bank_path: str, exam_path: str, seed: int) -> None:
+    """Old way, load the whole bank and filter its question dicts"""
+    questions = utility.load_examfile_contents_from_local_file(bank_path)['questions']
+    labels = [get_question_labels(question) for question in questions]
+    rng = random.Random(seed)
+    taken: set = set()
+    picked = []
+    for count, tags, difficulty in PICKS:
+        candidates = [
+            i
+            for i, (question_tags, question_difficulty) in enumerate(labels)
+            if i not in taken
+            and set(tags) <= set(question_tags)
+            and (difficulty is None or question_difficulty == difficulty)
+        ]
+        chosen = rng.sample(candidates, count)
+        picked.extend(questions[i] for i in chosen)
+        taken.update(chosen)
+
+
+def assemble_indexed(bank_path: str, exam_path: str, seed: int) -> None:
+    """New way, bank index and the picked questions only"""
+    index = QuestionIndex([bank_path])
+    index.write_exam_file(exam_path, index.pick(PICKS, seed))
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        bank_path = os.path.join(directory, 'bank.yml')
+        exam_path = os.path.join(directory, 'exam.yml')
+        write_bank(bank_path)
+        print(f'Question bank: {QUESTION_COUNT} questions, {os.path.getsize(bank_path) / 2**20:.1f} MiB')
+
+        start = perf_counter()
+        index = QuestionIndex([bank_path], rebuild=True)
+        print(
+            f'Index build (once)  : {perf_counter() - start:8.3f} s, {os.path.getsize(bank_path + ".examidx") / 2**10:.0f} KiB'
+        )
+
+        for name, assemble in [('Full load and filter', assemble_full_load), ('Indexed assembly', assemble_indexed)]:
+            start = perf_counter()
+            for seed in range(REPEAT):
+                assemble(bank_path, exam_path, seed)
+            print(f'{name:20s}: {(perf_counter() - start) / REPEAT:8.3f} s per exam')
@@ -0,0 +1,46 @@
+"""Per-frame question layout CPU cost: re-wrapping every frame vs. LayoutCache.
+
+Usage:
+    python dev_stuff/benchmarks/bench_question_layout.py
+"""
+
+import os
+import sys
+import textwrap
+from timeit import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from exam_terminal.layout import LayoutCache  # noqa: E402
+
+FRAMES = 2000
+WIDTH = 100
+
+question = {
+    'question_number': 0,
+    'question': ' '.join(f'word{i}' for i in range(200)),
+    'selection': [' '.join(f'option{s}-{i}' for i in range(25)) for s in range(12)],
+}
+
+
+def rewrap_every_frame():
+    """Old behavior, new TextWrapper objects and wrapping on every frame"""
+    wrapper_question = textwrap.TextWrapper(width=WIDTH - 5)
+    wrapper_selection = textwrap.TextWrapper(width=WIDTH - 10)
+    wrapper_question.wrap(text=question['question'])
+    for selection in question['selection']:
+        wrapper_selection.wrap(text=selection)
+
+
+layout = LayoutCache()
+
+
+def cached_layout():
+    """New behavior, wrapped once per terminal width"""
+    layout.question(question, WIDTH, '', 3)
+
+
+if __name__ == '__main__':
+    for name, function in [('re-wrap every frame', rewrap_every_frame), ('LayoutCache', cached_layout)]:
+        seconds = timeit(function, number=FRAMES)
+        print(f'{name:20s}: {seconds / FRAMES * 1e6:10.2f} us/frame')
@@ -0,0 +1,87 @@
+"""Memory of parsed and answered exam questions, as question dicts and as a QuestionStore.
+
+Questions are built like the YAML loader gives them (see make_exam_file.py),
+then parsed and answered the way an exam does.
+
+Usage:
+    python dev_stuff/benchmarks/bench_question_store_memory.py [question_count ...]
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from exam_terminal.question_bank import parse_question  # noqa: E402
+from exam_terminal.question_store import QuestionStore  # noqa: E402
+
+QUESTION_COUNTS = [int(count) for count in sys.argv[1:]] or [1_000, 10_000, 100_000]
+
+
+def make_questions(question_count: int) -> list:
+    """Build loaded question dicts of a synthetic exam, with a few shared selection texts"""
+    questions = []
+    for q in range(question_count):
+        question = {'question': f'Synthetic question number {q}, which selections are correct?'}
+        if q % 3 == 0:
+            question['question_allowed_time'] = 30
+        if q % 2:
+            selections = [f'Selection {s} of question {q}' for s in range(5)]
+        else:
+            selections = ['True', 'False', 'Not sure', 'All of the above', 'None of the above']
+        question['selection'] = [
+            {text: True} if s == q % 5 or (q % 4 == 0 and s == (q + 1) % 5) else text
+            for s, text in enumerate(selections)
+        ]
+        questions.append(question)
+    return questions
+
+
+def answer(question, index: int) -> None:
+    """Answer a question like the exam does"""
+    question['question_presented_timestamp'] = 1_700_000_000.0 + index
+    question['answered_indexes'] = [index % 5]
+    question['answered'] = True
+    question['answered_timestamp'] = 1_700_000_010.0 + index
+    question['answered_exam_time'] = 10.0 * index
+    question['answered_question_time'] = 10.0
+    question['answered_correctly'] = index % 2 == 0
+
+
+def measure(build) -> tuple[int, int]:
+    """Memory kept and peak memory of building and answering all questions"""
+    gc.collect()
+    tracemalloc.start()
+    questions = build()
+    for index, question in enumerate(questions):
+        answer(question, index)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del questions
+    return current, peak
+
+
+def build_dicts(question_count: int) -> list:
+    """Question dicts, parsed in place as before"""
+    return [parse_question(question, index) for index, question in enumerate(make_questions(question_count))]
+
+
+def build_store(question_count: int) -> QuestionStore:
+    """Question store, the loaded dicts are dropped once stored"""
+    return QuestionStore(make_questions(question_count))
+
+
+if __name__ == '__main__':
+    print(
+        f'{"questions":>10} {"dicts kept":>12} {"store kept":>12} {"ratio":>6} {"dicts peak":>12} {"store peak":>12}'
+    )
+    for count in QUESTION_COUNTS:
+        dicts_kept, dicts_peak = measure(lambda: build_dicts(count))
+        store_kept, store_peak = measure(lambda: build_store(count))
+        print(
+            f'{count:>10} {dicts_kept / 2**20:>9.1f} MiB {store_kept / 2**20:>9.1f} MiB {dicts_kept / store_kept:>5.1f}x '
+            f'{dicts_peak / 2**20:>9.1f} MiB {store_peak / 2**20:>9.1f} MiB'
+        )
@@ -0,0 +1,54 @@
+"""Terminal output bytes per minute while sitting on a question: clear every frame vs. RetainedFrame.
+
+Usage:
+    python dev_stuff/benchmarks/bench_render_bytes.py [seconds]
+"""
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from pty_runner import run_in_pty  # noqa: E402
+
+from exam_terminal import ExamTerminal, render, utility  # noqa: E402
+from exam_terminal.screen_manager import ScreenManager  # noqa: E402
+
+SAMPLE_EXAM = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..', 'exam_terminal', 'exams', 'sample_exam.yml')
+)
+SECONDS = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+
+
+class ClearEveryFrame(render.RetainedFrame):
+    """Old behavior, scr.clear() and a full redraw on every frame"""
+
+    def is_damaged(self, scr, *state):
+        scr.clear()
+        return True
+
+
+def sit_on_question(frame_class):
+    def run():
+        ExamTerminal.RetainedFrame = frame_class
+        exam = ExamTerminal.ExamTerminal(
+            utility.load_examfile_contents_from_local_file(SAMPLE_EXAM), screen=ScreenManager()
+        )
+        question = exam.exam_contents['questions'][1]  # No question time limit
+
+        def session(screen):
+            exam.exam_timer.start()
+            threading.Timer(SECONDS, lambda: setattr(exam, 'exam_quit', 2)).start()
+            return exam.show_question(question)
+
+        return exam.screen.run(session)
+
+    return run
+
+
+if __name__ == '__main__':
+    for name, frame_class in [('scr.clear() every frame', ClearEveryFrame), ('RetainedFrame', render.RetainedFrame)]:
+        output, _ = run_in_pty(sit_on_question(frame_class))
+        print(f'{name:25s}: {len(output) / SECONDS * 60:10.0f} terminal bytes/minute')
@@ -0,0 +1,65 @@
+"""Per-question view transition cost: curses.wrapper per view vs. one ScreenManager session.
+
+Usage:
+    python dev_stuff/benchmarks/bench_screen_transitions.py
+"""
+
+import curses
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from pty_runner import run_in_pty  # noqa: E402
+
+from exam_terminal import utility  # noqa: E402
+from exam_terminal.screen_manager import ScreenManager  # noqa: E402
+
+TRANSITIONS = 200
+
+
+def draw_view(scr):
+    """Stand-in for a single view, draws one frame and leaves"""
+    scr.addstr(2, 2, 'Question text')
+    scr.refresh()
+
+
+def wrapper_per_view():
+    """Old behavior, every view opens and closes its own curses session"""
+
+    def view(scr):
+        curses.curs_set(0)
+        utility.load_curses_colors_decor()
+        curses.noecho()
+        curses.halfdelay(5)
+        draw_view(scr)
+
+    begin = perf_counter()
+    for _ in range(TRANSITIONS):
+        curses.wrapper(view)
+    return (perf_counter() - begin) / TRANSITIONS
+
+
+def single_session():
+    """New behavior, views switch within one ScreenManager session"""
+
+    def session(screen):
+        begin = perf_counter()
+        for _ in range(TRANSITIONS):
+            screen.show(draw_view)
+        return (perf_counter() - begin) / TRANSITIONS
+
+    return ScreenManager().run(session)
+
+
+if __name__ == '__main__':
+    for name, function in [
+        ('curses.wrapper per view', wrapper_per_view),
+        ('single ScreenManager session', single_session),
+    ]:
+        output, seconds = run_in_pty(function)
+        print(
+            f'{name:30s}: {seconds * 1000:8.3f} ms/transition, {len(output) / TRANSITIONS:8.1f} terminal bytes/transition'
+        )
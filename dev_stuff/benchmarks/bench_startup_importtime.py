@@ -0,0 +1,70 @@
+"""Cold start import time of the exam-terminal CLI, fails if over budget.
+
+Uses "python -X importtime" and fails (exit code 1) if importing the CLI takes
+longer than the budget, or if it imports a library that is only needed for some
+runs (ie. fpdf for PDF export, requests for remote exam files).
+
+Usage:
+    python dev_stuff/benchmarks/bench_startup_importtime.py [budget_ms]
+"""
+
+import os
+import re
+import subprocess
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+BUDGET_MS = float(sys.argv[1]) if len(sys.argv) > 1 else 150.0
+RUNS = 5
+
+# Libraries that must only be imported when they are needed
+LAZY_MODULES = ['fpdf', 'requests', 'yaml', 'asyncio']
+
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)$')
+
+
+def measure_import_time() -> tuple[float, set]:
+    """Import the CLI in a fresh interpreter.
+
+    Returns:
+        milliseconds (float) : Cumulative import time of exam_terminal.__main__
+        modules (set)        : Names of all imported modules
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', 'import exam_terminal.__main__'],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    milliseconds = 0.0
+    modules = set()
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if not match:
+            continue
+        modules.add(match.group(4))
+        if match.group(4) == 'exam_terminal.__main__':
+            milliseconds = int(match.group(2)) / 1000
+    return milliseconds, modules
+
+
+if __name__ == '__main__':
+    timings = []
+    modules: set = set()
+    for _ in range(RUNS):
+        milliseconds, modules = measure_import_time()
+        timings.append(milliseconds)
+    best = min(timings)
+    print(f'CLI import time: best {best:.1f} ms of {RUNS} runs (budget {BUDGET_MS:.1f} ms)')
+
+    failed = False
+    eager = [module for module in LAZY_MODULES if module in modules]
+    if eager:
+        print(f'FAILED: Imported at startup but should be imported lazily: {eager}')
+        failed = True
+    if best > BUDGET_MS:
+        print(f'FAILED: CLI import time {best:.1f} ms is over budget of {BUDGET_MS:.1f} ms')
+        failed = True
+
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,61 @@
+"""Screen wakeups and exam clock lag while sitting on a question without pressing keys.
+
+The question screen should only wake up when the shown exam time changes,
+and show the new second right away.
+
+Usage:
+    python dev_stuff/benchmarks/bench_ui_wakeups.py [seconds]
+"""
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from pty_runner import run_in_pty  # noqa: E402
+
+from exam_terminal import ExamTerminal, render, utility  # noqa: E402
+from exam_terminal.screen_manager import ScreenManager  # noqa: E402
+
+SAMPLE_EXAM = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..', 'exam_terminal', 'exams', 'sample_exam.yml')
+)
+SECONDS = float(sys.argv[1]) if len(sys.argv) > 1 else 10.0
+
+
+def sit_on_question():
+    exam = ExamTerminal.ExamTerminal(
+        utility.load_examfile_contents_from_local_file(SAMPLE_EXAM), screen=ScreenManager()
+    )
+    question = exam.exam_contents['questions'][1]  # No question time limit
+    presented = []
+
+    class CountingFrame(render.RetainedFrame):
+        def present(self, scr):
+            presented.append(exam.exam_elapsed_time)
+            super().present(scr)
+
+    ExamTerminal.RetainedFrame = CountingFrame
+
+    def session(screen):
+        exam.exam_timer.start()
+        threading.Timer(SECONDS, lambda: setattr(exam, 'exam_quit', 2)).start()
+        exam.show_question(question)
+
+    exam.screen.run(session)
+
+    # How late each new second was shown, rounded display changes at x.5
+    lags = [
+        elapsed - (round(elapsed) - 0.5)
+        for previous, elapsed in zip(presented, presented[1:])
+        if round(elapsed) != round(previous)
+    ]
+    return len(presented), lags
+
+
+if __name__ == '__main__':
+    _, (wakeups, lags) = run_in_pty(sit_on_question)
+    print(f'Screen wakeups: {wakeups / SECONDS:.2f} per second, {len(lags)} clock changes shown')
+    print(f'Clock lag: average {sum(lags) / len(lags) * 1000:.1f} ms, max {max(lags) * 1000:.1f} ms')
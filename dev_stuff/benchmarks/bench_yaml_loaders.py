@@ -0,0 +1,39 @@
+"""Exam file load time: pure Python SafeLoader vs. libyaml CSafeLoader.
+
+Usage:
+    python dev_stuff/benchmarks/bench_yaml_loaders.py [question_count ...]
+"""
+
+import os
+import sys
+from time import perf_counter
+
+import yaml
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from make_exam_file import make_exam_text  # noqa: E402
+
+from exam_terminal import utility  # noqa: E402
+
+SIZES = [int(size) for size in sys.argv[1:]] or [100, 10_000, 100_000]
+
+if __name__ == '__main__':
+    print(f'exam-terminal YAML loader backend: {utility.get_yaml_loader()[1]}')
+    loaders = [('SafeLoader', yaml.SafeLoader)]
+    if getattr(yaml, '__with_libyaml__', False):
+        loaders.append(('CSafeLoader', yaml.CSafeLoader))
+
+    for size in SIZES:
+        text = make_exam_text(size)
+        timings = {}
+        for name, loader in loaders:
+            begin = perf_counter()
+            contents = yaml.load(text, Loader=loader)
+            timings[name] = perf_counter() - begin
+            assert len(contents['questions']) == size
+        line = ', '.join(f'{name}: {seconds:8.3f} s' for name, seconds in timings.items())
+        if len(timings) > 1:
+            line += f', speedup: {timings["SafeLoader"] / timings["CSafeLoader"]:4.1f}x'
+        print(f'{size:7d} questions -> {line}')
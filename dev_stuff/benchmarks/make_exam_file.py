@@ -0,0 +1,43 @@
+"""Write a synthetic exam YAML file with a given number of questions.
+
+Usage:
+    python dev_stuff/benchmarks/make_exam_file.py 20000 big_exam.yml
+"""
+
+import sys
+
+
+def make_exam_text(question_count: int) -> str:
+    """Build the YAML text of a synthetic exam"""
+    lines = [
+        '---',
+        'exam:',
+        '  exam_title: "Synthetic Exam"',
+        '  exam_description: Generated for benchmarks',
+        '  exam_author: "Benchmark"',
+        '  exam_edit_date: "01/01/2030"',
+        '  exam_allowed_time: 120',
+        '  exam_allowed_time_units: "minutes"',
+        '  exam_passing_score: 70',
+        '',
+        'questions:',
+    ]
+    for q in range(question_count):
+        lines.append(f'  - question: "Synthetic question number {q}, which selections are correct?"')
+        if q % 3 == 0:
+            lines.append('    question_allowed_time: 30')
+        lines.append('    selection:')
+        for s in range(5):
+            correct = ': true' if s == q % 5 or (q % 4 == 0 and s == (q + 1) % 5) else ''
+            lines.append(f'      - "Selection {s} of question {q}"{correct}')
+    return '\n'.join(lines) + '\n'
+
+
+def write_exam_file(question_count: int, file_path: str) -> None:
+    """Write a synthetic exam file"""
+    with open(file_path, 'w') as file:
+        file.write(make_exam_text(question_count))
+
+
+if __name__ == '__main__':
+    write_exam_file(int(sys.argv[1]), sys.argv[2])
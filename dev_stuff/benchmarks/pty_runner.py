@@ -0,0 +1,62 @@
+"""Run a function inside a pseudo terminal so curses code can be benchmarked headless.
+
+Usage:
+    from pty_runner import run_in_pty
+    output_bytes, result = run_in_pty(some_function, keys=b'jj\n')
+"""
+
+import os
+import pickle
+import pty
+import select
+import struct
+import sys
+import termios
+import fcntl
+
+
+def run_in_pty(function, keys: bytes = b'', rows: int = 40, cols: int = 100, key_delay: float = 0.05):
+    """Call function() in a forked child attached to a pseudo terminal.
+
+    Parameters:
+        function (callable): Called in the child, must return something picklable
+        keys (bytes)       : Keystrokes typed into the terminal, one at a time
+        rows (int)         : Terminal height
+        cols (int)         : Terminal width
+        key_delay (float)  : Seconds between keystrokes
+
+    Returns:
+        output (bytes) : Everything the child wrote to the terminal
+        result (Any)   : The function return value
+    """
+    result_read, result_write = os.pipe()
+    pid, fd = pty.fork()
+    if pid == 0:
+        os.close(result_read)
+        os.environ.setdefault('TERM', 'xterm-256color')
+        fcntl.ioctl(sys.stdout.fileno(), termios.TIOCSWINSZ, struct.pack('HHHH', rows, cols, 0, 0))
+        result = function()
+        os.write(result_write, pickle.dumps(result))
+        os._exit(0)
+
+    os.close(result_write)
+    fcntl.ioctl(fd, termios.TIOCSWINSZ, struct.pack('HHHH', rows, cols, 0, 0))
+    output = bytearray()
+    pending_keys = list(keys)
+    while True:
+        ready, _, _ = select.select([fd], [], [], key_delay)
+        if ready:
+            try:
+                data = os.read(fd, 65536)
+            except OSError:
+                break
+            if not data:
+                break
+            output += data
+        elif pending_keys:
+            os.write(fd, bytes([pending_keys.pop(0)]))
+    os.waitpid(pid, 0)
+
+    with os.fdopen(result_read, 'rb') as handle:
+        payload = handle.read()
+    return bytes(output), pickle.loads(payload) if payload else None
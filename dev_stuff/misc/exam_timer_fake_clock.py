@@ -0,0 +1,75 @@
+"""Check exam timer timeout and pause accounting with a fake clock (no real sleeps).
+
+Usage:
+    python dev_stuff/misc/exam_timer_fake_clock.py
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from exam_terminal.exam_timer import ExamTimer  # noqa: E402
+
+
+class FakeClock:
+    """Manually advanced clock for checking timer accounting without real sleeps.
+
+    Usage:
+        clock = FakeClock()
+        timer = ExamTimer(allowed_time=60, clock=clock)
+        timer.start(watcher=False)
+        clock.advance(30)
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        """Object constructor method.
+
+        Parameters:
+            start (float) : Initial clock time in seconds
+        """
+        self.now = start
+
+    def __call__(self) -> float:
+        """Current clock time in seconds."""
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward.
+
+        Parameters:
+            seconds (float) : Number of seconds to move forward
+        """
+        self.now += seconds
+
+
+if __name__ == '__main__':
+    clock = FakeClock()
+    timer = ExamTimer(allowed_time=60, clock=clock)
+    timer.start(watcher=False)
+
+    clock.advance(20)
+    assert timer.elapsed_time == 20
+
+    timer.pause()
+    clock.advance(100)
+    assert timer.elapsed_time == 20
+    assert timer.paused_elapsed_time == 100
+    assert not timer.is_time_out
+
+    timer.resume()
+    clock.advance(39)
+    assert timer.elapsed_time == 59
+    assert timer.remaining_time == 1
+    assert not timer.is_time_out
+
+    clock.advance(2)
+    assert timer.is_time_out
+    assert timer.elapsed_time == 60
+    assert timer.global_elapsed_time == 160
+
+    timer.stop()
+    clock.advance(1000)
+    assert timer.elapsed_time == 60
+
+    print('Exam timer fake clock checks passed')
@@ -0,0 +1,111 @@
+"""Check the remote exam HTTP cache against a local http.server stand-in.
+
+Usage:
+    python dev_stuff/misc/http_cache_local_server.py
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from exam_terminal import utility  # noqa: E402
+from exam_terminal.http_cache import HttpCache  # noqa: E402
+
+SAMPLE_EXAM = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..', 'exam_terminal', 'exams', 'sample_exam.yml')
+)
+with open(SAMPLE_EXAM, 'rb') as sample_file:
+    EXAM_CONTENT = sample_file.read()
+ETAG = '"' + hashlib.sha256(EXAM_CONTENT).hexdigest()[:16] + '"'
+requests_seen = []
+
+
+class ExamHandler(BaseHTTPRequestHandler):
+    """Serves the sample exam, with ETag revalidation"""
+
+    def log_message(self, *args):
+        pass
+
+    def send_exam_headers(self):
+        self.send_header('Content-Type', 'text/yaml')
+        self.send_header('Content-Length', str(len(EXAM_CONTENT)))
+        self.send_header('ETag', ETAG)
+        self.end_headers()
+
+    def do_HEAD(self):
+        requests_seen.append('HEAD')
+        self.send_response(200)
+        self.send_exam_headers()
+
+    def do_GET(self):
+        if self.path.endswith('chunked_exam.yml'):
+            # No Content-Length, streamed in chunks, endless unless the client stops reading
+            requests_seen.append('GET chunked')
+            self.protocol_version = 'HTTP/1.1'
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/yaml')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            try:
+                for _ in range(10000):
+                    chunk = b'# padding padding padding padding padding padding padding\n' * 100
+                    self.wfile.write(f'{len(chunk):x}\r\n'.encode() + chunk + b'\r\n')
+                self.wfile.write(b'0\r\n\r\n')
+            except (BrokenPipeError, ConnectionResetError):
+                requests_seen.append('client stopped reading')
+            return
+        if self.headers.get('If-None-Match') == ETAG:
+            requests_seen.append('GET 304')
+            self.send_response(304)
+            self.end_headers()
+            return
+        requests_seen.append('GET 200')
+        self.send_response(200)
+        self.send_exam_headers()
+        self.wfile.write(EXAM_CONTENT)
+
+
+if __name__ == '__main__':
+    server = ThreadingHTTPServer(('127.0.0.1', 0), ExamHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f'http://127.0.0.1:{server.server_address[1]}/sample_exam.yml'
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # First download
+        contents = utility.load_examfile_contents_from_url(url, cache=HttpCache(cache_dir, ttl=60))
+        assert contents['exam']['exam_title']
+        assert requests_seen == ['GET 200']
+        print(f'First launch      : {requests_seen}')
+
+        # Within TTL, no requests at all
+        requests_seen.clear()
+        assert utility.load_examfile_contents_from_url(url, cache=HttpCache(cache_dir, ttl=60)) == contents
+        assert requests_seen == []
+        print(f'Within TTL        : {requests_seen}')
+
+        # TTL expired, conditional GET answered with 304
+        assert utility.load_examfile_contents_from_url(url, cache=HttpCache(cache_dir, ttl=0)) == contents
+        assert requests_seen == ['GET 304']
+        print(f'TTL expired       : {requests_seen}')
+
+        # Chunked response without Content-Length, aborted at the size limit
+        requests_seen.clear()
+        chunked_url = url.replace('sample_exam.yml', 'chunked_exam.yml')
+        assert utility.load_examfile_contents_from_url(chunked_url, cache=HttpCache(cache_dir, ttl=0)) == {}
+        print(f'Too large, chunked: {requests_seen}')
+
+        # Offline, server is gone
+        server.shutdown()
+        requests_seen.clear()
+        assert (
+            utility.load_examfile_contents_from_url(url, cache=HttpCache(cache_dir, ttl=0, offline=True)) == contents
+        )
+        assert requests_seen == []
+        print(f'Offline           : {requests_seen}')
+
+    print('HTTP cache checks passed')
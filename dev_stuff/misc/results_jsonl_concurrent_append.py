@@ -0,0 +1,41 @@
+"""Check that many processes appending large exam results to one JSONL file never interleave lines.
+
+Usage:
+    python dev_stuff/misc/results_jsonl_concurrent_append.py [processes] [records_per_process]
+"""
+
+import json
+import os
+import sys
+import tempfile
+from multiprocessing import Pool
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from exam_terminal.result_export import append_jsonl  # noqa: E402
+
+PROCESSES = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+RECORDS = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+
+
+def append_records(arguments: tuple) -> None:
+    """Append records of about 200 KB each, far larger than a pipe buffer"""
+    file_path, writer = arguments
+    for r in range(RECORDS):
+        append_jsonl(file_path, {'writer': writer, 'record': r, 'padding': str(writer) * 200_000})
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, 'Exam_Results.jsonl')
+        with Pool(PROCESSES) as pool:
+            pool.map(append_records, [(file_path, writer) for writer in range(PROCESSES)])
+
+        seen = set()
+        with open(file_path) as file:
+            for line in file:
+                record = json.loads(line)
+                assert record['padding'] == str(record['writer']) * 200_000
+                seen.add((record['writer'], record['record']))
+        assert len(seen) == PROCESSES * RECORDS, len(seen)
+        print(f'OK: {len(seen)} records from {PROCESSES} processes, no interleaved lines')
@@ -1,14 +1,14 @@
 """Main file."""
 
 import logging
+import math
 import os
 import sys
-import textwrap
 import threading
+from concurrent.futures import Future, wait
 from datetime import datetime
-from statistics import mean, median, stdev
-from time import gmtime, strftime, time
-from typing import Union
+from time import monotonic, time
+from typing import Optional, Union
 
 try:
     import curses
@@ -19,9 +19,27 @@ except ImportError:
     click.secho('       This may be an issue with Python or your terminal.', fg='bright_red', bold=True)
     sys.exit(1)
 
-from fpdf import FPDF
-
-from exam_terminal import utility
+from exam_terminal import ui_loop, utility
+from exam_terminal.analytics import append_attempt_record
+from exam_terminal.answer_evaluation import AnswerSelection, indexes_to_mask
+from exam_terminal.exam_journal import TICK_INTERVAL, ExamJournal, is_journal_locked, load_journal, replay_journal
+from exam_terminal.exam_order import ExamOrder, OrderedQuestions
+from exam_terminal.exam_timer import ExamTimer
+from exam_terminal.grading import evaluate_score
+from exam_terminal.layout import LayoutCache
+from exam_terminal.question_bank import LazyQuestionBank, parse_question
+from exam_terminal.question_store import QuestionStore
+from exam_terminal.render import RetainedFrame
+from exam_terminal.result_export import (
+    RESULT_FORMATS,
+    assemble_exam_results,
+    export_results,
+    get_result_file_path,
+    get_result_record,
+    write_atomic,
+)
+from exam_terminal.scoring import DEFAULT_WEIGHT, ExamScoring
+from exam_terminal.screen_manager import ScreenManager
 
 logger = logging.getLogger()
 
@@ -29,52 +47,133 @@ logger = logging.getLogger()
 class ExamTerminal:
     """This class defines the exam terminal and its function."""
 
-    def __init__(self, exam_file_contents: dict, exam_attempt: int = 0) -> None:
+    def __init__(
+        self,
+        exam_file_contents: dict,
+        exam_attempt: int = 0,
+        screen: Optional[ScreenManager] = None,
+        attempts_file: Optional[str] = None,
+        results_format: str = RESULT_FORMATS[0],
+        journal_path: Optional[str] = None,
+        resume: bool = False,
+        seed: Optional[int] = None,
+    ) -> None:
         """Object constructor method.
 
         Parameters:
             exam_file_contents (dict): Pre-loaded exam contents
             exam_attempt (int)       : Current exam attempt
+            screen (ScreenManager)   : Open curses session to draw in. If None, each view opens its own
+            attempts_file (str)      : JSONL file to append a record of the exam attempt to, if any
+            results_format (str)     : Format to save exam results in, can be changed on the result screen
+            journal_path (str)       : Journal file to auto save exam progress to, if any
+            resume (bool)            : If True, continue the unfinished exam in the journal file
+            seed (int)               : Seed of the question draw and shuffles, None for a random one
         """
+        self.screen = screen
+        self.exam_attempt = exam_attempt
+        self.attempts_file = attempts_file
+        self.results_format = results_format
+
+        # Results PDF rendering in the background, started once the exam is evaluated
+        self.pdf_render: Optional[Future] = None
+        self.pdf_render_progress = (0, 0)  # Questions done, questions total
+
         # Defining all possible exam type descriptions
-        self.exam_types = {0: 'Multiple Choice, Single Answer', 1: 'Multiple Choice, Multiple Answers'}
+        self.exam_types = {
+            0: 'Multiple Choice, Single Answer',
+            1: 'Multiple Choice, Multiple Answers',
+            2: 'Multiple Choice',
+        }
 
         # Parse exam contents
         self.exam_contents = {}
         self.exam_contents = self.__parse_examfile_contents(exam_file_contents, exam_attempt)
 
+        # Answers and pauses are journaled as they happen, to resume the exam after a crash
+        self.journal_path = journal_path
+        self.journal: Optional[ExamJournal] = None
+        self.journal_tick_time = 0.0
+        self.resume_state = self.__load_resume_state() if journal_path and resume else None
+
+        # Questions drawn and shuffled for this attempt, a resumed exam is drawn again from its own seed.
+        # Lazily loaded questions are drawn when the exam begins, counting them all first would hold up the menu
+        self.seed = seed
+        self.exam_order: Optional[ExamOrder] = None
+        if not isinstance(self.exam_contents['questions'], LazyQuestionBank):
+            self.exam_order = self.__draw_questions(seed)
+
         self.color: dict = {}
         self.decor: dict = {}
 
-        self.halfdelay_screen_refresh = 5  # 10th of a second
+        # Milliseconds between terminal size checks while the terminal is too small
+        self.terminal_size_poll_time = 500
 
         self.height_limit = 27
         self.width_limit = 79
         self.terminal_size_good = True
 
-        self.questions_total = len(self.exam_contents['questions'])
+        # Wrapped text and positions, recomputed only when terminal width changes
+        self.layout = LayoutCache()
+
+        self.questions_total = self.exam_contents['exam']['exam_questions_count'] or 0
         self.questions_complete = 0
         self.questions_progress = 0.0
 
         self.questions_correct = 0
         self.questions_wrong = 0
 
+        # Score of the exam, updated as each answer comes in
+        self.scoring = self.__get_scoring()
+        self.exam_score = self.scoring.new_score()
+
         self.selection_indicator = '|'
         self.selection_index = 0
 
-        self.global_elapsed_time = 0.0
         self.exam_begin_time = 0.0
-        self.exam_elapsed_time = 0.0
-        self.is_exam_time_out = False
+        self.exam_timer = ExamTimer(self.exam_contents['exam']['exam_allowed_time'])
 
-        self.exam_paused = False
-        self.exam_paused_elapsed_time = 0
         self.exam_paused_count = 0
 
         self.exam_quit = 0
         self.exam_exit = False  # Straight exit entire program
 
-        self.is_timer_timing = False
+    ###############################################################################################
+
+    @property
+    def global_elapsed_time(self) -> float:
+        """Seconds since beginning of exam, including paused time."""
+        return self.exam_timer.global_elapsed_time
+
+    @property
+    def exam_elapsed_time(self) -> float:
+        """Seconds of exam time used, not counting paused time."""
+        return self.exam_timer.elapsed_time
+
+    @property
+    def exam_paused_elapsed_time(self) -> float:
+        """Seconds the exam has spent paused."""
+        return self.exam_timer.paused_elapsed_time
+
+    @property
+    def is_exam_time_out(self) -> bool:
+        """True if the exam allowed time is up."""
+        return self.exam_timer.is_time_out
+
+    @property
+    def exam_paused(self) -> bool:
+        """True if the exam is currently paused."""
+        return self.exam_timer.is_paused
+
+    @exam_paused.setter
+    def exam_paused(self, paused: bool) -> None:
+        if paused == self.exam_timer.is_paused:
+            return
+        if paused:
+            self.exam_timer.pause()
+        else:
+            self.exam_timer.resume()
+        self.__journal('pause' if paused else 'resume')
 
     ###############################################################################################
 
@@ -94,59 +193,40 @@ class ExamTerminal:
         if exam_attempt < 1:
             # FIXME: Should not have to use "exam_attempt" to make this work.
             logger.debug('Calculating exam_allwed_time ...')
-            exam_file_contents['exam']['exam_allowed_time'] = utility.to_seconds(
-                exam_file_contents['exam']['exam_allowed_time'], exam_file_contents['exam']['exam_allowed_time_units']
+            exam = exam_file_contents['exam']
+            # Compiled exam files already have it in seconds
+            exam['exam_allowed_time'] = exam.get('exam_allowed_seconds') or utility.to_seconds(
+                exam['exam_allowed_time'], exam['exam_allowed_time_units']
             )
 
         # Save the current exam attempt
         exam_file_contents['exam']['exam_attempt'] = exam_attempt
 
-        # Default exam type. If any questions are multiple answers, change type
-        exam_file_contents['exam']['exam_type'] = self.exam_types[0]
+        # Questions are drawn again from the whole exam file for each attempt
+        if isinstance(exam_file_contents['questions'], OrderedQuestions):
+            exam_file_contents['questions'] = exam_file_contents['questions'].pool
+        exam_file_contents['exam'].pop('exam_seed', None)
 
-        logger.debug(f'Loading {len(exam_file_contents["questions"])} questions ...')
-        # Loop through all the questions
-        for index, question in enumerate(exam_file_contents['questions']):
-            # Store the question number
-            question['question_number'] = index
-
-            # Create empty list for answer indexes
-            question['question_answer_indexes'] = []
-            question['question_answer_bool'] = []
-
-            # Looping over selection for each question
-            for i, s in enumerate(question['selection']):
-                # Check if a answer was passed with selection
-                if isinstance(s, dict):
-                    # Get the first key
-                    first_key = next(iter(s))
-
-                    # Save the correct answer
-                    if s[first_key]:
-                        # Is True (correct answer)
-                        question['question_answer_indexes'].append(i)
-                        question['question_answer_bool'].append(True)
-                    else:
-                        # Is True (incorrect answer)
-                        question['answer_bool'].append(False)
-
-                    # Just keep the key
-                    question['selection'][i] = first_key
+        # Questions of very large exam files are loaded and parsed only when reached
+        if isinstance(exam_file_contents['questions'], LazyQuestionBank):
+            exam_file_contents['exam']['exam_type'] = self.exam_types[2]
+            exam_file_contents['exam']['exam_questions_count'] = None
+            exam_file_contents['questions'].reset(parse_question=parse_question)
+            logger.debug('Questions will be parsed as they are reached')
+            return exam_file_contents
 
-                else:
-                    # No value, assumed False answer
-                    question['question_answer_bool'].append(False)
-
-            # Determine if it is a multi-selection question
-            question['question_multiselect'] = sum(question['question_answer_bool']) > 1
-            question['question_min_selection_count'] = sum(question['question_answer_bool'])
-
-            # Change exam type
-            if question['question_multiselect']:
-                exam_file_contents['exam']['exam_type'] = self.exam_types[1]
+        logger.debug(f'Loading {len(exam_file_contents["questions"])} questions ...')
+        # Questions are kept in a compact store, parsed once and reused by later exam attempts
+        if isinstance(exam_file_contents['questions'], QuestionStore):
+            exam_file_contents['questions'].reset()
+        else:
+            exam_file_contents['questions'] = QuestionStore(exam_file_contents['questions'])
+        questions = exam_file_contents['questions']
 
-            # Set answered status
-            question['answered'] = False
+        # Default exam type. If any questions are multiple answers, change type
+        exam_file_contents['exam']['exam_type'] = self.exam_types[0]
+        if any(questions.is_multiselect(index) for index in range(len(questions))):
+            exam_file_contents['exam']['exam_type'] = self.exam_types[1]
 
         # Get the total number of questions
         exam_file_contents['exam']['exam_questions_count'] = len(exam_file_contents['questions'])
@@ -155,13 +235,76 @@ class ExamTerminal:
 
         return exam_file_contents
 
-    def __basic_screen_setup(self, scr, halfdelay: bool) -> None:
+    def __draw_questions(self, seed: Optional[int]) -> Optional[ExamOrder]:
+        """Draw and shuffle the questions of this attempt, as set in the exam file.
+
+        Parameters:
+            seed (int) : Seed of the draw and shuffles, None for a random one. A resumed exam uses its own
+
+        Returns:
+            (ExamOrder) : Questions asked, None if the exam is asked as listed in the exam file
+        """
+        if self.resume_state and self.resume_state.get('seed') is not None:
+            seed = self.resume_state['seed']
+        exam_order = ExamOrder.from_exam_contents(self.exam_contents, seed)
+        if exam_order is None:
+            return None
+
+        exam = self.exam_contents['exam']
+        questions = self.exam_contents['questions']
+        exam['exam_seed'] = exam_order.seed
+        exam['exam_questions_count'] = len(exam_order)
+        if isinstance(questions, QuestionStore):
+            multiselect = any(questions.is_multiselect(index) for index in exam_order.question_indexes)
+            exam['exam_type'] = self.exam_types[1] if multiselect else self.exam_types[0]
+        self.exam_contents['questions'] = OrderedQuestions(questions, exam_order)
+        return exam_order
+
+    def __get_scoring(self) -> ExamScoring:
+        """Get the scoring settings of the exam, with the weight and section of each question.
+
+        Returns:
+            (ExamScoring) : Scoring settings, lazily loaded questions are added when they are reached
+        """
+        scoring = ExamScoring.from_exam_contents(self.exam_contents)
+        questions = self.exam_contents['questions']
+        indexes = range(len(questions)) if isinstance(questions, QuestionStore) else ()
+        if isinstance(questions, OrderedQuestions):
+            questions, indexes = questions.pool, questions.order.question_indexes
+        if isinstance(questions, QuestionStore):
+            for index in indexes:
+                weight = questions.weights[index]
+                scoring.add_question(DEFAULT_WEIGHT if math.isnan(weight) else weight, questions.sections[index])
+        return scoring
+
+    def __score_answer(self, index: int, question: dict) -> None:
+        """Add an answered question to the running exam score.
+
+        Parameters:
+            index (int)     : Question index
+            question (dict) : Answered question
+        """
+        if index == len(self.scoring):
+            self.scoring.add_question(
+                question.get('question_weight', DEFAULT_WEIGHT), question.get('question_section')
+            )
+        self.exam_score.add(
+            index,
+            indexes_to_mask(question.get('answered_indexes') or []),
+            indexes_to_mask(question['question_answer_indexes']),
+        )
+
+    def __basic_screen_setup(self, scr) -> None:
         """Set up basic configurations of the current curses terminal screen.
 
         Parameters:
             scr (obj)      : Handle for curses terminal screen handle
-            halfdely (bool): If True, refresh specified 1/10th of second, else refresh 25.5 seconds
         """
+        # Already set up once for the entire screen session
+        if self.screen:
+            self.color, self.decor = self.screen.color, self.screen.decor
+            return
+
         # Hiding the cursor
         curses.curs_set(0)
 
@@ -171,12 +314,6 @@ class ExamTerminal:
         # Turn off echo
         curses.noecho()
 
-        # Screen delay/block for 10th of a second
-        if halfdelay:
-            curses.halfdelay(self.halfdelay_screen_refresh)
-        else:
-            curses.halfdelay(255)
-
     def __check_terminal_size(self, scr) -> None:
         """Check if current terminal size is sufficient, if it is not, display warning.
 
@@ -195,12 +332,14 @@ class ExamTerminal:
 
         k = 0
         KEYS = utility.load_keys()
+        scr.timeout(self.terminal_size_poll_time)
         while not self.terminal_size_good:
             if k in KEYS['QUIT']:
                 self.exam_exit = True
                 break
 
-            # Re-evaluate the screen size
+            # Re-evaluate the screen size, resize signals are only handled between screen steps
+            ui_loop.update_terminal_size()
             term_height, term_width = scr.getmaxyx()
             self.terminal_size_good = term_height >= self.height_limit and term_width >= self.width_limit
 
@@ -221,6 +360,9 @@ class ExamTerminal:
             scr.refresh()
             k = scr.getch()
 
+        # Back to the non-blocking input of the screen loop
+        scr.nodelay(True)
+
     ###############################################################################################
 
     def __draw_selection_menu(self, scr, selections: list, start_y: int) -> None:
@@ -294,16 +436,14 @@ class ExamTerminal:
             successful (bool)  : True if no error, else False
         """
         # Setting up basic stuff for curses and load keys
-        self.__basic_screen_setup(scr, halfdelay=False)
+        self.__basic_screen_setup(scr)
         KEYS = utility.load_keys()
 
-        # User key input (ASCII)
-        k = 0
+        # Static screen regions are only redrawn when they change
+        frame = RetainedFrame()
 
-        # Main Loop
-        while True:
-            # Clearing the screen at each loop iteration before constructing the frame
-            scr.clear()
+        def step(k: int) -> Optional[tuple[str, bool]]:
+            """Handle one key press or timer tick, then draw the screen."""
 
             ########################################################################################
 
@@ -330,172 +470,178 @@ class ExamTerminal:
                 if not self.is_exam_time_out:
                     self.exam_quit += 1
 
+            elif k in KEYS['RESIZE']:
+                self.layout.invalidate()
+
             ########################################################################################
 
             term_height, term_width = scr.getmaxyx()
 
             ########################################################################################
 
-            # Check terminal size
-            self.__check_terminal_size(scr)
+            if frame.is_damaged(scr, self.selection_index, self.exam_quit, self.__questions_count_text()):
+                # Check terminal size
+                self.__check_terminal_size(scr)
 
-            # Drawing the screen border
-            utility.draw_screen_border(scr, self.color['grey-dark'])
+                # Drawing the screen border
+                utility.draw_screen_border(scr, self.color['grey-dark'])
 
-            # Show software name/title
-            scr.addstr(term_height - 2, 2, utility.load_software_name_version(), self.color['grey-dark'])
+                # Show software name/title
+                scr.addstr(term_height - 2, 2, utility.load_software_name_version(), self.color['grey-dark'])
 
-            ########################################################################################
+                ########################################################################################
 
-            wrapper_menu_item = textwrap.TextWrapper(width=term_width - 25)
+                start_y = 2
+                start_x = [5, 22]
 
-            start_y = 2
-            start_x = [5, 22]
-
-            # line = f"{self.exam_contents.get('exam', {}).get('exam_title')}"
-            line = str(
-                self.exam_contents.get('exam', {}).get('exam_title')
-                or self.exam_contents.get('exam', {}).get('title', 'N/A')
-            )
-            scr.addstr(start_y, utility.center_x(term_width, line), line, self.decor['bold'])
-            start_y += 1
+                # line = f"{self.exam_contents.get('exam', {}).get('exam_title')}"
+                line = str(
+                    self.exam_contents.get('exam', {}).get('exam_title')
+                    or self.exam_contents.get('exam', {}).get('title', 'N/A')
+                )
+                scr.addstr(start_y, utility.center_x(term_width, line), line, self.decor['bold'])
+                start_y += 1
 
-            # line = f"{self.exam_contents['exam']['exam_author']}"
-            line = str(
-                self.exam_contents.get('exam', {}).get('exam_author')
-                or self.exam_contents.get('exam', {}).get('author', 'N/A')
-            )
-            scr.addstr(start_y, utility.center_x(term_width, line), line, self.color['grey-light'])
-            start_y += 1
+                # line = f"{self.exam_contents['exam']['exam_author']}"
+                line = str(
+                    self.exam_contents.get('exam', {}).get('exam_author')
+                    or self.exam_contents.get('exam', {}).get('author', 'N/A')
+                )
+                scr.addstr(start_y, utility.center_x(term_width, line), line, self.color['grey-light'])
+                start_y += 1
 
-            # line = f"{self.exam_contents['exam']['exam_edit_date']}"
-            line = str(
-                self.exam_contents.get('exam', {}).get('exam_edit_date')
-                or self.exam_contents.get('exam', {}).get('edit_date', 'N/A')
-            )
-            scr.addstr(start_y, utility.center_x(term_width, line), line, self.color['grey-light'])
-            start_y += 3
+                # line = f"{self.exam_contents['exam']['exam_edit_date']}"
+                line = str(
+                    self.exam_contents.get('exam', {}).get('exam_edit_date')
+                    or self.exam_contents.get('exam', {}).get('edit_date', 'N/A')
+                )
+                scr.addstr(start_y, utility.center_x(term_width, line), line, self.color['grey-light'])
+                start_y += 3
 
-            # lines = ["Description:", f"{self.exam_contents['exam']['exam_description']}"]
-            description = str(
-                self.exam_contents.get('exam', {}).get('exam_description')
-                or self.exam_contents.get('exam', {}).get('description', 'N/A')
-            )
-            lines = ['Description:', description]
-            menu_item_wrap: Union[str, list[str]] = ' '
-            for x, line_text in zip(start_x, lines):
-                menu_item_wrap = wrapper_menu_item.wrap(text=line_text)
-                for line_index, line in enumerate(menu_item_wrap):
-                    scr.addstr(start_y + line_index - 1, x, line, self.color['default'])
-            start_y += len(menu_item_wrap)
-
-            # lines = ["Exam Type:", self.exam_contents['exam']['exam_type']]
-            exam_type = str(
-                self.exam_contents.get('exam', {}).get('exam_type')
-                or self.exam_contents.get('exam', {}).get('type', 'N/A')
-            )
-            lines = ['Exam Type:', exam_type]
-            for x, line in zip(start_x, lines):
-                scr.addstr(start_y, x, line, self.color['default'])
-            start_y += 2
-
-            # lines = ["Questions:", f"{self.exam_contents['exam']['exam_questions_count']}"]
-            question_count = str(
-                self.exam_contents.get('exam', {}).get('exam_questions_count')
-                or self.exam_contents.get('exam', {}).get('questions_count', 'N/A')
-            )
-            lines = ['Questions:', question_count]
-            for x, line in zip(start_x, lines):
-                scr.addstr(start_y, x, line, self.color['default'])
-            start_y += 2
-
-            allowed_time = self.exam_contents.get('exam', {}).get('exam_allowed_time') or self.exam_contents.get(
-                'exam', {}
-            ).get('allowed_time')
-            allowed_time_units = self.exam_contents.get('exam', {}).get(
-                'exam_allowed_time_units'
-            ) or self.exam_contents.get('exam', {}).get('allowed_time_units', 'N/A')
-            lines = ['Allowed Time:', f'{allowed_time} {allowed_time_units}']
-            for x, line in zip(start_x, lines):
-                scr.addstr(start_y, x, line, self.color['default'])
-            start_y += 2
-
-            # lines = ["Passing Score:", f"{self.exam_contents['exam']['exam_passing_score']} %"]
-            passing_score = str(
-                self.exam_contents.get('exam', {}).get('exam_passing_score')
-                or self.exam_contents.get('exam', {}).get('passing_score', 'N/A')
-            )
-            lines = ['Passing Score:', f'{passing_score} %']
-            for x, line in zip(start_x, lines):
-                scr.addstr(start_y, x, line, self.color['default'])
-            start_y += 2
+                # lines = ["Description:", f"{self.exam_contents['exam']['exam_description']}"]
+                description = str(
+                    self.exam_contents.get('exam', {}).get('exam_description')
+                    or self.exam_contents.get('exam', {}).get('description', 'N/A')
+                )
+                lines = ['Description:', description]
+                menu_item_wrap: Union[str, list[str]] = ' '
+                for x, line_text in zip(start_x, lines):
+                    menu_item_wrap = self.layout.wrap(line_text, term_width - 25)
+                    for line_index, line in enumerate(menu_item_wrap):
+                        scr.addstr(start_y + line_index - 1, x, line, self.color['default'])
+                start_y += len(menu_item_wrap)
+
+                # lines = ["Exam Type:", self.exam_contents['exam']['exam_type']]
+                exam_type = str(
+                    self.exam_contents.get('exam', {}).get('exam_type')
+                    or self.exam_contents.get('exam', {}).get('type', 'N/A')
+                )
+                lines = ['Exam Type:', exam_type]
+                for x, line in zip(start_x, lines):
+                    scr.addstr(start_y, x, line, self.color['default'])
+                start_y += 2
+
+                # lines = ["Questions:", f"{self.exam_contents['exam']['exam_questions_count']}"]
+                question_count = self.__questions_count_text()
+                lines = ['Questions:', question_count]
+                for x, line in zip(start_x, lines):
+                    scr.addstr(start_y, x, line, self.color['default'])
+                start_y += 2
+
+                allowed_time = self.exam_contents.get('exam', {}).get('exam_allowed_time') or self.exam_contents.get(
+                    'exam', {}
+                ).get('allowed_time')
+                allowed_time_units = self.exam_contents.get('exam', {}).get(
+                    'exam_allowed_time_units'
+                ) or self.exam_contents.get('exam', {}).get('allowed_time_units', 'N/A')
+                lines = ['Allowed Time:', f'{allowed_time} {allowed_time_units}']
+                for x, line in zip(start_x, lines):
+                    scr.addstr(start_y, x, line, self.color['default'])
+                start_y += 2
+
+                # lines = ["Passing Score:", f"{self.exam_contents['exam']['exam_passing_score']} %"]
+                passing_score = str(
+                    self.exam_contents.get('exam', {}).get('exam_passing_score')
+                    or self.exam_contents.get('exam', {}).get('passing_score', 'N/A')
+                )
+                lines = ['Passing Score:', f'{passing_score} %']
+                for x, line in zip(start_x, lines):
+                    scr.addstr(start_y, x, line, self.color['default'])
+                start_y += 2
 
-            ########################################################################################
+                ########################################################################################
 
-            selections = ['Begin Exam', 'Quit']
-            utility.draw_horizontal_seperator(scr, term_height - len(selections) - 4, self.color['grey-dark'])
-            start_y = term_height - len(selections) - 7
-            self.__draw_selection_menu(scr, selections, start_y)
+                selections = ['Resume Exam' if self.resume_state else 'Begin Exam', 'Quit']
+                utility.draw_horizontal_seperator(scr, term_height - len(selections) - 4, self.color['grey-dark'])
+                start_y = term_height - len(selections) - 7
+                self.__draw_selection_menu(scr, selections, start_y)
 
             ########################################################################################
 
-            # Refresh the screen
-            scr.refresh()
+            # Push only the changed parts of the frame to the terminal
+            frame.present(scr)
 
             ########################################################################################
 
             # Exam quit message box
             if self.exam_quit:
-                curses.halfdelay(255)
                 message_lines = ['Are you sure you want to quit?', 'To quit press "Q"', 'To return press "R"']
                 self.__draw_message_box(scr, message_lines)
                 # Quit Message confirmed (pressed twice)
                 if self.exam_quit > 1:
                     return 'quit', True
-            else:
-                curses.halfdelay(self.halfdelay_screen_refresh)
 
             # Straight exist software
             if self.exam_exit:
                 sys.exit(0)
 
-            ########################################################################################
+            return None
 
-            # Get User input
-            k = scr.getch()
+        # Redraws only when needed while lazily loaded questions are counted
+        return ui_loop.run_screen(scr, step, self.__menu_next_tick)
+
+    def __questions_count_text(self) -> str:
+        """Number of exam questions as text, showing indexing progress while questions are loading.
+
+        Returns:
+            (str) : Number of exam questions
+        """
+        questions = self.exam_contents.get('questions')
+        if isinstance(questions, LazyQuestionBank) and not questions.is_indexed:
+            return f'{questions.indexed_count} (Loading ...)'
+        if isinstance(questions, LazyQuestionBank):
+            return str(len(questions))
+        return str(
+            self.exam_contents.get('exam', {}).get('exam_questions_count')
+            or self.exam_contents.get('exam', {}).get('questions_count', 'N/A')
+        )
+
+    def __menu_next_tick(self) -> Optional[float]:
+        """Seconds until the main menu changes on its own, None if it does not.
+
+        Returns:
+            (float) : Seconds until the next redraw
+        """
+        questions = self.exam_contents.get('questions')
+        if isinstance(questions, LazyQuestionBank) and not questions.is_indexed:
+            return 0.5
+        return None
 
     def show_menu(self) -> tuple[str, bool]:
         """Curses wrapper function for drawing main menu on screen.
 
+        Draws within the open screen session if there is one.
+
         Returns:
             menu option (str)  : Selection menu option user selected (ie. quit)
             successful (bool)  : True if no error, else False
         """
+        if self.screen:
+            return self.screen.show(self.draw_menu)
         return curses.wrapper(self.draw_menu)
 
     ###############################################################################################
 
-    def __exam_timer_thread(self) -> None:
-        """Exam timer that keeps track of elapsed exam time and exam paused time.
-
-        Interactions to the main thread are via object properties.
-        """
-        logger.debug('Starting exam timer thread ...')
-        while self.is_timer_timing:
-            self.global_elapsed_time = time() - self.exam_begin_time
-            if not self.exam_paused:
-                # Elapsed exam time
-                self.exam_elapsed_time = self.global_elapsed_time - self.exam_paused_elapsed_time
-
-                # Check if exam time is up
-                if self.exam_elapsed_time > self.exam_contents['exam']['exam_allowed_time']:
-                    self.is_exam_time_out = True
-                    self.is_timer_timing = False
-            else:
-                # Time Spend paused
-                self.exam_paused_elapsed_time = self.global_elapsed_time - self.exam_elapsed_time
-        logger.debug('Exam timer thread ended')
-
     def draw_question(self, scr, question: dict) -> tuple[str, bool]:
         """Draw a the current quesition on the screen.
 
@@ -507,7 +653,7 @@ class ExamTerminal:
             successful (bool)  : True if no error, else False
         """
         # Setting up basic stuff for curses and load keys
-        self.__basic_screen_setup(scr, halfdelay=True)
+        self.__basic_screen_setup(scr)
         KEYS = utility.load_keys()
 
         # Layout variables
@@ -517,8 +663,7 @@ class ExamTerminal:
 
         # Selection / Answer Variables
         self.selection_index = 0
-        question['answered_indexes'] = []
-        question['answered_correct_bool'] = [False] * len(question['question_answer_bool'])
+        selection = AnswerSelection(indexes_to_mask(question['question_answer_indexes']))
 
         # Loading question specific allowed time
         question_timer = True
@@ -530,17 +675,22 @@ class ExamTerminal:
             logger.debug('Question allowed time not listed')
             question_timer = False
 
+        # Message of number of selections needed and allowed time for current question
+        message = []
+        if question['question_multiselect']:
+            message.append(f'Multiple Answers, Pick {question["question_min_selection_count"]}')
+        if question_timer:
+            message.append(f'Allowed Time: {question["question_allowed_time"]:3.1f} seconds')
+        question_info = '(' + ', '.join(message) + ')' if message else ''
+
         # Start the question timer
-        question_start_time = time()
-        question_elapsed_time = 0.00
+        question_start_time = monotonic()
 
-        # User key input (ASCII)
-        k = 0
+        # Static screen regions are only redrawn when they change
+        frame = RetainedFrame()
 
-        # Main Loop
-        while True:
-            # Clearing the screen at each loop iteration before constructing the frame
-            scr.clear()
+        def step(k: int) -> Optional[tuple[str, bool]]:
+            """Handle one key press or timer tick, then draw the screen."""
 
             ########################################################################################
 
@@ -558,29 +708,14 @@ class ExamTerminal:
                     return 'quit', False
 
                 elif not self.exam_paused:
-                    correct_all = False
-                    answer = ''
                     # Store or remove selection index
-                    if self.selection_index not in question['answered_indexes']:
-                        question['answered_indexes'].append(self.selection_index)
-                    else:
-                        index_to_remove = question['answered_indexes'].index(self.selection_index)
-                        question['answered_indexes'].pop(index_to_remove)
-                    logger.debug(f'Selected selection indexes: {question["answered_indexes"]}')
-
-                    # Determine correct or not correct
-                    question['answered_correct_bool'][self.selection_index] = (
-                        question['question_answer_bool'][self.selection_index]
-                        != question['answered_correct_bool'][self.selection_index]
-                    )
-                    correct_all = question['question_answer_bool'] == question['answered_correct_bool']
-
-                    answer = question['selection'][self.selection_index]
+                    selection.toggle(self.selection_index)
+                    logger.debug(f'Selected selection indexes: {selection.indexes}')
 
                     # Return the entered selections if all selections have been made
-                    if len(question['answered_indexes']) >= question['question_min_selection_count']:
+                    if selection.is_complete:
                         logging.debug('- Selection entered -')
-                        return answer, correct_all
+                        return question['selection'][self.selection_index], selection.is_correct
 
             elif k in KEYS['PAUSE']:
                 self.exam_paused = True
@@ -594,13 +729,8 @@ class ExamTerminal:
                 if not self.is_exam_time_out:
                     self.exam_quit += 1
 
-            ########################################################################################
-
-            # Check terminal size
-            self.__check_terminal_size(scr)
-
-            # Drawing the screen border
-            utility.draw_screen_border(scr, self.color['grey-dark'])
+            elif k in KEYS['RESIZE']:
+                self.layout.invalidate()
 
             ########################################################################################
 
@@ -610,86 +740,86 @@ class ExamTerminal:
 
             ########################################################################################
 
-            # Create text wrappers wrapping text over number of characters
-            term_height, term_width = scr.getmaxyx()
-            wrapper_question = textwrap.TextWrapper(width=term_width - 5)
-            wrapper_selection = textwrap.TextWrapper(width=term_width - 10)
-
-            # Wrap and show the question
-            question_wrap = wrapper_question.wrap(text=question['question'])
-            line_index = 0
-            for line_index, line in enumerate(question_wrap):
-                scr.addstr(start_y + line_index - 1, question_x, line, self.color['default'] | self.decor['bold'])
-
-            # Message of number of selections needed for current question
-            message = []
-            if question['question_multiselect']:
-                message.append(f'Multiple Answers, Pick {question["question_min_selection_count"]}')
-
-            # Message of allowed time for current question
-            if question_timer:
-                message.append(f'Allowed Time: {question["question_allowed_time"]:3.1f} seconds')
+            static_damaged = frame.is_damaged(
+                scr,
+                self.selection_index,
+                selection.selected_mask,
+                self.exam_paused,
+                self.exam_quit,
+                self.is_exam_time_out,
+            )
+            if static_damaged:
+                # Check terminal size
+                self.__check_terminal_size(scr)
+
+                # Drawing the screen border
+                utility.draw_screen_border(scr, self.color['grey-dark'])
+
+                ########################################################################################
+
+                # Wrapped and positioned question, computed once per terminal width
+                term_height, term_width = scr.getmaxyx()
+                question_layout = self.layout.question(question, term_width, question_info, start_y)
+
+                # Show the question
+                for line_index, line in enumerate(question_layout.question_lines):
+                    scr.addstr(
+                        question_layout.question_y + line_index,
+                        question_x,
+                        line,
+                        self.color['default'] | self.decor['bold'],
+                    )
 
-            # Construct the question message
-            if question['question_multiselect'] or question_timer:
-                color = self.color['grey-light']
-                scr.addstr(start_y + line_index, question_x, '(' + ', '.join(message) + ')', color)
-                line_offset = 1
-            else:
-                line_offset = 0
-
-            utility.draw_horizontal_seperator(scr, len(question_wrap) + 3 + line_offset, self.color['grey-dark'])
-
-            # Set the offset to the next line
-            selection_offset = len(question_wrap) + 3 + line_offset
-
-            # Wrap and show selection
-            for selection_index, selection in enumerate(question['selection']):
-                selection_wrap = wrapper_selection.wrap(text=selection)
-                for line_index, line in enumerate(selection_wrap):
-                    # Style selection and draw selector
-                    if selection_index == self.selection_index:
-                        color = self.color['default'] | self.decor['bold']
-                        # Draw the selection indicator
-                        scr.addstr(
-                            start_y + selection_offset + line_index - 1,
-                            selection_x - 2,
-                            self.selection_indicator,
-                            self.color['default'] | self.decor['bold'],
-                        )
-                    else:
-                        color = self.color['grey-light']
-
-                    # Style already selected indexes (for multi-select)
-                    if question['question_multiselect']:
-                        if selection_index in question['answered_indexes']:
-                            color = self.color['black-white']
-
-                    scr.addstr(start_y + selection_offset + line_index - 1, selection_x + 2, line, color)
-
-                # Set the offset to the next line
-                selection_offset += len(selection_wrap) + 1
+                # Show the question message
+                if question_info:
+                    scr.addstr(question_layout.info_y, question_x, question_info, self.color['grey-light'])
+
+                utility.draw_horizontal_seperator(scr, question_layout.separator_y, self.color['grey-dark'])
+
+                # Show selections
+                for selection_index, selection_wrap in enumerate(question_layout.selection_lines):
+                    for y, line in zip(question_layout.selection_rows[selection_index], selection_wrap):
+                        # Style selection and draw selector
+                        if selection_index == self.selection_index:
+                            color = self.color['default'] | self.decor['bold']
+                            # Draw the selection indicator
+                            scr.addstr(
+                                y,
+                                selection_x - 2,
+                                self.selection_indicator,
+                                self.color['default'] | self.decor['bold'],
+                            )
+                        else:
+                            color = self.color['grey-light']
+
+                        # Style already selected indexes (for multi-select)
+                        if question['question_multiselect']:
+                            if selection.is_selected(selection_index):
+                                color = self.color['black-white']
+
+                        scr.addstr(y, selection_x + 2, line, color)
 
             ########################################################################################
 
             # Getting the screen height and width
             term_height, term_width = scr.getmaxyx()
 
+            # Dynamic timer and progress lines are redrawn every frame
+            for y in range(term_height - 4, term_height - 1):
+                frame.erase_line(scr, y)
+
             if question_timer:
                 # Calculate current question time, and determine if timeout
-                question_elapsed_time = time() - question_start_time
+                question_elapsed_time = monotonic() - question_start_time
                 if question_elapsed_time > question['question_allowed_time']:
                     logging.debug('Question timout')
 
-                    # Determine correct or not correct at timeout
-                    question['answered_correct_bool'][self.selection_index] = (
-                        question['question_answer_bool'][self.selection_index]
-                        != question['answered_correct_bool'][self.selection_index]
-                    )
-                    correct_all = question['question_answer_bool'] == question['answered_correct_bool']
+                    # The highlighted selection counts as selected at timeout
+                    if not selection.is_selected(self.selection_index):
+                        selection.toggle(self.selection_index)
 
                     question['answered_timeout'] = True
-                    return 'timout', correct_all
+                    return 'timout', selection.is_correct
 
                 # Progress - Question Time
                 elapsed_dec = question_elapsed_time / question['question_allowed_time']
@@ -736,8 +866,14 @@ class ExamTerminal:
 
             ########################################################################################
 
-            # Refresh the main screen layout
-            scr.refresh()
+            # Push only the changed parts of the frame to the terminal
+            frame.present(scr)
+
+            ########################################################################################
+
+            # Keep the journaled exam time current
+            if monotonic() - self.journal_tick_time >= TICK_INTERVAL:
+                self.__journal('tick')
 
             ########################################################################################
 
@@ -748,7 +884,6 @@ class ExamTerminal:
 
             # Exam quit message box
             if self.exam_quit:
-                curses.halfdelay(255)
                 self.exam_paused = True
                 message_lines = [
                     'Are you sure you want to quit and evaluate exam?',
@@ -759,8 +894,6 @@ class ExamTerminal:
                 if self.exam_quit > 1:
                     # Quit Message confirmed (pressed twice)
                     return 'quit', False
-            else:
-                curses.halfdelay(self.halfdelay_screen_refresh)
 
             # Straight exist software
             if self.exam_exit:
@@ -771,14 +904,38 @@ class ExamTerminal:
                 message_lines = ['Exam time has expired', 'Press "ENTER" to evaluate exam']
                 self.__draw_message_box(scr, message_lines)
 
-            ########################################################################################
+            return None
 
-            # Get User input
-            k = scr.getch()
+        result = ui_loop.run_screen(scr, step, lambda: self.__question_next_tick(question_timer, question_start_time))
+        question['answered_indexes'] = selection.indexes
+        return result
+
+    def __question_next_tick(self, question_timer: bool, question_start_time: float) -> Optional[float]:
+        """Seconds until the question screen changes on its own: the shown exam or question time, or a timeout.
+
+        Parameters:
+            question_timer (bool)       : True if the question has an allowed time
+            question_start_time (float) : Monotonic clock time the question was shown
+
+        Returns:
+            (float) : Seconds until the next redraw, None if nothing changes until a key is pressed
+        """
+        ticks = []
+        if not self.exam_paused and not self.is_exam_time_out:
+            ticks.append(ui_loop.seconds_to_next_change(self.exam_elapsed_time))
+            ticks.append(self.exam_timer.remaining_time)
+        if question_timer:
+            question_elapsed_time = monotonic() - question_start_time
+            ticks.append(ui_loop.seconds_to_next_change(question_elapsed_time, 0.1))
+        if self.journal:
+            ticks.append(max(self.journal_tick_time + TICK_INTERVAL - monotonic(), 0.0))
+        return min(ticks, default=None)
 
     def show_question(self, question: dict) -> tuple[str, bool]:
         """Curses wrapper function for drawing single question on screen.
 
+        Draws within the open screen session if there is one.
+
         Parameters:
             question (dict) : The current question information being presented
 
@@ -786,6 +943,8 @@ class ExamTerminal:
             menu option (str)  : Selection menu option user selected (ie. quit)
             successfull (bool) : True if no error, else False
         """
+        if self.screen:
+            return self.screen.show(self.draw_question, question)
         return curses.wrapper(self.draw_question, question)
 
     ###############################################################################################
@@ -793,18 +952,63 @@ class ExamTerminal:
     def __evaluate_exam(self) -> None:
         """Evaluate the exam results."""
         logger.debug('Evaluating exam results ...')
-        questions_count = len(self.exam_contents['questions'])
+        self.scoring.questions_count = len(self.exam_contents['questions'])
+
+        # Get the score and the score label/text
+        self.exam_contents['exam'].update(
+            evaluate_score(
+                self.exam_score.points, self.scoring.max_points, self.exam_contents['exam']['exam_passing_score']
+            )
+        )
+        if not self.scoring.is_default:
+            self.exam_contents['exam']['exam_score'] = self.exam_score.get_summary()
 
-        # Get the score
-        self.exam_contents['exam']['evaluation_percent'] = (self.questions_correct / questions_count) * 100
+    def __answered_questions(self) -> list:
+        """Get all answered questions. Questions are answered in order, so unreached ones are not loaded.
 
-        # Get the score label/text
-        if self.exam_contents['exam']['evaluation_percent'] >= self.exam_contents['exam']['exam_passing_score']:
-            self.exam_contents['exam']['evaluation_label'] = 'PASSED'
-            self.exam_contents['exam']['evaluation_bool'] = True
-        else:
-            self.exam_contents['exam']['evaluation_label'] = 'FAILED'
-            self.exam_contents['exam']['evaluation_bool'] = False
+        Returns:
+            (list) : Question dicts of answered questions
+        """
+        return [
+            question for question in self.exam_contents['questions'][: self.questions_complete] if question['answered']
+        ]
+
+    def get_attempt_record(self) -> dict:
+        """Get the record of this exam attempt, for item analysis over many attempts.
+
+        Returns:
+            (dict) : Selected indexes, correctness and answer time of each question, and the exam result
+        """
+        answers: list = [None] * self.questions_total
+        correct = [False] * self.questions_total
+        answer_times: list = [None] * self.questions_total
+        for index, question in enumerate(self.exam_contents['questions'][: self.questions_complete]):
+            if not question['answered']:
+                continue
+            answers[index] = sorted(question['answered_indexes'])
+            correct[index] = bool(question['answered_correctly'])
+            answer_times[index] = round(question['answered_question_time'], 3)
+
+        exam = self.exam_contents['exam']
+        record = {
+            'id': exam['exam_attempt_id'],
+            'exam_title': exam['exam_title'],
+            'exam_attempt': self.exam_attempt,
+            'begin_timestamp': exam['exam_begin_timestamp'],
+            'end_timestamp': exam['exam_end_timestamp'],
+            'elapsed_time': round(self.exam_elapsed_time, 3),
+            'answers': answers,
+            'correct': correct,
+            'answer_times': answer_times,
+            'questions_correct': self.questions_correct,
+            'evaluation_percent': exam['evaluation_percent'],
+            'evaluation_bool': exam['evaluation_bool'],
+        }
+        if self.exam_order:
+            # Answers are in the order asked, each with the exam file index of its question
+            record['seed'] = self.exam_order.seed
+            record['question_indexes'] = list(self.exam_order.question_indexes)
+        return record
 
     def __assemble_exam_results(self) -> dict:
         """Evaluate the exam results for presentation.
@@ -812,157 +1016,26 @@ class ExamTerminal:
         Returns:
             results (dict) : Combined and formatted exam results for presentation
         """
-        results = {}
-        index = 0
-
-        results[index] = {
-            'label': 'Exam Title:',
-            'text': self.exam_contents['exam']['exam_title'],  # TODO: Wrap or truncate
-            'color': 'default',
-            'decor': 'bold',
-            'font_width': '',
-            'skip_lines': 1,
-        }
-        index += 1
-
-        results[index] = {
-            'label': 'Result:',
-            'text': self.exam_contents['exam']['evaluation_label'],
-            'color': 'blue',
-            'decor': 'bold',
-            'font_width': '',
-            'skip_lines': 2,
-        }
-        index += 1
-
-        results[index] = {
-            'label': 'Correct:',
-            'text': f'{self.exam_contents["exam"]["evaluation_percent"]:3.1f}% ({self.questions_correct} of {self.exam_contents["exam"]["exam_questions_count"]}) (Needed: {self.exam_contents["exam"]["exam_passing_score"]}%)',
-            'color': 'default',
-            'decor': 'normal',
-            'font_width': '',
-            'skip_lines': 1,
-        }
-        index += 1
-
-        results[index] = {
-            'label': 'Questions Answered:',
-            'text': f'{self.exam_contents["exam"]["exam_questions_answered"]} of {self.exam_contents["exam"]["exam_questions_count"]}',
-            'color': 'default',
-            'decor': 'normal',
-            'font_width': '',
-            'skip_lines': 1,
-        }
-        index += 1
-
-        results[index] = {
-            'label': 'Exam Complete Time:',
-            'text': f'{strftime("%H:%M:%S", gmtime(self.exam_elapsed_time))}',
-            'color': 'default',
-            'decor': 'normal',
-            'font_width': '',
-            'skip_lines': 1,
-        }
-        index += 1
-
-        results[index] = {
-            'label': 'Exam Time Range:',
-            'text': f'{self.exam_contents["exam"]["exam_begin_datestring"]} -> {self.exam_contents["exam"]["exam_end_datestring"]}',
-            'color': 'default',
-            'decor': 'normal',
-            'font_width': '',
-            'skip_lines': 2,
-        }
-        index += 1
-
-        results[index] = {
-            'label': 'Number of Times Paused:',
-            'text': str(self.exam_paused_count),
-            'color': 'default',
-            'decor': 'normal',
-            'font_width': '',
-            'skip_lines': 1,
-        }
-        index += 1
-
-        results[index] = {
-            'label': 'Elapsed Paused Time:',
-            'text': f'{strftime("%H:%M:%S", gmtime(self.exam_paused_elapsed_time))}',
-            'color': 'default',
-            'decor': 'normal',
-            'font_width': '',
-            'skip_lines': 1,
-        }
-        index += 1
-
-        width = 33
-        answer_distribution = ['.'] * width
-        for question in self.exam_contents['questions']:
-            if question['answered']:
-                answer_distribution[int((question['answered_exam_time'] / self.exam_elapsed_time) * width) - 1] = 'x'
-        results[index] = {
-            'label': 'Answers Over Exam Time:',
-            'text': f'[ 0.0s ]{"".join(answer_distribution)}[ {self.exam_elapsed_time:.1f}s ]',
-            'color': 'default',
-            'decor': 'normal',
-            'font_width': 'fixed',
-            'skip_lines': 1,
-        }
-        index += 1
-
-        answer_times = []
-        for question in self.exam_contents['questions']:
-            if question['answered']:
-                answer_times.append(question['answered_question_time'])
-        if answer_times:
-            end_time = max(answer_times) * 1.25
-        else:
-            end_time = 1
-        width = 33
-        answer_distribution = ['.'] * width
-        for answer_time in answer_times:
-            answer_distribution[int((answer_time / end_time) * width) - 1] = 'x'
-        results[index] = {
-            'label': 'Answer Times:',
-            'text': f'[ 0.0s ]{"".join(answer_distribution)}[ {end_time:.1f}s ]',
-            'color': 'default',
-            'decor': 'normal',
-            'font_width': 'fixed',
-            'skip_lines': 1,
-        }
-        index += 1
+        return assemble_exam_results(self.exam_contents['exam'], self.__answered_questions())
 
-        if len(answer_times) > 1:
-            times_mean = mean(answer_times)
-            times_std = stdev(answer_times)
-            times_median = median(answer_times)
+    def __layout_exam_results(self, term_width: int) -> list:
+        """Assemble and truncate the exam results to fit the terminal width.
 
-        else:
-            times_mean = 0
-            times_std = 0
-            times_median = 0
-
-        results[index] = {
-            'label': 'Average Time Per Answer:',
-            'text': f'{times_mean:.1f} +/- {times_std:.2f} seconds',
-            'color': 'default',
-            'decor': 'normal',
-            'font_width': '',
-            'skip_lines': 1,
-        }
-        index += 1
-
-        results[index] = {
-            'label': 'Median Time Per Answer:',
-            'text': f'{times_median:.1f} seconds',
-            'color': 'default',
-            'decor': 'normal',
-            'font_width': '',
-            'skip_lines': 1,
-        }
-        index += 1
+        Parameters:
+            term_width (int) : Number of columns in terminal
 
-        return results
+        Returns:
+            results (list) : Label, truncated text, text style, and lines to skip for each result item
+        """
+        return [
+            (
+                item['label'],
+                utility.truncate_text(item['text'], term_width - 32),
+                self.color[item['color']] | self.decor[item['decor']],
+                item['skip_lines'],
+            )
+            for item in self.__assemble_exam_results().values()
+        ]
 
     def draw_result(self, scr) -> tuple[str, bool]:
         """Draw a results on the screen
@@ -975,23 +1048,28 @@ class ExamTerminal:
             successful (bool)  : True if no error, else False
         """
         # Setting up basic stuff for curses and load keys
-        self.__basic_screen_setup(scr, halfdelay=False)
+        self.__basic_screen_setup(scr)
         KEYS = utility.load_keys()
 
         self.selection_index = 0
 
-        # User key input (ASCII)
-        k = 0
+        # Static screen regions are only redrawn when they change
+        frame = RetainedFrame()
 
-        # Main Loop
-        while True:
-            # Clearing the screen at each loop iteration before constructing the frame
-            scr.clear()
+        def step(k: int) -> Optional[tuple[str, bool]]:
+            """Handle one key press or timer tick, then draw the screen."""
 
             ########################################################################################
 
             # Check user keyboard input
-            if k in KEYS['DOWN'] or k in KEYS['RIGHT']:
+            if k in KEYS['FORMAT']:
+                # Change the result file format
+                if not self.exam_quit:
+                    self.results_format = RESULT_FORMATS[
+                        (RESULT_FORMATS.index(self.results_format) + 1) % len(RESULT_FORMATS)
+                    ]
+
+            elif k in KEYS['DOWN'] or k in KEYS['RIGHT']:
                 if not self.exam_quit:
                     self.selection_index += 1
 
@@ -1001,7 +1079,9 @@ class ExamTerminal:
 
             elif k in KEYS['ENTER']:
                 if self.selection_index == 0:
-                    # Save result PDF
+                    # Save result file, the PDF may still be rendering in the background
+                    if self.results_format == 'pdf':
+                        self.__wait_for_pdf_render(scr)
                     return 'save', True
                 elif self.selection_index == 1:
                     # Return to main menu
@@ -1016,182 +1096,172 @@ class ExamTerminal:
             elif k in KEYS['QUIT']:
                 self.exam_quit += 1
 
+            elif k in KEYS['RESIZE']:
+                self.layout.invalidate()
+
             ########################################################################################
 
             term_height, term_width = scr.getmaxyx()
 
             ########################################################################################
 
-            # Check terminal size
-            self.__check_terminal_size(scr)
+            if frame.is_damaged(scr, self.selection_index, self.exam_quit, self.results_format):
+                # Check terminal size
+                self.__check_terminal_size(scr)
 
-            # Drawing the screen border
-            utility.draw_screen_border(scr, self.color['grey-dark'])
+                # Drawing the screen border
+                utility.draw_screen_border(scr, self.color['grey-dark'])
 
-            # Show software name/title
-            scr.addstr(term_height - 2, 2, utility.load_software_name_version(), self.color['grey-dark'])
+                # Show software name/title
+                scr.addstr(term_height - 2, 2, utility.load_software_name_version(), self.color['grey-dark'])
 
-            ########################################################################################
+                ########################################################################################
 
-            start_y = 2
+                start_y = 2
 
-            # Heading
-            line = 'Exam Result Summary'
-            scr.addstr(start_y, utility.center_x(term_width, line), line, self.decor['bold'])
-            start_y += 2
+                # Heading
+                line = 'Exam Result Summary'
+                scr.addstr(start_y, utility.center_x(term_width, line), line, self.decor['bold'])
+                start_y += 2
 
-            utility.draw_horizontal_seperator(scr, start_y, self.color['grey-dark'])
-            start_y += 2
+                utility.draw_horizontal_seperator(scr, start_y, self.color['grey-dark'])
+                start_y += 2
 
-            # Draw items
-            start_x = [4, 30]
-            results = self.__assemble_exam_results()
-            for _, item in results.items():
-                scr.addstr(start_y, start_x[0], item['label'], self.color['default'])
-                scr.addstr(
-                    start_y,
-                    start_x[1],
-                    utility.truncate_text(item['text'], term_width - 32),
-                    self.color[item['color']] | self.decor[item['decor']],
-                )
-                start_y += item['skip_lines']
+                # Draw items
+                start_x = [4, 30]
+                results = self.layout.get(('results', term_width), lambda: self.__layout_exam_results(term_width))
+                for label, text, text_style, skip_lines in results:
+                    scr.addstr(start_y, start_x[0], label, self.color['default'])
+                    scr.addstr(start_y, start_x[1], text, text_style)
+                    start_y += skip_lines
 
-            ########################################################################################
+                ########################################################################################
 
-            selections = ['Save Result PDF and Quit', 'Main Menu', 'Quit']  # TODO: "Review Question"
-            utility.draw_horizontal_seperator(scr, term_height - len(selections) - 4, self.color['grey-dark'])
-            start_y = term_height - len(selections) - 7
-            self.__draw_selection_menu(scr, selections, start_y)
+                # Result file format is changed with "F", padded so the line length stays the same
+                selections = [
+                    f'Save Result [F: {self.results_format.upper():^5}] and Quit',
+                    'Main Menu',
+                    'Quit',
+                ]  # TODO: "Review Question"
+                utility.draw_horizontal_seperator(scr, term_height - len(selections) - 4, self.color['grey-dark'])
+                start_y = term_height - len(selections) - 7
+                self.__draw_selection_menu(scr, selections, start_y)
 
             ########################################################################################
 
-            # Refresh the screen
-            scr.refresh()
+            # Push only the changed parts of the frame to the terminal
+            frame.present(scr)
 
             ########################################################################################
 
             # Exam quit message box
             if self.exam_quit:
-                curses.halfdelay(255)
                 message_lines = ['Are you sure you want to quit?', 'To quit press "Q"', 'To return press "R"']
                 self.__draw_message_box(scr, message_lines)
                 # Quit Message confirmed (pressed twice)
                 if self.exam_quit > 1:
                     return 'quit', True
-            else:
-                curses.halfdelay(self.halfdelay_screen_refresh)
 
             # Straight exist software
             if self.exam_exit:
                 sys.exit(0)
 
-            ########################################################################################
+            return None
 
-            # Get User input
-            k = scr.getch()
+        return ui_loop.run_screen(scr, step)
 
     def show_result(self) -> tuple[str, bool]:
         """Curses wrapper function for drawing the results on screen.
 
+        Draws within the open screen session if there is one.
+
         Returns:
             menu option (str)  : Selection menu option user selected (ie. quit)
             successful (bool)  : True if no error, else False
         """
+        if self.screen:
+            return self.screen.show(self.draw_result)
         return curses.wrapper(self.draw_result)
 
-    def export_results_to_pdf(self) -> bool:
-        """Export all results to a PDF document.
+    def __exported_questions(self) -> list:
+        """Get the questions to include in exported results.
+
+        Lazily loaded questions are only included up to the last answered one.
+
+        Returns:
+            (list) : Question dicts
+        """
+        if isinstance(self.exam_contents['questions'], LazyQuestionBank):
+            return self.exam_contents['questions'][: self.questions_complete]
+        return list(self.exam_contents['questions'])
+
+    def export_results(self) -> bool:
+        """Export all results in the selected result format.
 
         Returns:
             successful (bool)  : True if no error, else False
         """
-        page_width = 210
-        page_height = 297
-
-        page_left_margin = 10
-        page_right_margin = 10
-        # page_top_margin = 10
-        page_bottom_margin = 20
-
-        page_x_area = page_width - page_left_margin - page_right_margin
-        # page_y_area = page_height - page_top_margin - page_bottom_margin
-
-        # Setup Page
-        pdf = FPDF(orientation='P', unit='mm', format='A4')
-        pdf.set_author('Author Test Terminal')
-        pdf.set_creator('Creator Test Terminal')
-        pdf.set_subject('Exam Results')
-        pdf.add_page(orientation='P', format='A4', same=False)
-        pdf.set_left_margin(margin=10)
-        pdf.set_right_margin(margin=10)
-        pdf.set_top_margin(margin=10)
-        pdf.set_font('Helvetica', 'B', 18)  # Italics I, underline U
-        # pdf.alias_nb_pages()
-
-        # Draw border
-        pdf.line(10, 10, 200, 10)
-        pdf.line(10, 277, 200, 277)
-        pdf.line(10, 10, 10, 277)
-        pdf.line(200, 10, 200, 277)
-
-        # Set the color depending on exam result label
-        if self.exam_contents['exam']['evaluation_bool']:
-            pdf.set_fill_color(r=220, g=255, b=220)
-        else:
-            pdf.set_fill_color(r=255, g=220, b=220)
-
-        # Add Title
-        pdf.set_text_color(*[0, 0, 0])
-        pdf.cell(w=page_x_area, h=20, txt='Exam Results', border=1, align='C', fill=1)
-
-        # Add result label
-        pdf.set_font('Helvetica', '', 24)
-        pdf.set_xy(x=page_width - page_right_margin - 70, y=page_height - page_bottom_margin - 40)
-        pdf.cell(w=60, h=30, txt=self.exam_contents['exam']['evaluation_label'], border=1, align='C', fill=1)
-
-        # Add Content
-        results = self.__assemble_exam_results()
-        pdf.set_text_color(*[0, 0, 0])
-        start_x = [20, 77]
-        start_y = 40
-        line_height = 8
-        for _, item in results.items():
-            pdf.set_font('Helvetica', 'B', 11)
-            pdf.set_xy(x=start_x[0], y=start_y)
-            pdf.cell(w=60, h=line_height, txt=item['label'], border=0, align='L')
-
-            if item['font_width'] == 'fixed':
-                pdf.set_font('Courier', '', 11)
-            else:
-                pdf.set_font('Helvetica', '', 11)
-            pdf.set_xy(x=start_x[1], y=start_y)
-            pdf.cell(
-                w=60,
-                h=line_height,
-                txt=utility.truncate_text(item['text'], self.width_limit - 25),
-                border=0,
-                align='L',
-            )
+        if self.results_format == 'pdf':
+            return self.export_results_to_pdf()
+        return export_results(self.exam_contents, self.__exported_questions(), self.results_format) is not None
 
-            start_y += item['skip_lines'] * 8
+    def start_pdf_render(self) -> Future:
+        """Start rendering the results PDF in a background thread, unless already started.
 
-        # Add divider lines
-        # pdf.line(page_width // 4, 60, 3*page_width // 4, 60)
-        # pdf.line(page_width // 4, 100, 3*page_width // 4, 100)
+        Returns:
+            (Future) : Resolves to the PDF document bytes
+        """
+        if self.pdf_render is None:
+            pdf_render = self.pdf_render = Future()
+            pdf_render.set_running_or_notify_cancel()
 
-        # Add the software watermark thingy
-        pdf.set_text_color(*[100, 100, 100])
-        pdf.set_font('Helvetica', 'I', 8)
-        pdf.set_xy(x=page_left_margin + 3, y=page_height - page_bottom_margin - 8)
-        pdf.cell(w=0, h=5, txt=f'Created with {utility.load_software_name_version()}', border=0, align='L')
+            # Rendered from a copy of the results, a next exam attempt resets the questions while rendering
+            record = get_result_record(self.exam_contents, self.__exported_questions())
 
-        # Export the pdf to file
-        datetime_text = datetime.fromtimestamp(self.exam_contents['exam']['exam_end_timestamp']).strftime(
-            '[%m-%d][%H-%M]'
-        )
-        pdf_filepath = os.path.abspath(os.path.join('.', f'{datetime_text}_Exam_Result_Summary.pdf'))
+            def render() -> None:
+                try:
+                    pdf_render.set_result(self.__render_record_pdf(record))
+                except Exception as e:
+                    pdf_render.set_exception(e)
+
+            # Daemon thread, quitting without saving does not wait for it
+            threading.Thread(target=render, daemon=True).start()
+        return self.pdf_render
+
+    def __wait_for_pdf_render(self, scr) -> None:
+        """Wait for the background PDF render to finish, showing progress in a message box.
+
+        Parameters:
+            scr (obj) : Handle for curses terminal screen handle
+        """
+        pdf_render = self.start_pdf_render()
+        begin_time = monotonic()
+        spinner = '|/-\\'
+        tick = 0
+        while not pdf_render.done():
+            done, total = self.pdf_render_progress
+            message_lines = [
+                'Saving result PDF ...',
+                f'Question {done} of {total}' if total else '',
+                f'{spinner[tick % len(spinner)]} {monotonic() - begin_time:.1f}s',
+            ]
+            self.__draw_message_box(scr, message_lines)
+            scr.refresh()
+            tick += 1
+            # Not Future.exception(timeout), its TimeoutError is only the builtin one from Python 3.11
+            wait([pdf_render], timeout=0.1)
+
+    def export_results_to_pdf(self) -> bool:
+        """Export all results to a PDF document.
+
+        Uses the PDF rendered in the background if it was started.
+
+        Returns:
+            successful (bool)  : True if no error, else False
+        """
+        pdf_filepath = get_result_file_path(self.exam_contents, 'pdf')
         try:
-            pdf.output(name=pdf_filepath, dest='F')
+            write_atomic(pdf_filepath, self.start_pdf_render().result())
             logger.debug(f'Successfully saved exam results PDF: {pdf_filepath}')
         except Exception as e:
             logger.error(f'Failed to save exam results PDF document to "{pdf_filepath}". Exception: {e}')
@@ -1199,6 +1269,138 @@ class ExamTerminal:
 
         return True
 
+    def render_results_pdf(self) -> bytes:
+        """Render all results into a PDF report: a summary page, then a breakdown of each question.
+
+        The document creation date is the exam end time, so the same results
+        always render to the same bytes.
+
+        Returns:
+            (bytes) : PDF document
+        """
+        return self.__render_record_pdf(get_result_record(self.exam_contents, self.__exported_questions()))
+
+    def __render_record_pdf(self, record: dict) -> bytes:
+        """Render the PDF report of an exam result record, reporting progress to the result screen.
+
+        Parameters:
+            record (dict) : Exam result record, from get_result_record()
+
+        Returns:
+            (bytes) : PDF document
+        """
+        # Only needed when exporting, slow to import
+        from exam_terminal.pdf_report import render_results_report
+
+        def progress(done: int, total: int) -> None:
+            self.pdf_render_progress = (done, total)
+
+        questions = record['questions']
+        results = assemble_exam_results(
+            record['exam'], [question for question in questions if question.get('answered')]
+        )
+        return render_results_report(
+            record['exam'],
+            list(results.values()),
+            questions,
+            utility.load_software_name_version(),
+            self.width_limit - 25,
+            progress,
+        )
+
+    ###############################################################################################
+
+    def __load_resume_state(self) -> Optional[dict]:
+        """Load the progress of an unfinished exam from the journal file.
+
+        Returns:
+            (dict) : Exam state to resume from, None if there is nothing to resume
+        """
+        if is_journal_locked(self.journal_path):
+            logger.warning(f'Journal is in use by another exam session, not resuming: {self.journal_path}')
+            return None
+        resume_state = replay_journal(load_journal(self.journal_path))
+        if resume_state is None:
+            logger.info(f'No unfinished exam to resume in journal: {self.journal_path}')
+            return None
+        if resume_state['exam_title'] != self.exam_contents['exam'].get('exam_title'):
+            logger.warning(f'Journal is of another exam, not resuming: {self.journal_path}')
+            return None
+        logger.debug(f'Resuming exam with {len(resume_state["answers"])} answered questions')
+        return resume_state
+
+    def __restore_progress(self, resume_state: dict) -> None:
+        """Restore answered questions and counters from a replayed journal.
+
+        Parameters:
+            resume_state (dict) : Exam state from the journal
+        """
+        self.exam_begin_time = resume_state['begin_timestamp']
+        self.exam_attempt = resume_state['exam_attempt']
+        self.exam_paused_count = resume_state['paused_count']
+        self.exam_timer.paused_count = resume_state['paused_count']
+
+        questions = self.exam_contents['questions']
+        for answer in resume_state['answers']:
+            question = questions[answer['question']]
+            question['answered_indexes'] = list(answer['answered_indexes'])
+            question['answered_timeout'] = answer['timeout']
+            question['question_presented_timestamp'] = answer['time'] - answer['question_time']
+            question['answered'] = True
+            question['answered_timestamp'] = answer['time']
+            question['answered_exam_time'] = answer['exam_time']
+            question['answered_question_time'] = answer['question_time']
+            question['answered_correctly'] = answer['correct']
+            self.__score_answer(answer['question'], question)
+
+            self.questions_complete += 1
+            if answer['correct']:
+                self.questions_correct += 1
+            else:
+                self.questions_wrong += 1
+        self.questions_progress = self.questions_complete / self.questions_total
+
+    def __open_journal(self, resume_state: Optional[dict]) -> None:
+        """Start a new exam journal, or continue the journal of the resumed exam.
+
+        Parameters:
+            resume_state (dict) : Exam state from the journal, None for a new exam
+        """
+        try:
+            self.journal = ExamJournal(self.journal_path, truncate=resume_state is None)
+        except OSError as e:
+            logger.error(
+                f'Failed to open exam journal "{self.journal_path}", progress is not auto saved. Exception: {e}'
+            )
+            return
+        logger.debug(f'Journaling exam progress to: {self.journal_path}')
+
+        if resume_state is None:
+            self.__journal(
+                'begin',
+                exam_title=self.exam_contents['exam'].get('exam_title'),
+                questions_count=self.questions_total,
+                exam_attempt=self.exam_attempt,
+                begin_timestamp=self.exam_begin_time,
+                seed=self.exam_order.seed if self.exam_order else None,
+            )
+        else:
+            self.__journal('reopen')
+
+    def __journal(self, event: str, **fields) -> None:
+        """Append an event with the current exam time to the exam journal, if there is one.
+
+        Parameters:
+            event (str) : Event name (ie. answer, pause, resume)
+            fields      : Event details
+        """
+        if self.journal is None:
+            return
+        self.journal_tick_time = monotonic()
+        self.journal.append(
+            event, exam_time=self.exam_timer.elapsed_time, paused_time=self.exam_timer.paused_elapsed_time, **fields
+        )
+
     ###############################################################################################
 
     def begin_exam(self) -> None:
@@ -1206,43 +1408,91 @@ class ExamTerminal:
         logger.debug('Beginning Exam ...')
         self.exam_begin_time = time()
 
-        # Start the independent timer thread for entire exam
-        self.is_timer_timing = True
-        exam_timer_thread = threading.Thread(target=self.__exam_timer_thread, args=())
-        exam_timer_thread.daemon = True
-        exam_timer_thread.start()
+        # Lazily loaded questions may only now be all counted, and drawn
+        if isinstance(self.exam_contents['questions'], LazyQuestionBank):
+            self.exam_order = self.__draw_questions(self.seed)
+        self.questions_total = len(self.exam_contents['questions'])
+        self.exam_contents['exam']['exam_questions_count'] = self.questions_total
+
+        # Layouts of an earlier attempt (ie. its results, or differently ordered selections) are not used again
+        self.layout.invalidate()
+
+        # Pick up an interrupted exam where it was left off
+        resume_state, self.resume_state = self.resume_state, None
+        if resume_state and resume_state['questions_count'] != self.questions_total:
+            logger.warning('Exam questions changed since the journal was written, not resuming')
+            resume_state = None
+        if resume_state:
+            self.__restore_progress(resume_state)
+
+        # Start the exam timer, wakes up only at the exam deadline
+        if resume_state:
+            self.exam_timer.start(elapsed_time=resume_state['exam_time'], paused_time=resume_state['paused_time'])
+        else:
+            self.exam_timer.start()
 
-        # Looping over all listed questions
-        for q, question in enumerate(self.exam_contents['questions']):
-            logging.debug(f'Showing question number {q + 1}')
+        if self.journal_path:
+            self.__open_journal(resume_state)
 
-            # Start timer for current question
-            question_elapsed_time = time()
-            self.exam_contents['questions'][q]['question_presented_timestamp'] = question_elapsed_time
+        try:
+            # Looping over all listed questions
+            for q, question in enumerate(self.exam_contents['questions']):
+                # Answered before the exam was interrupted
+                if q < self.questions_complete:
+                    continue
 
-            # Show the question
-            answer, correct = self.show_question(question)
+                logging.debug(f'Showing question number {q + 1}')
 
-            # Exam quit
-            if answer == 'quit':
-                break
+                # Start timer for current question
+                question_elapsed_time = time()
+                self.exam_contents['questions'][q]['question_presented_timestamp'] = question_elapsed_time
 
-            # Log answer metadata
-            self.exam_contents['questions'][q]['answered'] = True
-            self.exam_contents['questions'][q]['answered_timestamp'] = time()
-            self.exam_contents['questions'][q]['answered_exam_time'] = self.exam_elapsed_time
-            self.exam_contents['questions'][q]['answered_question_time'] = time() - question_elapsed_time
-            self.exam_contents['questions'][q]['answered_correctly'] = correct
+                # Show the question
+                answer, correct = self.show_question(
+                    self.exam_order.present(q, question) if self.exam_order else question
+                )
 
-            # Increment completed question and correct or wrong answer
-            self.questions_complete += 1
-            if correct:
-                self.questions_correct += 1
-            else:
-                self.questions_wrong += 1
+                # Exam quit
+                if answer == 'quit':
+                    break
+
+                # Log answer metadata
+                self.exam_contents['questions'][q]['answered'] = True
+                self.exam_contents['questions'][q]['answered_timestamp'] = time()
+                self.exam_contents['questions'][q]['answered_exam_time'] = self.exam_elapsed_time
+                self.exam_contents['questions'][q]['answered_question_time'] = time() - question_elapsed_time
+                self.exam_contents['questions'][q]['answered_correctly'] = correct
+                self.__score_answer(q, question)
+
+                self.__journal(
+                    'answer',
+                    question=q,
+                    answered_indexes=list(question.get('answered_indexes') or []),
+                    correct=bool(correct),
+                    timeout=bool(question.get('answered_timeout')),
+                    question_time=question['answered_question_time'],
+                )
+
+                # Increment completed question and correct or wrong answer
+                self.questions_complete += 1
+                if correct:
+                    self.questions_correct += 1
+                else:
+                    self.questions_wrong += 1
 
-            # Calculate Progress
-            self.questions_progress = self.questions_complete / self.questions_total
+                # Calculate Progress
+                self.questions_progress = self.questions_complete / self.questions_total
+
+            self.__journal('end')
+        finally:
+            # An interrupted exam leaves its journal behind, to be resumed
+            if self.journal:
+                self.journal.close()
+
+        # Exam is over, nothing left to resume
+        if self.journal:
+            self.journal.remove()
+            self.journal = None
 
         logger.debug('Exam completed or stopped')
 
@@ -1261,19 +1511,37 @@ class ExamTerminal:
         self.exam_contents['exam']['exam_questions_wrong'] = self.questions_wrong
 
         # Count exam question answered
-        answered = 0
-        for question in self.exam_contents['questions']:
-            if question['answered']:
-                answered += 1
-        self.exam_contents['exam']['exam_questions_answered'] = answered
-
-        # Stop independent exam timer
-        self.is_timer_timing = False
-        exam_timer_thread.join()
+        self.exam_contents['exam']['exam_questions_answered'] = len(self.__answered_questions())
+
+        # Stop the exam timer
+        self.exam_timer.stop()
+
+        # Keep timing and attempt details with the results, so they can be presented without this object
+        self.exam_contents['exam']['exam_elapsed_time'] = self.exam_elapsed_time
+        self.exam_contents['exam']['exam_paused_count'] = self.exam_paused_count
+        self.exam_contents['exam']['exam_paused_elapsed_time'] = self.exam_paused_elapsed_time
+        self.exam_contents['exam']['exam_attempt'] = self.exam_attempt
+        self.exam_contents['exam']['exam_attempt_id'] = '-'.join(
+            [
+                datetime.fromtimestamp(self.exam_begin_time).strftime('%Y%m%d-%H%M%S'),
+                str(os.getpid()),
+                str(self.exam_attempt),
+            ]
+        )
 
         # Evaluate the exam
         self.__evaluate_exam()
 
+        # Speculatively render the results PDF while the results are shown
+        self.start_pdf_render()
+
+        # Keep a record of the attempt for item analysis
+        if self.attempts_file:
+            try:
+                append_attempt_record(self.attempts_file, self.get_attempt_record())
+            except OSError as e:
+                logger.error(f'Failed to save exam attempt record to "{self.attempts_file}". Exception: {e}')
+
         if logger.level == logging.DEBUG:
             from pprint import pprint
 
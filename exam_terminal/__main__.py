@@ -4,11 +4,13 @@ import logging
 import os
 import sys
 import sysconfig
+import time
 from urllib.parse import urlparse
 
 import click
 
-from exam_terminal import exam_terminal, utility
+from exam_terminal import exam_cache, exam_journal, exam_terminal, http_cache, utility
+from exam_terminal.result_export import RESULT_FORMATS
 
 # Creating a message logger, all dependent scripts will inhearent this logger
 logging.basicConfig(format='[%(asctime)s][%(levelname)-8s] [%(filename)-30s:%(lineno)4s] %(message)s', datefmt='%m/%d-%H:%M:%S')
@@ -18,10 +20,17 @@ if logger.level == logging.DEBUG:
     logger.addHandler(logging.FileHandler("exam-terminal.log"))
 
 
-@click.command(context_settings={"ignore_unknown_options": True})
+@click.group(context_settings={"ignore_unknown_options": True}, invoke_without_command=True)
 @click.option('-s', '--sample', is_flag=True, default=False, type=bool, help='Set this flag to run a sample exam, just to check things out')
 @click.option('-e', '--examfile', required=False, default='', type=str, help='Local path or remote URL to the exam YAML file to be loaded')
-def main(sample, examfile) -> None:
+@click.option('--cache-ttl', required=False, default=http_cache.DEFAULT_TTL, type=float, show_default=True, help='Seconds a downloaded remote exam file is reused before checking the server for changes')
+@click.option('--offline', is_flag=True, default=False, type=bool, help='Set this flag to only use previously downloaded remote exam files')
+@click.option('--attempts-file', required=False, default=None, type=click.Path(dir_okay=False), help='JSONL file to append a record of each exam attempt to, for "exam-terminal analyze"')
+@click.option('--results-format', required=False, default=RESULT_FORMATS[0], type=click.Choice(RESULT_FORMATS), show_default=True, help='Format to save exam results in, can also be changed on the result screen')
+@click.option('--resume', is_flag=True, default=False, help='Set this flag to continue an exam of this exam file that was interrupted (ie. by a crash or dropped connection)')
+@click.option('--seed', required=False, default=None, type=click.IntRange(min=0), help='Seed of the question draw and shuffles set in the exam file, to give the exam of a recorded "exam_seed" again')
+@click.pass_context
+def main(ctx, sample, examfile, cache_ttl, offline, attempts_file, results_format, resume, seed) -> None:
     """
 
         \b
@@ -42,16 +51,26 @@ def main(sample, examfile) -> None:
             exam-terminal -examfile ~/Documents/Exams/SomeExam.yaml
             exam-terminal -e "/home/you/review.yml"
             exam-terminal -e https://raw.githubusercontent.com/ismet55555/exam-terminal/master/exam_terminal/exams/sample_exam.yml
+            exam-terminal --offline -e https://raw.githubusercontent.com/ismet55555/exam-terminal/master/exam_terminal/exams/sample_exam.yml
+            exam-terminal -e MyExam.yml --attempts-file attempts.jsonl
+            exam-terminal -e MyExam.yml --results-format jsonl
+            exam-terminal -e MyExam.yml --resume
+            exam-terminal -e MyExam.yml --seed 1234
+            exam-terminal compile MyExam.yml
+            exam-terminal assemble -p 20:networking -p 10:difficulty=hard -o MyExam.yml bank.yml
 
         For even more help visit:
         https://github.com/ismet55555/exam-terminal
     """
+    # Subcommand was called
+    if ctx.invoked_subcommand:
+        return
+
     logger.debug(f'--sample = {sample}')
     logger.debug(f'--examfile = {examfile}')
 
     # Check if any options have been passed
     if not sample and not examfile:
-        ctx = click.get_current_context()
         click.echo(click.style("Uh-Oh! Something's wrong here ...", fg='bright_red', bold=True))
         ctx.fail(click.style("User Input Error: No exam-terminal options were specified. Please specify any option.", fg='bright_red', bold=True))
 
@@ -68,14 +87,15 @@ def main(sample, examfile) -> None:
         logger.debug(f'Using sample exam file: {exam_file_location}')
 
         # Load the file
-        exam_file_contents = utility.load_examfile_contents_from_local_file(exam_file_location)
+        exam_file_contents = exam_cache.load_examfile_contents_cached(exam_file_location)
 
     # Specified exam file location
     if examfile:
         # Check if examfile is passed as local path or remote URL to be downloaded
         if bool(urlparse(examfile).scheme):
             # Loading file from remote URL
-            exam_file_contents = utility.load_examfile_contents_from_url(examfile)
+            cache = http_cache.HttpCache(ttl=cache_ttl, offline=offline)
+            exam_file_contents = utility.load_examfile_contents_from_url(examfile, cache=cache)
         else:
             # Loading local file
             logger.debug(f'Passed local exam file: {click.format_filename(examfile)}')
@@ -88,13 +108,22 @@ def main(sample, examfile) -> None:
                 click.echo(click.style("Uh-Oh! Something's wrong here ...", fg='bright_red', bold=True))
                 ctx.fail(click.style(f"User Input Error: The exam file which you specified does not exist: {exam_file_location}", fg='bright_red', bold=True))
 
-            # Load the file
-            exam_file_contents = utility.load_examfile_contents_from_local_file(exam_file_location)
+            # Load the file, from compiled exam cache if up to date
+            exam_file_contents = exam_cache.load_examfile_contents_cached(exam_file_location)
+
+    # Exam progress is journaled per exam file, so an interrupted exam can be resumed
+    journal_path = exam_journal.get_journal_path(exam_file_location or examfile)
+    if resume and exam_journal.is_journal_locked(journal_path):
+        click.echo(click.style("This exam is still running in another session, starting a new exam without auto save", fg='bright_yellow'))
+        resume = False
+    elif resume and exam_journal.replay_journal(exam_journal.load_journal(journal_path)) is None:
+        click.echo(click.style("No interrupted exam of this exam file to resume, starting a new exam", fg='bright_yellow'))
+        resume = False
 
     # Run exam-terminal
     exitcode = 0
     if exam_file_contents:
-        exitcode = exam_terminal.exam_terminal(exam_file_contents)
+        exitcode = exam_terminal.exam_terminal(exam_file_contents, attempts_file, results_format, journal_path, resume, seed)
     else:
         ctx = click.get_current_context()
         ctx.fail(click.style(f"Failed to load the specified file '{examfile}'. Check file location or format.", fg='bright_red', bold=True))
@@ -105,6 +134,282 @@ def main(sample, examfile) -> None:
     sys.exit(exitcode)
 
 
+def load_examfile(examfile: str) -> dict:
+    """
+    Load a local or remote exam file for a subcommand, fail the command if it
+    can not be loaded.
+
+    Parameters:
+        examfile (str): Local path or remote URL to the exam YAML file
+    Returns:
+        exam_file_contents (dict): Loaded exam contents
+    """
+    if bool(urlparse(examfile).scheme):
+        exam_file_contents = utility.load_examfile_contents_from_url(examfile, cache=http_cache.HttpCache())
+    else:
+        exam_file_location = os.path.abspath(click.format_filename(examfile))
+        exam_file_contents = exam_cache.load_examfile_contents_cached(exam_file_location) if os.path.exists(exam_file_location) else {}
+
+    if not exam_file_contents:
+        ctx = click.get_current_context()
+        ctx.fail(click.style(f"Failed to load the specified file '{examfile}'. Check file location or format.", fg='bright_red', bold=True))
+    return exam_file_contents
+
+
+@main.command('compile')
+@click.argument('examfiles', nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+def compile_command(examfiles) -> None:
+    """
+    Compile exam YAML files into pre-parsed exam caches, saved next to each
+    exam file. Later runs of these exam files skip YAML parsing. Caches are
+    also created automatically the first time an exam file is loaded.
+
+        \b
+        Example Usages:
+            exam-terminal compile MyExam.yml
+            exam-terminal compile ~/Documents/Exams/*.yml
+    """
+    exitcode = 0
+    for examfile in examfiles:
+        exam_file_location = os.path.abspath(click.format_filename(examfile))
+        if exam_cache.compile_examfile(exam_file_location) and os.path.exists(exam_cache.get_cache_file_path(exam_file_location)):
+            click.echo(click.style(f"Compiled: {exam_cache.get_cache_file_path(exam_file_location)}", fg='bright_green'))
+        else:
+            click.echo(click.style(f"Failed to compile exam file: {exam_file_location}", fg='bright_red', bold=True))
+            exitcode = 1
+
+    sys.exit(exitcode)
+
+
+@main.command('grade')
+@click.option('-e', '--examfile', required=True, type=str, help='Local path or remote URL to the exam YAML file to grade against')
+@click.option('-o', '--output', default='-', type=click.File('w'), help='JSONL file to write results to (default standard out)')
+# Default is grading.DEFAULT_BATCH_SIZE, grading is only imported when grading
+@click.option('--batch-size', default=1024, show_default=True, type=click.IntRange(min=1), help='Number of answer sheets graded together')
+@click.option('-j', '--workers', default=1, show_default=True, type=click.IntRange(min=0), help='Number of grading processes, 0 for one per CPU')
+@click.argument('sheets', default='-', type=click.File('r'))
+def grade_command(examfile, output, batch_size, workers, sheets) -> None:
+    """
+    Grade answer sheets without the interactive exam. Reads answer sheets as
+    JSONL (one JSON answer sheet per line) and writes the score and pass/fail
+    result of each sheet as JSONL, in the same order.
+
+        \b
+        Answer sheet format (selected selection indexes for each question):
+            {"id": "student-1", "answers": [[0], [0, 4, 5], null, [1], [1]]}
+
+        \b
+        Example Usages:
+            exam-terminal grade -e MyExam.yml answer_sheets.jsonl
+            cat answer_sheets.jsonl | exam-terminal grade -e MyExam.yml -o results.jsonl
+            exam-terminal grade -e MyExam.yml --workers 0 answer_sheets.jsonl
+    """
+    # Only needed when grading
+    from exam_terminal import grading
+
+    exam_file_contents = load_examfile(examfile)
+
+    begin_time = time.perf_counter()
+    if workers == 1:
+        count = grading.grade_answer_sheets(exam_file_contents, sheets, output, batch_size=batch_size)
+    else:
+        count = grading.grade_answer_sheets_parallel(exam_file_contents, sheets, output, workers=workers or None, batch_size=batch_size)
+    elapsed_time = time.perf_counter() - begin_time
+
+    throughput = count / elapsed_time if elapsed_time else 0.0
+    click.echo(click.style(f"Graded {count} answer sheets in {elapsed_time:.2f} seconds ({throughput:.0f} sheets/sec)", fg='bright_green'), err=True)
+
+
+
+@main.command('analyze')
+@click.option('-e', '--examfile', required=False, default='', type=str, help='Local path or remote URL to the exam YAML file, to grade and label the attempts')
+@click.option('-o', '--output', default='-', type=click.File('w'), help='File to write the report to (default standard out)')
+@click.option('--json', 'as_json', is_flag=True, default=False, help='Set this flag to write the report as JSON')
+@click.argument('records', nargs=-1, type=click.File('r'))
+def analyze_command(examfile, output, as_json, records) -> None:
+    """
+    Item analysis over many exam attempts. Reads exam attempt records as JSONL
+    (saved with --attempts-file, or answer sheets as used by "grade") and writes
+    the difficulty, discrimination, selection frequencies and answer time of
+    each question. Attempts are read as a stream, memory use does not grow
+    with their number.
+
+        \b
+        Example Usages:
+            exam-terminal analyze attempts.jsonl
+            exam-terminal analyze -e MyExam.yml --json -o report.json answer_sheets.jsonl
+    """
+    # Only needed when analyzing
+    from exam_terminal import analytics
+
+    exam_file_contents = load_examfile(examfile) if examfile else None
+    count = analytics.analyze_attempt_records(records or [click.get_text_stream('stdin')], output, exam_file_contents, as_json=as_json)
+    click.echo(click.style(f"Analyzed {count} exam attempts", fg='bright_green'), err=True)
+
+
+
+@main.command('report')
+@click.option('-o', '--output-dir', default='.', show_default=True, type=click.Path(file_okay=False), help='Directory to save the PDF reports in')
+@click.option('-j', '--workers', default=0, show_default=True, type=click.IntRange(min=0), help='Number of rendering processes, 0 for one per CPU')
+@click.argument('sources', nargs=-1, required=True, type=click.Path(exists=True))
+def report_command(output_dir, workers, sources) -> None:
+    """
+    Render the PDF result report of many exam attempts at once, for example a
+    whole class. Reads exam results saved with "--results-format json" or
+    "--results-format jsonl", as files or directories of them. Each report
+    file is named after the exam title and attempt, so rendering again
+    replaces the same files.
+
+        \b
+        Example Usages:
+            exam-terminal report Exam_Results.jsonl
+            exam-terminal report -o reports/ --workers 4 results/
+    """
+    # Only needed when rendering, slow to import
+    from exam_terminal import pdf_report, result_export
+
+    exitcode = 0
+    count = 0
+    pages_total = 0
+    begin_time = time.perf_counter()
+    records = result_export.read_result_records(click.format_filename(source) for source in sources)
+    for file_path, seconds, pages, error in pdf_report.render_record_reports(records, output_dir, workers=workers or None):
+        if error:
+            click.echo(click.style(error, fg='bright_red', bold=True), err=True)
+            exitcode = 1
+            continue
+        click.echo(f"{seconds:7.2f} s  {pages:5d} pages  {file_path}")
+        count += 1
+        pages_total += pages
+    elapsed_time = time.perf_counter() - begin_time
+
+    throughput = count / elapsed_time if elapsed_time else 0.0
+    click.echo(click.style(f"Rendered {count} reports ({pages_total} pages) in {elapsed_time:.2f} seconds ({throughput:.1f} reports/sec)", fg='bright_green'), err=True)
+    sys.exit(exitcode)
+
+
+
+@main.command('assemble')
+@click.option('-p', '--pick', 'picks', required=True, multiple=True, type=str, help='Number of questions and the tags and difficulty to match, ie. "20:networking" or "10:difficulty=hard". Can be repeated')
+@click.option('-o', '--output', required=True, type=click.Path(dir_okay=False), help='Exam file to write')
+@click.option('--title', default=None, type=str, help='Exam title, default the title of the first question bank')
+@click.option('--seed', default=None, type=click.IntRange(min=0), help='Seed of the random pick, to assemble the same exam again')
+@click.option('--rebuild-index', is_flag=True, default=False, help='Set this flag to index the question banks again, even if their indexes are up to date')
+@click.argument('banks', nargs=-1, required=True, type=click.Path(exists=True, dir_okay=False))
+def assemble_command(picks, output, title, seed, rebuild_index, banks) -> None:
+    """
+    Assemble an exam file from questions picked at random out of large
+    question banks (exam files), by question tags and difficulty. Each bank is
+    indexed once, into an index file saved next to it, so later picks only
+    read the questions picked. Picks are filled in order and a question is
+    picked at most once.
+
+        \b
+        Question fields, both optional:
+            question_tags: [networking, security]
+            question_difficulty: hard
+
+        \b
+        Example Usages:
+            exam-terminal assemble -p 20:networking -p 10:difficulty=hard -p 5:security -o MyExam.yml bank.yml
+            exam-terminal assemble -p "5:security,difficulty=easy" -p 10 -o MyExam.yml bank1.yml bank2.yml
+            exam-terminal assemble -p 20:networking --seed 1234 -o MyExam.yml bank.yml
+    """
+    # Only needed when assembling
+    from exam_terminal import exam_order, question_index
+
+    ctx = click.get_current_context()
+    try:
+        parsed_picks = [question_index.parse_pick(pick) for pick in picks]
+    except ValueError as e:
+        ctx.fail(click.style(f"User Input Error: {e}", fg='bright_red', bold=True))
+
+    try:
+        index = question_index.QuestionIndex(banks, rebuild=rebuild_index)
+    except (OSError, ValueError) as e:
+        click.echo(click.style(f"Failed to index question banks: {e}", fg='bright_red', bold=True), err=True)
+        sys.exit(1)
+    if index.built_count:
+        click.echo(click.style(f"Indexed {index.built_count} question banks", fg='bright_green'), err=True)
+
+    seed = exam_order.new_seed() if seed is None else seed
+    try:
+        numbers = index.pick(parsed_picks, seed)
+    except ValueError as e:
+        click.echo(click.style(f"Failed to assemble exam: {e}", fg='bright_red', bold=True), err=True)
+        sys.exit(1)
+
+    exam = index.get_exam_information()
+    if title is not None:
+        exam['exam_title'] = title
+    bank_names = ', '.join(os.path.basename(bank) for bank in banks)
+    try:
+        index.write_exam_file(output, numbers, exam, comment=f'Assembled from {bank_names} with exam-terminal assemble --seed {seed}')
+    except OSError as e:
+        click.echo(click.style(f"Failed to write exam file: {e}", fg='bright_red', bold=True), err=True)
+        sys.exit(1)
+    click.echo(click.style(f"Assembled {len(numbers)} of {len(index)} questions (seed {seed}): {output}", fg='bright_green'), err=True)
+
+
+@main.command('serve')
+@click.option('-e', '--examfile', required=True, type=str, help='Local path or remote URL to the exam YAML file to serve')
+@click.option('--socket', 'socket_path', default=None, type=click.Path(dir_okay=False), help='Unix socket to listen on (default exam-terminal.sock)')
+@click.option('--host', default='127.0.0.1', show_default=True, type=str, help='Host to listen on, with --port')
+@click.option('--port', default=None, type=click.IntRange(min=1, max=65535), help='TCP port to listen on instead of a Unix socket')
+@click.option('--attempts-file', required=False, default=None, type=click.Path(dir_okay=False), help='JSONL file to append a record of each finished exam attempt to')
+@click.option('--seed', default=None, type=click.IntRange(min=0), help='Seed of the question draw and shuffles set in the exam file, the same for every session (default a new one per session)')
+def serve_command(examfile, socket_path, host, port, attempts_file, seed) -> None:
+    """
+    Serve an exam to many candidates from one process. The exam file is loaded
+    and parsed once, each connected client gets its own exam session. Clients
+    take the exam with "exam-terminal connect", or speak the JSON lines
+    protocol directly. Stop the server with CTRL-C.
+
+        \b
+        Example Usages:
+            exam-terminal serve -e MyExam.yml --attempts-file attempts.jsonl
+            exam-terminal serve -e MyExam.yml --socket /tmp/exam.sock
+            exam-terminal serve -e MyExam.yml --port 8765
+            exam-terminal serve -e MyExam.yml --seed 1234
+    """
+    # Only needed when serving, imports asyncio
+    from exam_terminal import exam_server
+
+    exam_file_contents = load_examfile(examfile)
+    try:
+        exam_server.serve_exam(exam_file_contents, socket_path, host, port, attempts_file, seed)
+    except OSError as e:
+        click.echo(click.style(f"Failed to start exam server: {e}", fg='bright_red', bold=True), err=True)
+        sys.exit(1)
+
+
+@main.command('connect')
+@click.option('--socket', 'socket_path', default=None, type=click.Path(dir_okay=False), help='Unix socket of the exam server (default exam-terminal.sock)')
+@click.option('--host', default='127.0.0.1', show_default=True, type=str, help='Host of the exam server, with --port')
+@click.option('--port', default=None, type=click.IntRange(min=1, max=65535), help='TCP port of the exam server instead of a Unix socket')
+def connect_command(socket_path, host, port) -> None:
+    """
+    Take an exam served by "exam-terminal serve", in plain line mode.
+
+        \b
+        Example Usages:
+            exam-terminal connect
+            exam-terminal connect --socket /tmp/exam.sock
+            exam-terminal connect --host 10.0.0.5 --port 8765
+    """
+    # Only needed when connecting, imports asyncio
+    from exam_terminal import exam_server
+
+    try:
+        with exam_server.connect_socket(socket_path, host, port) as connection:
+            result = exam_server.run_text_client(connection)
+    except (OSError, EOFError) as e:
+        click.echo(click.style(f"Exam server connection ended: {e}", fg='bright_red', bold=True), err=True)
+        sys.exit(1)
+
+    sys.exit(0 if result else 1)
+
+
 if __name__ == "__main__":
     """
     Main entry point to the entire program.
@@ -0,0 +1,395 @@
+"""Item analysis of exam questions over many exam attempts."""
+
+import json
+import logging
+import math
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from typing import Optional, TextIO
+
+from exam_terminal.grading import ExamGrader, read_answer_sheets
+from exam_terminal.result_export import append_jsonl
+
+logger = logging.getLogger()
+
+# Upper edges in seconds of the time-on-item histogram bins, last bin is everything above
+TIME_BIN_EDGES = (5, 10, 15, 20, 30, 45, 60, 90, 120, 180, 300, 600)
+
+# Item flag thresholds
+EASY_P_VALUE = 0.9
+HARD_P_VALUE = 0.2
+LOW_DISCRIMINATION = 0.2
+
+# Highest question and selection counts of attempt records analyzed without an exam file, bounds memory
+MAX_QUESTIONS = 2**20
+MAX_SELECTIONS = 2**10
+
+
+def append_attempt_record(file_path: str, record: dict) -> None:
+    """Append one exam attempt record to a JSONL file, safe with many concurrent exams.
+
+    Parameters:
+        file_path (str) : Path to the JSONL attempt records file
+        record (dict)   : Exam attempt record
+    """
+    append_jsonl(file_path, record)
+    logger.debug(f'Appended exam attempt record to: {file_path}')
+
+
+def _correlation(n: int, sum_x: int, sum_y: int, sum_xy: int, sum_xx: int, sum_yy: int) -> Optional[float]:
+    """Pearson correlation from running sums, None if either variable is constant."""
+    denominator = (n * sum_xx - sum_x * sum_x) * (n * sum_yy - sum_y * sum_y)
+    if denominator <= 0:
+        return None
+    return (n * sum_xy - sum_x * sum_y) / math.sqrt(denominator)
+
+
+class ItemStatistics:
+    """Running statistics of a single question. Memory does not grow with the number of attempts."""
+
+    def __init__(self) -> None:
+        """Object constructor method."""
+        self.attempts = 0
+        self.answered = 0
+        self.correct = 0
+
+        # Sums of the total scores of attempts asking the question, and of those answering correctly, for point-biserial
+        self.sum_total = 0
+        self.sum_total_squared = 0
+        self.sum_correct_total = 0
+
+        # Number of times each selection was picked
+        self.selection_counts: list[int] = []
+
+        # Time on item, Welford running mean and variance, and histogram
+        self.time_count = 0
+        self.time_mean = 0.0
+        self.time_m2 = 0.0
+        self.time_min = math.inf
+        self.time_max = 0.0
+        self.time_bins = [0] * (len(TIME_BIN_EDGES) + 1)
+
+    def add(
+        self, answered: Optional[Iterable[int]], correct: bool, total_score: int, answer_time: Optional[float]
+    ) -> None:
+        """Add the answer of one attempt.
+
+        Parameters:
+            answered (list)     : Selected selection indexes, None if not answered
+            correct (bool)      : True if answered correctly
+            total_score (int)   : Number of correctly answered questions of the attempt
+            answer_time (float) : Seconds spent on the question, None if unknown
+        """
+        self.attempts += 1
+        self.sum_total += total_score
+        self.sum_total_squared += total_score * total_score
+        if correct:
+            self.correct += 1
+            self.sum_correct_total += total_score
+
+        if answered is not None:
+            self.answered += 1
+            for index in answered:
+                if index >= len(self.selection_counts):
+                    self.selection_counts.extend([0] * (index + 1 - len(self.selection_counts)))
+                self.selection_counts[index] += 1
+
+        if answer_time is not None:
+            self.time_count += 1
+            delta = answer_time - self.time_mean
+            self.time_mean += delta / self.time_count
+            self.time_m2 += delta * (answer_time - self.time_mean)
+            self.time_min = min(self.time_min, answer_time)
+            self.time_max = max(self.time_max, answer_time)
+            self.time_bins[bisect_right(TIME_BIN_EDGES, answer_time)] += 1
+
+    def time_quantile(self, fraction: float) -> Optional[float]:
+        """Approximate a time-on-item quantile by interpolating within its histogram bin.
+
+        Parameters:
+            fraction (float) : Quantile between 0 and 1 (ie. 0.5 for the median)
+
+        Returns:
+            (float) : Seconds, None if no times were recorded
+        """
+        if not self.time_count:
+            return None
+        target = fraction * self.time_count
+        seen = 0
+        for index, count in enumerate(self.time_bins):
+            if count and seen + count >= target:
+                low = max(TIME_BIN_EDGES[index - 1] if index else 0.0, self.time_min)
+                high = min(TIME_BIN_EDGES[index] if index < len(TIME_BIN_EDGES) else self.time_max, self.time_max)
+                return low + (high - low) * (target - seen) / count
+            seen += count
+        return self.time_max
+
+
+class ItemAnalysis:
+    """Psychometric item analysis over a stream of exam attempt records.
+
+    Attempt records are answer sheets (see ExamGrader) that may also carry the
+    correctness and time spent of each answer:
+
+        {"id": "a1", "answers": [[0], null, [1, 2]], "correct": [true, false, true], "answer_times": [8.2, null, 20.1]}
+
+    Records without "correct" are graded against the exam, which must then be passed.
+    Records of exams asking questions drawn from the exam file (see ExamOrder)
+    list answers in the order asked, with the exam file index of each question
+    under "question_indexes". Each question counts only the attempts asking it.
+
+    Usage:
+        analysis = ItemAnalysis(exam_contents)
+        analysis.add_attempts(records)
+        analysis.write_report(sys.stdout)
+    """
+
+    def __init__(self, exam_contents: Optional[dict] = None) -> None:
+        """Object constructor method.
+
+        Parameters:
+            exam_contents (dict) : Loaded exam contents, used for grading and question texts
+        """
+        self.grader = ExamGrader(exam_contents) if exam_contents else None
+        self.items: list[ItemStatistics] = []
+
+        # Running sums of attempt total scores
+        self.attempts = 0
+        self.sum_total = 0
+        self.sum_total_squared = 0
+
+    def __get_correct(self, record: dict, answers: list, question_indexes: Sequence[int]) -> list:
+        """Get the correctness of each answer of a record, grading it if needed."""
+        if record.get('correct') is not None:
+            return [bool(correct) for correct in record['correct']]
+        if not self.grader:
+            raise ValueError('Attempt record has no "correct" list and no exam file to grade it against')
+        return [
+            self.grader.grade_answer(index, answered) if index < self.grader.questions_count else False
+            for index, answered in zip(question_indexes, answers)
+        ]
+
+    def __check_indexes(self, question_indexes: Sequence[int], answers: list) -> None:
+        """Check that the question and selection indexes of a record are in range, before anything is counted.
+        Booleans are not indexes.
+
+        Raises:
+            ValueError : If an index is not a question or selection of the exam
+        """
+        questions_count = self.grader.questions_count if self.grader else MAX_QUESTIONS
+        selection_counts = self.grader.selection_counts if self.grader else None
+        for position, index in enumerate(question_indexes):
+            if type(index) is not int or not 0 <= index < questions_count:
+                raise ValueError(f'Question index {index!r:.40} is out of range')
+            answered = answers[position] if position < len(answers) else None
+            if answered is None:
+                continue
+            selection_count = selection_counts[index] if selection_counts else MAX_SELECTIONS
+            for selection in answered:
+                if type(selection) is not int or not 0 <= selection < selection_count:
+                    raise ValueError(f'Selections {answered!r:.80} of question {index} are out of range')
+
+    def add_attempt(self, record: dict) -> None:
+        """Add one exam attempt record.
+
+        Parameters:
+            record (dict) : Exam attempt record
+        """
+        question_indexes = record.get('question_indexes')
+        if question_indexes is None:
+            answers = self.grader.get_answers(record) if self.grader else list(record.get('answers') or [])
+        else:
+            answers = list(record.get('answers') or [])
+        correct = self.__get_correct(record, answers, question_indexes or range(len(answers)))
+        answer_times = record.get('answer_times') or []
+        total_score = sum(correct)
+
+        if question_indexes is None:
+            question_indexes = range(max(len(answers), len(correct)))
+        self.__check_indexes(question_indexes, answers)
+        questions_count = max(question_indexes, default=-1) + 1
+        while len(self.items) < questions_count:
+            self.items.append(ItemStatistics())
+
+        for position, index in enumerate(question_indexes):
+            self.items[index].add(
+                answers[position] if position < len(answers) else None,
+                position < len(correct) and correct[position],
+                total_score,
+                answer_times[position] if position < len(answer_times) else None,
+            )
+
+        self.attempts += 1
+        self.sum_total += total_score
+        self.sum_total_squared += total_score * total_score
+
+    def add_attempts(self, records: Iterable[dict]) -> int:
+        """Add a stream of exam attempt records, skipping invalid ones.
+
+        Parameters:
+            records (iterable) : Exam attempt records
+
+        Returns:
+            (int) : Number of records added
+        """
+        count = 0
+        for record in records:
+            if not isinstance(record, dict):
+                logger.error(f'Skipping exam attempt record, not a JSON object: {record!r:.80}')
+                continue
+            try:
+                self.add_attempt(record)
+                count += 1
+            except (ValueError, TypeError, KeyError) as e:
+                logger.error(f'Skipping exam attempt record "{record.get("id")}". Exception: {e}')
+        return count
+
+    ###############################################################################################
+
+    def get_item_summary(self, index: int) -> dict:
+        """Summarize the statistics of one question.
+
+        Difficulty (p-value) is the fraction of attempts answering correctly, with
+        unanswered questions counted as incorrect. Discrimination is the
+        point-biserial correlation of the item score with the attempt total score,
+        and with the total score of the remaining questions (corrected).
+
+        Parameters:
+            index (int) : Question index
+
+        Returns:
+            (dict) : Question statistics
+        """
+        item = self.items[index]
+        n = item.attempts
+        sum_rest = item.sum_total - item.correct
+        sum_correct_rest = item.sum_correct_total - item.correct
+        sum_rest_squared = item.sum_total_squared - 2 * item.sum_correct_total + item.correct
+
+        p_value = item.correct / n if n else None
+        point_biserial = _correlation(
+            n, item.correct, item.sum_total, item.sum_correct_total, item.correct, item.sum_total_squared
+        )
+        point_biserial_corrected = _correlation(
+            n, item.correct, sum_rest, sum_correct_rest, item.correct, sum_rest_squared
+        )
+
+        flags = []
+        if p_value is not None and p_value >= EASY_P_VALUE:
+            flags.append('easy')
+        if p_value is not None and p_value <= HARD_P_VALUE:
+            flags.append('hard')
+        if point_biserial_corrected is not None and point_biserial_corrected < LOW_DISCRIMINATION:
+            flags.append('low-discrimination')
+
+        summary = {
+            'question_number': index,
+            'attempts': n,
+            'answered': item.answered,
+            'omit_rate': 1 - item.answered / n if n else None,
+            'p_value': p_value,
+            'point_biserial': point_biserial,
+            'point_biserial_corrected': point_biserial_corrected,
+            'selection_frequencies': [count / item.answered for count in item.selection_counts]
+            if item.answered
+            else [],
+            'time_count': item.time_count,
+            'time_mean': item.time_mean if item.time_count else None,
+            'time_stdev': math.sqrt(item.time_m2 / (item.time_count - 1)) if item.time_count > 1 else None,
+            'time_min': item.time_min if item.time_count else None,
+            'time_median': item.time_quantile(0.5),
+            'time_p90': item.time_quantile(0.9),
+            'time_max': item.time_max if item.time_count else None,
+            'time_histogram': dict(
+                zip([f'<{edge}s' for edge in TIME_BIN_EDGES] + [f'>={TIME_BIN_EDGES[-1]}s'], item.time_bins)
+            ),
+            'flags': flags,
+        }
+        if self.grader and index < self.grader.questions_count:
+            summary['question'] = self.grader.questions[index]['question']
+            summary['question_answer_indexes'] = self.grader.questions[index]['question_answer_indexes']
+        return summary
+
+    def get_summary(self) -> dict:
+        """Summarize the statistics of the whole exam and all questions.
+
+        Reliability is the Kuder-Richardson 20 (KR-20) coefficient.
+
+        Returns:
+            (dict) : Exam and question statistics
+        """
+        n = self.attempts
+        questions_count = len(self.items)
+        score_variance = (self.sum_total_squared - self.sum_total * self.sum_total / n) / (n - 1) if n > 1 else 0.0
+
+        kr20 = None
+        if questions_count > 1 and score_variance > 0:
+            sum_pq = sum((item.correct / n) * (1 - item.correct / n) for item in self.items)
+            kr20 = (questions_count / (questions_count - 1)) * (1 - sum_pq / score_variance)
+
+        return {
+            'attempts': n,
+            'questions_count': questions_count,
+            'score_mean': self.sum_total / n if n else None,
+            'score_stdev': math.sqrt(score_variance) if n > 1 else None,
+            'kr20': kr20,
+            'questions': [self.get_item_summary(index) for index in range(questions_count)],
+        }
+
+    def write_report(self, file: TextIO, as_json: bool = False) -> None:
+        """Write the item analysis summary report.
+
+        Parameters:
+            file (obj)     : Open text file
+            as_json (bool) : If True, write JSON, else a plain text table
+        """
+        summary = self.get_summary()
+        if as_json:
+            json.dump(summary, file, indent=2)
+            file.write('\n')
+            return
+
+        def number(value: Optional[float], form: str = '6.2f') -> str:
+            return format(value, form) if value is not None else '-'.rjust(len(format(0.0, form)))
+
+        file.write(f'Attempts: {summary["attempts"]}    Questions: {summary["questions_count"]}\n')
+        file.write(f'Score: {number(summary["score_mean"], ".2f")} +/- {number(summary["score_stdev"], ".2f")}    ')
+        file.write(f'Reliability (KR-20): {number(summary["kr20"], ".3f")}\n\n')
+        file.write(
+            '   Q#  p-value  r-pb  r-pb(c)  omit   time mean/median/p90 (s)  selections (%)              flags\n'
+        )
+        for item in summary['questions']:
+            selections = ' '.join(
+                f'{chr(65 + i) if i < 26 else i}:{frequency * 100:.0f}'
+                for i, frequency in enumerate(item['selection_frequencies'])
+            )
+            file.write(
+                f'{item["question_number"] + 1:5d}'
+                f'  {number(item["p_value"], "6.2f")}'
+                f' {number(item["point_biserial"], "5.2f")}'
+                f'  {number(item["point_biserial_corrected"], "6.2f")}'
+                f'  {number(item["omit_rate"] * 100 if item["omit_rate"] is not None else None, "3.0f")}%'
+                f'  {number(item["time_mean"], "7.1f")} {number(item["time_median"], "7.1f")} {number(item["time_p90"], "7.1f")}'
+                f'     {selections:<28s}'
+                f' {",".join(item["flags"])}\n'
+            )
+
+
+def analyze_attempt_records(
+    records_files: Iterable[TextIO], results_file: TextIO, exam_contents: Optional[dict] = None, as_json: bool = False
+) -> int:
+    """Run item analysis over JSONL exam attempt record files and write the summary report.
+
+    Parameters:
+        records_files (list) : Open JSONL attempt records files
+        results_file (obj)   : Open text file for the report
+        exam_contents (dict) : Loaded exam contents, optional
+        as_json (bool)       : If True, write the report as JSON
+
+    Returns:
+        (int) : Number of analyzed exam attempts
+    """
+    analysis = ItemAnalysis(exam_contents)
+    count = sum(analysis.add_attempts(read_answer_sheets(file)) for file in records_files)
+    analysis.write_report(results_file, as_json=as_json)
+    return count
@@ -0,0 +1,165 @@
+"""Answer evaluation with selections and correct answers as integer bitmasks.
+
+Bit i of a mask stands for selection i of a question. Toggling a selection,
+counting selections and comparing them with the correct answers are then
+single integer operations, whatever the number of selections.
+"""
+
+from collections.abc import Iterable
+from typing import Optional
+
+# Bit of each of the first selection indexes, looked up instead of shifted
+_BITS = tuple(1 << index for index in range(64))
+
+
+try:
+    count_bits = int.bit_count  # Python 3.10+
+except AttributeError:
+
+    def count_bits(mask: int) -> int:  # type: ignore[misc]
+        """Number of selections in a bitmask."""
+        return bin(mask).count('1')
+
+
+def indexes_to_mask(indexes: Iterable[int]) -> int:
+    """Get the bitmask of selection indexes, bit i set for selection i.
+
+    Parameters:
+        indexes (iterable) : Selection indexes
+
+    Returns:
+        (int) : Bitmask
+    """
+    mask = 0
+    for index in indexes:
+        mask |= 1 << index
+    return mask
+
+
+def mask_to_indexes(mask: int) -> list[int]:
+    """Get the selection indexes of a bitmask, in ascending order.
+
+    Parameters:
+        mask (int) : Bitmask, bit i set for selection i
+
+    Returns:
+        (list) : Selection indexes
+    """
+    indexes = []
+    index = 0
+    while mask:
+        if mask & 1:
+            indexes.append(index)
+        mask >>= 1
+        index += 1
+    return indexes
+
+
+def selection_mask(indexes: Iterable, selection_count: int) -> Optional[int]:
+    """Get the bitmask of selection indexes that come from outside (ie. an answer sheet).
+
+    Parameters:
+        indexes (iterable)    : Selected selection indexes
+        selection_count (int) : Number of selections of the question
+
+    Returns:
+        (int) : Bitmask, None if any index is not a selection of the question
+    """
+    mask = 0
+    try:
+        for index in indexes:
+            if not 0 <= index < selection_count:
+                return None
+            mask |= _BITS[index] if index < 64 else 1 << index
+    except TypeError:
+        return None
+    return mask
+
+
+def is_correct(selected_mask: int, answer_mask: int) -> bool:
+    """Check if exactly all correct selections were selected.
+
+    A question without correct answers (ie. a survey question) is correct
+    whatever is selected.
+
+    Parameters:
+        selected_mask (int) : Bitmask of selected selections
+        answer_mask (int)   : Bitmask of correct selections
+
+    Returns:
+        (bool) : True if correct, else False
+    """
+    return selected_mask == answer_mask or not answer_mask
+
+
+def partial_credit(selected_mask: int, answer_mask: int) -> float:
+    """Fraction of a question earned: correct selections, less wrong selections, out of all correct ones.
+
+    Parameters:
+        selected_mask (int) : Bitmask of selected selections
+        answer_mask (int)   : Bitmask of correct selections
+
+    Returns:
+        (float) : Credit between 0.0 and 1.0
+    """
+    answer_count = count_bits(answer_mask)
+    if not answer_count:
+        return 1.0
+    hits = count_bits(selected_mask & answer_mask)
+    misses = count_bits(selected_mask & ~answer_mask)
+    return max(hits - misses, 0) / answer_count
+
+
+class AnswerSelection:
+    """Selections made on one question while it is answered, compared with its correct answers.
+
+    Usage:
+        selection = AnswerSelection(answer_mask)
+        selection.toggle(2)
+        if selection.is_complete:
+            correct = selection.is_correct
+    """
+
+    __slots__ = ('answer_mask', 'answer_count', 'selected_mask')
+
+    def __init__(self, answer_mask: int) -> None:
+        """Object constructor method.
+
+        Parameters:
+            answer_mask (int) : Bitmask of correct selections
+        """
+        self.answer_mask = answer_mask
+        self.answer_count = count_bits(answer_mask)
+        self.selected_mask = 0
+
+    def toggle(self, index: int) -> None:
+        """Select a selection, or unselect it if it was selected.
+
+        Parameters:
+            index (int) : Selection index
+        """
+        self.selected_mask ^= 1 << index
+
+    def is_selected(self, index: int) -> bool:
+        """True if a selection is selected."""
+        return bool(self.selected_mask >> index & 1)
+
+    @property
+    def is_complete(self) -> bool:
+        """True once as many selections are made as there are correct answers."""
+        return count_bits(self.selected_mask) >= self.answer_count
+
+    @property
+    def is_correct(self) -> bool:
+        """True if exactly all correct selections are selected, see is_correct()."""
+        return self.selected_mask == self.answer_mask or not self.answer_mask
+
+    @property
+    def partial_credit(self) -> float:
+        """Fraction of the question earned so far, see partial_credit()."""
+        return partial_credit(self.selected_mask, self.answer_mask)
+
+    @property
+    def indexes(self) -> list[int]:
+        """Selected selection indexes, in ascending order."""
+        return mask_to_indexes(self.selected_mask)
@@ -0,0 +1,148 @@
+"""Compiled exam file cache, stored next to the YAML exam file."""
+
+import hashlib
+import logging
+import marshal
+import os
+from typing import Optional
+
+from exam_terminal import utility
+from exam_terminal.question_bank import LAZY_LOAD_MIN_BYTES, load_examfile_contents_lazily, parse_question
+
+logger = logging.getLogger()
+
+CACHE_FILE_EXTENSION = '.examc'
+CACHE_MAGIC = b'EXAMC\x01\n'
+
+
+def get_cache_file_path(local_file_path: str) -> str:
+    """Get the path of the compiled exam cache of an exam file.
+
+    Parameters:
+        local_file_path (str) : Path to a local exam file
+
+    Returns:
+        (str) : Path to the compiled exam cache file
+    """
+    return os.path.abspath(local_file_path) + CACHE_FILE_EXTENSION
+
+
+def get_source_key(local_file_path: str) -> dict:
+    """Get the values identifying the current version of an exam file.
+
+    Parameters:
+        local_file_path (str) : Path to a local exam file
+
+    Returns:
+        (dict) : Absolute path, modification time and SHA-256 content hash of the file
+    """
+    with open(local_file_path, 'rb') as file:
+        sha256 = hashlib.sha256(file.read()).hexdigest()
+    return {
+        'source_path': os.path.abspath(local_file_path),
+        'source_mtime_ns': os.stat(local_file_path).st_mtime_ns,
+        'source_sha256': sha256,
+    }
+
+
+def compile_examfile(local_file_path: str, source_key: Optional[dict] = None) -> dict:
+    """Load and pre-parse an exam file, then write it as a compiled exam cache.
+
+    Parameters:
+        local_file_path (str) : Path to a local exam file
+        source_key (dict)     : Already computed source key, computed if not passed
+
+    Returns:
+        file_contents (Dict) : The contents of the exam file with parsed questions, empty if failed
+    """
+    file_contents = utility.load_examfile_contents_from_local_file(local_file_path)
+    if not file_contents:
+        return {}
+
+    # Pre-parse all questions
+    for index, question in enumerate(file_contents.get('questions') or []):
+        parse_question(question, index)
+
+    # Exam allowed time in seconds, so loading does not convert it again (question allowed times are in seconds)
+    exam = file_contents.get('exam') or {}
+    if 'exam_allowed_time' in exam:
+        exam['exam_allowed_seconds'] = utility.to_seconds(
+            exam['exam_allowed_time'], exam.get('exam_allowed_time_units')
+        )
+
+    cache_file_path = get_cache_file_path(local_file_path)
+    cache = {**(source_key or get_source_key(local_file_path)), 'exam_contents': file_contents}
+    try:
+        data = CACHE_MAGIC + marshal.dumps(cache)
+        temp_file_path = f'{cache_file_path}.{os.getpid()}.tmp'
+        with open(temp_file_path, 'wb') as file:
+            file.write(data)
+        os.replace(temp_file_path, cache_file_path)
+        logger.debug(f'Saved compiled exam cache: {cache_file_path}')
+    except (OSError, ValueError) as e:
+        # Not writable location, or content that can not be stored (ie. YAML dates)
+        logger.debug(f'Failed to save compiled exam cache "{cache_file_path}". Exception: {e}')
+
+    return file_contents
+
+
+def load_compiled_examfile(local_file_path: str, source_key: Optional[dict] = None) -> dict:
+    """Load the compiled exam cache of an exam file, if it is up to date.
+
+    The cache is read with marshal, which is not safe against maliciously
+    crafted data. Only use it for exam files in trusted directories.
+
+    Parameters:
+        local_file_path (str) : Path to a local exam file
+        source_key (dict)     : Already computed source key, computed if not passed
+
+    Returns:
+        file_contents (Dict) : The contents of the exam file with parsed questions, empty if stale or missing
+    """
+    cache_file_path = get_cache_file_path(local_file_path)
+    try:
+        with open(cache_file_path, 'rb') as file:
+            data = file.read()
+        if not data.startswith(CACHE_MAGIC):
+            logger.debug(f'Unknown compiled exam cache format: {cache_file_path}')
+            return {}
+        cache = marshal.loads(data[len(CACHE_MAGIC) :])
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        logger.debug(f'No usable compiled exam cache "{cache_file_path}". Exception: {e}')
+        return {}
+
+    source_key = source_key or get_source_key(local_file_path)
+    if any(cache.get(key) != value for key, value in source_key.items()):
+        logger.debug(f'Compiled exam cache is stale: {cache_file_path}')
+        return {}
+
+    logger.debug(f'Loaded compiled exam cache: {cache_file_path}')
+    return cache['exam_contents']
+
+
+def load_examfile_contents_cached(local_file_path: str) -> dict:
+    """Load an exam file from its compiled exam cache, compiling it first if missing or stale.
+
+    Very large exam files without an up to date cache are loaded lazily instead,
+    compile them ahead of time with "exam-terminal compile".
+
+    Parameters:
+        local_file_path (str) : Path to a local exam file
+
+    Returns:
+        file_contents (Dict) : The contents of the exam file with parsed questions
+    """
+    try:
+        source_key = get_source_key(local_file_path)
+    except OSError as e:
+        logger.error(f"Failed to load specified local exam file: '{local_file_path}'. Exception: {e}")
+        return {}
+
+    file_contents = load_compiled_examfile(local_file_path, source_key)
+    if file_contents:
+        return file_contents
+
+    if os.path.getsize(local_file_path) >= LAZY_LOAD_MIN_BYTES:
+        return load_examfile_contents_lazily(local_file_path)
+
+    return compile_examfile(local_file_path, source_key)
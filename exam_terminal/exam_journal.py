@@ -0,0 +1,264 @@
+"""Append-only write-ahead journal of a running exam, to resume it after a crash."""
+
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+from collections.abc import Iterable
+from time import monotonic, time
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:
+    # Windows, journals are not locked
+    fcntl = None
+
+logger = logging.getLogger()
+
+# Seconds between forcing journal records to disk, records in between are synced together
+DEFAULT_FSYNC_INTERVAL = 1.0
+
+# Seconds between journal records of the running exam time, bounds the exam time lost in a crash
+TICK_INTERVAL = 5.0
+
+
+def get_default_journal_dir() -> str:
+    """Get the default directory for exam journals.
+
+    Can be set with the EXAM_TERMINAL_JOURNAL_DIR environment variable.
+
+    Returns:
+        (str) : Journal directory path
+    """
+    if os.environ.get('EXAM_TERMINAL_JOURNAL_DIR'):
+        return os.environ['EXAM_TERMINAL_JOURNAL_DIR']
+    base_dir = os.environ.get('XDG_STATE_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'state')
+    return os.path.join(base_dir, 'exam-terminal', 'journal')
+
+
+def get_journal_path(exam_source: str, journal_dir: Optional[str] = None) -> str:
+    """Get the journal file path of an exam file. Each exam file has one journal, locked
+    by the exam session writing it.
+
+        Parameters:
+            exam_source (str) : Local exam file path or remote exam file URL
+            journal_dir (str) : Directory to keep journals in (default from get_default_journal_dir())
+
+        Returns:
+            (str) : Journal file path
+    """
+    key = hashlib.sha256(exam_source.encode('utf-8')).hexdigest()
+    return os.path.join(journal_dir or get_default_journal_dir(), f'{key}.journal')
+
+
+class ExamJournal:
+    """Appends exam events to a JSONL journal file from a background writer thread.
+
+    Appending only puts the event on a queue, it never waits for the disk. The
+    writer thread writes events as they come in and forces them to disk at
+    most once per fsync interval, or when the journal is closed.
+
+    The journal file is exclusively locked while open, so a second exam
+    session of the same exam file can not truncate or resume it.
+
+    Usage:
+        journal = ExamJournal(file_path)
+        journal.append('answer', question=3, exam_time=42.0)
+        journal.close()
+    """
+
+    def __init__(self, file_path: str, fsync_interval: float = DEFAULT_FSYNC_INTERVAL, truncate: bool = True) -> None:
+        """Object constructor method.
+
+        Parameters:
+            file_path (str)        : Path to the journal file
+            fsync_interval (float) : Seconds between forcing written events to disk
+            truncate (bool)        : If True, start a new journal, else append to the existing one
+        """
+        self.file_path = file_path
+        self.fsync_interval = fsync_interval
+
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Only truncated once locked, the journal may be of a running exam session
+        self._fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            if fcntl:
+                fcntl.flock(self._fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            if truncate:
+                os.ftruncate(self._fd, 0)
+        except OSError as e:
+            os.close(self._fd)
+            if isinstance(e, BlockingIOError):
+                raise BlockingIOError(f'Exam journal is in use by another exam session: {file_path}') from e
+            raise
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self.__write_events, args=(), daemon=True)
+        self._writer.start()
+
+    def append(self, event: str, **fields) -> None:
+        """Append an event to the journal without waiting for it to be written.
+
+        Parameters:
+            event (str) : Event name (ie. begin, answer, pause, resume)
+            fields      : Event details, must not be changed after appending
+        """
+        self._queue.put((event, time(), fields))
+
+    def close(self) -> None:
+        """Write and sync all appended events, then close the journal file."""
+        if self._fd is None:
+            return
+        self._queue.put(None)
+        self._writer.join()
+        # Closing releases the lock
+        os.close(self._fd)
+        self._fd = None
+
+    def remove(self) -> None:
+        """Close and delete the journal file, once there is nothing left to resume."""
+        self.close()
+        try:
+            os.remove(self.file_path)
+            logger.debug(f'Removed exam journal: {self.file_path}')
+        except OSError as e:
+            logger.debug(f'Failed to remove exam journal. Exception: {e}')
+
+    ###############################################################################################
+
+    def __write_events(self) -> None:
+        """Writer thread. Writes queued events in batches and syncs them to disk."""
+        last_fsync_time = monotonic()
+        unsynced = False
+        while True:
+            # Sleep until an event comes in, or until written events are due to be synced
+            try:
+                item = self._queue.get(
+                    timeout=max(last_fsync_time + self.fsync_interval - monotonic(), 0.0) if unsynced else None
+                )
+            except queue.Empty:
+                item = ()
+
+            # Take everything else already queued along
+            items = [item]
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            lines = [json.dumps({'event': entry[0], 'time': entry[1], **entry[2]}) + '\n' for entry in items if entry]
+            if lines:
+                try:
+                    os.write(self._fd, ''.join(lines).encode('utf-8'))
+                    unsynced = True
+                except OSError as e:
+                    logger.error(f'Failed to write exam journal "{self.file_path}". Exception: {e}')
+
+            closing = None in items
+            if unsynced and (closing or monotonic() - last_fsync_time >= self.fsync_interval):
+                try:
+                    os.fsync(self._fd)
+                except OSError as e:
+                    logger.debug(f'Failed to sync exam journal. Exception: {e}')
+                last_fsync_time = monotonic()
+                unsynced = False
+            if closing:
+                return
+
+
+def is_journal_locked(file_path: str) -> bool:
+    """Check if a journal file is open by a running exam session.
+
+    Parameters:
+        file_path (str) : Path to the journal file
+
+    Returns:
+        (bool) : True if another exam session holds the journal lock, else False
+    """
+    if not fcntl:
+        return False
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return False
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except BlockingIOError:
+        return True
+    except OSError:
+        return False
+    finally:
+        # Closing releases the lock, if it was taken
+        os.close(fd)
+    return False
+
+
+def load_journal(file_path: str) -> list:
+    """Load the events of a journal file.
+
+    A half written last line, as left by a crash, is skipped.
+
+    Parameters:
+        file_path (str) : Path to the journal file
+
+    Returns:
+        (list) : Journal events in the order they were appended, empty if there is no journal
+    """
+    events = []
+    try:
+        with open(file_path, encoding='utf-8') as file:
+            for line in file:
+                try:
+                    events.append(json.loads(line))
+                except ValueError:
+                    logger.debug(f'Skipping damaged exam journal line: {line!r}')
+    except OSError:
+        return []
+    return events
+
+
+def replay_journal(events: Iterable[dict]) -> Optional[dict]:
+    """Rebuild the progress and timers of an exam from its journal events.
+
+    Parameters:
+        events (iterable) : Journal events, from load_journal()
+
+    Returns:
+        (dict) : Exam state to resume from, None if there is no unfinished exam in the journal
+    """
+    state: Optional[dict] = None
+    for event in events:
+        name = event.get('event')
+        if name == 'begin':
+            state = {
+                'exam_title': event.get('exam_title'),
+                'questions_count': event.get('questions_count'),
+                'exam_attempt': event.get('exam_attempt', 0),
+                'begin_timestamp': event.get('begin_timestamp', event['time']),
+                'seed': event.get('seed'),
+                'exam_time': 0.0,
+                'paused_time': 0.0,
+                'paused_count': 0,
+                'answers': [],
+            }
+            continue
+        if state is None:
+            continue
+        if name == 'end':
+            state = None
+            continue
+
+        # Every event carries the exam time at that moment, the last one is as far as the exam got
+        state['exam_time'] = event.get('exam_time', state['exam_time'])
+        state['paused_time'] = event.get('paused_time', state['paused_time'])
+        if name == 'pause':
+            state['paused_count'] += 1
+        elif name == 'answer' and event.get('question') == len(state['answers']):
+            state['answers'].append(event)
+    return state
@@ -0,0 +1,226 @@
+"""Seeded drawing and shuffling of exam questions and selections, kept as index permutations."""
+
+import logging
+import random
+from array import array
+from collections.abc import Iterator, MutableMapping, Sequence
+from typing import Any, Optional, Union
+
+logger = logging.getLogger()
+
+# Seeds are drawn from this range when none is given, short enough to note down and pass to --seed
+SEED_RANGE = 2**32
+
+# Mixes the exam seed with a question index into the seed of its selection order
+_SELECTION_SEED_STRIDE = 1_000_003
+
+# Question keys holding one value per selection, or selection indexes, which a presented question reorders
+_SELECTION_LISTS = frozenset(('selection', 'question_answer_bool'))
+_SELECTION_INDEXES = frozenset(('question_answer_indexes', 'answered_indexes'))
+
+
+def new_seed() -> int:
+    """Get a random seed for an exam attempt that was not given one.
+
+    Returns:
+        (int) : Seed
+    """
+    return random.SystemRandom().randrange(SEED_RANGE)
+
+
+class ExamOrder:
+    """Questions drawn from the exam file question pool, and the selection order of each, for one exam attempt.
+
+    Only the drawn question indexes are kept, questions themselves are not
+    copied. Selection orders are worked out from the seed when a question is
+    presented. The same seed always gives the same exam.
+
+    Exam file settings, all optional:
+
+        exam:
+          exam_draw_questions: 50        # Ask this many questions of the pool (default all)
+          exam_shuffle_questions: true   # Ask questions in random order (default file order)
+          exam_shuffle_selections: true  # Show selections in random order (default file order)
+
+    Usage:
+        order = ExamOrder(len(questions), seed, draw_count=50, shuffle_selections=True)
+        questions = OrderedQuestions(questions, order)
+        presented = order.present(0, questions[0])
+    """
+
+    def __init__(
+        self,
+        pool_size: int,
+        seed: int,
+        draw_count: Optional[int] = None,
+        shuffle_questions: bool = False,
+        shuffle_selections: bool = False,
+    ) -> None:
+        """Object constructor method.
+
+        Parameters:
+            pool_size (int)           : Number of questions in the exam file
+            seed (int)                : Seed of the random draw and shuffles
+            draw_count (int)          : Number of questions to draw, None for all
+            shuffle_questions (bool)  : If True, drawn questions are asked in random order, else in file order
+            shuffle_selections (bool) : If True, selections are shown in random order
+        """
+        self.pool_size = pool_size
+        self.seed = seed
+        self.shuffle_questions = shuffle_questions
+        self.shuffle_selections = shuffle_selections
+
+        count = pool_size if draw_count is None else min(draw_count, pool_size)
+        self.question_indexes: Union[range, array]
+        if count == pool_size and not shuffle_questions:
+            self.question_indexes = range(pool_size)
+        else:
+            # Samples only as many indexes as drawn, the pool range is never built
+            indexes = random.Random(seed).sample(range(pool_size), count)
+            if not shuffle_questions:
+                indexes.sort()
+            self.question_indexes = array('I', indexes)
+
+    @classmethod
+    def from_exam_contents(cls, exam_contents: dict, seed: Optional[int] = None) -> Optional['ExamOrder']:
+        """Get the question order of an exam attempt from the exam file settings. Invalid settings are logged and ignored.
+
+        Parameters:
+            exam_contents (dict) : Loaded exam contents
+            seed (int)           : Seed of the attempt, None for a new random seed
+
+        Returns:
+            (ExamOrder) : Question order, None if the exam is asked as listed in the exam file
+        """
+        exam = exam_contents.get('exam', {})
+        draw_count = exam.get('exam_draw_questions')
+        if draw_count is not None and (type(draw_count) is not int or draw_count < 1):
+            logger.error(f'exam_draw_questions must be a whole number of at least one, got "{draw_count}"')
+            draw_count = None
+        shuffle_questions = exam.get('exam_shuffle_questions', False) is True
+        shuffle_selections = exam.get('exam_shuffle_selections', False) is True
+        if draw_count is None and not shuffle_questions and not shuffle_selections:
+            return None
+
+        if seed is None:
+            seed = new_seed()
+        order = cls(len(exam_contents['questions']), seed, draw_count, shuffle_questions, shuffle_selections)
+        logger.debug(f'Asking {len(order)} of {order.pool_size} questions with seed {seed}')
+        return order
+
+    def __len__(self) -> int:
+        """Number of questions asked."""
+        return len(self.question_indexes)
+
+    def __getitem__(self, position: int) -> int:
+        """Question index in the exam file of the question asked at a position."""
+        return self.question_indexes[position]
+
+    def selection_order(self, position: int, selection_count: int) -> Sequence[int]:
+        """Get the order selections of a question are shown in.
+
+        Parameters:
+            position (int)        : Position the question is asked at
+            selection_count (int) : Number of selections of the question
+
+        Returns:
+            (sequence) : Selection index in the exam file of each shown selection
+        """
+        if not self.shuffle_selections or selection_count < 2:
+            return range(selection_count)
+        order = list(range(selection_count))
+        random.Random(self.seed * _SELECTION_SEED_STRIDE + self.question_indexes[position]).shuffle(order)
+        return order
+
+    def present(self, position: int, question: MutableMapping) -> MutableMapping:
+        """Get a question as it is shown, with its selections in their shown order.
+
+        Parameters:
+            position (int)     : Position the question is asked at
+            question (mapping) : Question as listed in the exam file
+
+        Returns:
+            (mapping) : Question to show, answers set on it are kept in exam file order
+        """
+        if not self.shuffle_selections:
+            return question
+        return PresentedQuestion(question, self.selection_order(position, len(question['selection'])))
+
+
+class OrderedQuestions(Sequence):
+    """Questions of an exam attempt in the order they are asked, read from the exam file question pool.
+
+    Questions are those of the pool (ie. QuestionView or question dicts), so
+    answers set on them are kept with the pool in exam file selection order.
+    """
+
+    __slots__ = ('pool', 'order')
+
+    def __init__(self, pool: Sequence, order: ExamOrder) -> None:
+        """Object constructor method.
+
+        Parameters:
+            pool (sequence)   : All questions of the exam file
+            order (ExamOrder) : Questions drawn from the pool
+        """
+        self.pool = pool
+        self.order = order
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __getitem__(self, position: Union[int, slice]) -> Any:
+        if isinstance(position, slice):
+            return [self.pool[index] for index in self.order.question_indexes[position]]
+        return self.pool[self.order.question_indexes[position]]
+
+
+class PresentedQuestion(MutableMapping):
+    """Question with its selections in shown order, for the question screen.
+
+    Selection lists and selection indexes are read in shown order. Selected
+    indexes set on it ("answered_indexes") are stored in exam file order, so
+    grading and exported results do not depend on the shuffle.
+    """
+
+    __slots__ = ('question', 'order', 'positions')
+
+    def __init__(self, question: MutableMapping, order: Sequence[int]) -> None:
+        """Object constructor method.
+
+        Parameters:
+            question (mapping) : Question as listed in the exam file
+            order (sequence)   : Selection index in the exam file of each shown selection
+        """
+        self.question = question
+        self.order = order
+        self.positions = [0] * len(order)
+        for position, index in enumerate(order):
+            self.positions[index] = position
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.question[key]
+        if key in _SELECTION_LISTS:
+            return [value[index] for index in self.order]
+        if key in _SELECTION_INDEXES and value is not None:
+            return sorted(self.positions[index] for index in value)
+        return value
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key in _SELECTION_LISTS or key == 'question_answer_indexes':
+            raise TypeError(f'Question key "{key}" is derived from the exam file and can not be set')
+        if key == 'answered_indexes' and value is not None:
+            value = sorted(self.order[position] for position in value)
+        self.question[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self.question[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.question)
+
+    def __len__(self) -> int:
+        return len(self.question)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({dict(self.items())!r})'
@@ -0,0 +1,714 @@
+"""Exam server, one process serving many concurrent exam sessions over local sockets."""
+
+import asyncio
+import json
+import logging
+import os
+import signal
+import socket
+import stat
+from contextlib import suppress
+from datetime import datetime
+from itertools import count
+from time import time
+from typing import Callable, Optional
+
+from exam_terminal import utility
+from exam_terminal.analytics import append_attempt_record
+from exam_terminal.answer_evaluation import count_bits, selection_mask
+from exam_terminal.exam_order import ExamOrder, new_seed
+from exam_terminal.exam_timer import ExamTimer
+from exam_terminal.grading import ExamGrader, evaluate_score
+from exam_terminal.scoring import ExamScoring
+
+logger = logging.getLogger()
+
+# Unix socket the server listens on, unless a TCP port is given
+DEFAULT_SOCKET_PATH = 'exam-terminal.sock'
+
+# Longest accepted request line in bytes
+MAX_LINE_BYTES = 65536
+
+# Connections waiting to be accepted, many candidates tend to connect at the same moment
+LISTEN_BACKLOG = 1024
+
+# Requests a client can send
+COMMANDS = ('begin', 'answer', 'pause', 'resume', 'status', 'quit')
+
+# Question fields sent to clients, never the answers
+PUBLIC_QUESTION_FIELDS = (
+    'question_number',
+    'question',
+    'selection',
+    'question_multiselect',
+    'question_min_selection_count',
+    'question_allowed_time',
+)
+
+
+class ServedExam:
+    """An exam loaded and parsed once, shared read-only by all sessions of the server.
+
+    Questions are encoded for clients once, every session sends the same bytes,
+    unless the exam file shuffles selections.
+    """
+
+    def __init__(self, exam_contents: dict, seed: Optional[int] = None) -> None:
+        """Object constructor method.
+
+        Parameters:
+            exam_contents (dict) : Loaded exam contents
+            seed (int)           : Seed of the question draw and shuffles of every session, None for a random one each
+        """
+        exam = exam_contents['exam']
+        self.grader = ExamGrader(exam_contents)
+        self.title = exam.get('exam_title')
+        self.seed = seed
+
+        # Draw and shuffle settings of the exam file, each session draws its own questions
+        self.order = ExamOrder.from_exam_contents({'exam': exam, 'questions': self.grader.questions}, seed)
+        self.questions_count = len(self.order) if self.order else self.grader.questions_count
+        self.passing_score = self.grader.passing_score
+        self.allowed_time = exam.get('exam_allowed_seconds') or utility.to_seconds(
+            exam['exam_allowed_time'], exam['exam_allowed_time_units']
+        )
+
+        self.question_messages = [
+            json.dumps({field: question[field] for field in PUBLIC_QUESTION_FIELDS if field in question}).encode(
+                'utf-8'
+            )
+            for question in self.grader.questions
+        ]
+        self.exam_message = json.dumps(
+            {
+                'exam_title': self.title,
+                'exam_description': exam.get('exam_description'),
+                'exam_questions_count': self.questions_count,
+                'exam_allowed_time': self.allowed_time,
+                'exam_passing_score': self.passing_score,
+            }
+        ).encode('utf-8')
+
+    def new_order(self) -> Optional[ExamOrder]:
+        """Draw and shuffle the questions of a new session, as set in the exam file.
+
+        Returns:
+            (ExamOrder) : Questions asked, None if the exam is asked as listed in the exam file
+        """
+        if self.order is None:
+            return None
+        return ExamOrder(
+            self.order.pool_size,
+            new_seed() if self.seed is None else self.seed,
+            len(self.order),
+            self.order.shuffle_questions,
+            self.order.shuffle_selections,
+        )
+
+    def get_scoring(self, order: Optional[ExamOrder]) -> ExamScoring:
+        """Get the scoring settings of the questions of a session, by the position each question is asked at.
+
+        Parameters:
+            order (ExamOrder) : Questions asked, None if the exam is asked as listed in the exam file
+
+        Returns:
+            (ExamScoring) : Scoring settings, shared by all sessions unless questions are drawn or shuffled
+        """
+        scoring = self.grader.scoring
+        if order is None:
+            return scoring
+        asked = ExamScoring(scoring.rule_name, scoring.negative_marking)
+        for index in order.question_indexes:
+            asked.add_question(scoring.weights[index], scoring.sections[index])
+        return asked
+
+    def get_question_message(self, order: Optional[ExamOrder], position: int) -> bytes:
+        """Get the JSON encoded question asked at a position.
+
+        Parameters:
+            order (ExamOrder) : Questions asked, None if the exam is asked as listed in the exam file
+            position (int)    : Position the question is asked at
+
+        Returns:
+            (bytes) : JSON question, with its selections in their shown order
+        """
+        if order is None:
+            return self.question_messages[position]
+        if not order.shuffle_selections:
+            return self.question_messages[order[position]]
+        question = order.present(position, self.grader.questions[order[position]])
+        return json.dumps({field: question[field] for field in PUBLIC_QUESTION_FIELDS if field in question}).encode(
+            'utf-8'
+        )
+
+
+class ExamSession:
+    """State of one exam attempt on the server. Everything shared lives in the ServedExam.
+
+    Usage:
+        session = ExamSession(served_exam, session_id)
+        session.begin()
+        correct = session.answer([0, 2])
+        session.finish()
+        session.record
+    """
+
+    __slots__ = (
+        'served',
+        'session_id',
+        'order',
+        'timer',
+        'begin_timestamp',
+        'question_shown_time',
+        'answers',
+        'correct',
+        'answer_times',
+        'questions_correct',
+        'score',
+        'finished',
+        'record',
+    )
+
+    def __init__(self, served: ServedExam, session_id: str) -> None:
+        """Object constructor method.
+
+        Parameters:
+            served (ServedExam) : Exam served to this session
+            session_id (str)    : Unique identifier of this exam attempt
+        """
+        self.served = served
+        self.session_id = session_id
+        self.order = served.new_order()
+        self.timer = ExamTimer(served.allowed_time)
+        self.begin_timestamp = 0.0
+
+        # Exam time the current question was shown at, question allowed times do not count paused time
+        self.question_shown_time = 0.0
+
+        # Selected indexes (in exam file selection order), correctness and answer time of each answered question,
+        # in the order asked
+        self.answers: list = []
+        self.correct: list = []
+        self.answer_times: list = []
+        self.questions_correct = 0
+        self.score = served.get_scoring(self.order).new_score()
+        self.finished = False
+
+        # Attempt record, made once the exam is over
+        self.record: Optional[dict] = None
+
+    @property
+    def question_index(self) -> int:
+        """Number of the current question, starting at zero."""
+        return len(self.answers)
+
+    @property
+    def is_started(self) -> bool:
+        """True once the exam has begun."""
+        return self.begin_timestamp > 0.0
+
+    @property
+    def file_question_index(self) -> int:
+        """Index in the exam file of the current question."""
+        return self.order[self.question_index] if self.order else self.question_index
+
+    @property
+    def question_message(self) -> bytes:
+        """JSON encoded current question."""
+        return self.served.get_question_message(self.order, self.question_index)
+
+    def begin(self) -> None:
+        """Begin the exam. No watcher thread, the deadline is checked on each request."""
+        self.begin_timestamp = time()
+        self.timer.start(watcher=False)
+        self.question_shown_time = self.timer.elapsed_time
+
+    def is_question_time_out(self) -> bool:
+        """True if the allowed time of the current question is up. Checked on each request, like the exam deadline."""
+        allowed_time = self.served.grader.questions[self.file_question_index].get('question_allowed_time')
+        if not isinstance(allowed_time, int) or allowed_time < 1:
+            return False
+        return self.timer.elapsed_time - self.question_shown_time > allowed_time
+
+    def answer(self, selections: list) -> bool:
+        """Answer the current question and move on to the next one.
+
+        Parameters:
+            selections (list) : Selected selection indexes, in shown order
+
+        Returns:
+            (bool) : True if answered correctly, else False
+        """
+        now = self.timer.elapsed_time
+        grader = self.served.grader
+        index = self.file_question_index
+        if self.order:
+            shown_order = self.order.selection_order(self.question_index, grader.selection_counts[index])
+            selections = [shown_order[selection] for selection in selections]
+        correct = grader.grade_answer(index, selections)
+        self.score.add(
+            self.question_index if self.order else index,
+            selection_mask(selections, grader.selection_counts[index]),
+            grader.answer_masks[index],
+        )
+        self.answers.append(sorted(selections))
+        self.correct.append(correct)
+        self.answer_times.append(round(now - self.question_shown_time, 3))
+        self.questions_correct += correct
+        self.question_shown_time = now
+        if self.question_index >= self.served.questions_count:
+            self.finish()
+        return correct
+
+    def finish(self) -> None:
+        """End the exam and make its attempt record, unanswered questions count as wrong."""
+        if not self.finished:
+            self.finished = True
+            self.timer.stop()
+            self.record = self.get_attempt_record()
+
+    def get_status(self) -> dict:
+        """Progress and timers of the exam.
+
+        Returns:
+            (dict) : Current question, exam time used and left, running score, and if paused or finished
+        """
+        return {
+            'question_index': self.question_index,
+            'questions_count': self.served.questions_count,
+            'exam_time': round(self.timer.elapsed_time, 3),
+            'remaining_time': round(self.timer.remaining_time, 3),
+            'paused': self.timer.is_paused,
+            'score_percent': round(self.score.percent, 3),
+            'finished': self.finished,
+        }
+
+    def get_attempt_record(self) -> dict:
+        """Get the record of this exam attempt, in the same form as the interactive exam saves.
+
+        Returns:
+            (dict) : Selected indexes, correctness and answer time of each question, and the exam result
+        """
+        questions_count = self.served.questions_count
+        missing = [None] * (questions_count - len(self.answers))
+        record = {
+            'id': self.session_id,
+            'exam_title': self.served.title,
+            'exam_attempt': 0,
+            'begin_timestamp': self.begin_timestamp,
+            'end_timestamp': time(),
+            'elapsed_time': round(self.timer.elapsed_time, 3),
+            'answers': self.answers + missing,
+            'correct': self.correct + [False] * len(missing),
+            'answer_times': self.answer_times + missing,
+            'questions_correct': self.questions_correct,
+            **evaluate_score(self.score.points, self.score.scoring.max_points, self.served.passing_score),
+        }
+        if self.order:
+            # Answers are in the order asked, each with the exam file index of its question
+            record['seed'] = self.order.seed
+            record['question_indexes'] = list(self.order.question_indexes)
+        return record
+
+
+class ExamServer:
+    """Serves one exam to many concurrent sessions from a single asyncio event loop.
+
+    Clients send one JSON request per line and get one JSON response per line:
+
+        {"command": "begin"}
+        {"command": "answer", "selections": [0, 2]}
+        {"command": "pause"} / {"command": "resume"} / {"command": "status"} / {"command": "quit"}
+
+    Responses have "ok", the session "status", and the next "question" or
+    the final "result" once the exam is over, or an "error" message.
+
+    Usage:
+        server = ExamServer(exam_contents, attempts_file='attempts.jsonl')
+        asyncio.run(server.serve(socket_path='exam-terminal.sock'))
+    """
+
+    def __init__(self, exam_contents: dict, attempts_file: Optional[str] = None, seed: Optional[int] = None) -> None:
+        """Object constructor method.
+
+        Parameters:
+            exam_contents (dict) : Loaded exam contents
+            attempts_file (str)  : JSONL file to append a record of each finished exam attempt to, if any
+            seed (int)           : Seed of the question draw and shuffles of every session, None for a random one each
+        """
+        self.served = ServedExam(exam_contents, seed)
+        self.attempts_file = attempts_file
+        self.sessions_active = 0
+        self.sessions_finished = 0
+
+        self.__session_numbers = count()
+        self.__commands: dict[str, Callable[[ExamSession, dict], Optional[str]]] = {
+            'begin': self.__begin,
+            'answer': self.__answer,
+            'pause': self.__pause,
+            'resume': self.__resume,
+            'status': self.__status,
+            'quit': self.__quit,
+        }
+        self.__server_begin = datetime.now().strftime('%Y%m%d-%H%M%S')
+
+    async def serve(
+        self, socket_path: Optional[str] = None, host: str = '127.0.0.1', port: Optional[int] = None
+    ) -> None:
+        """Serve exam sessions until cancelled.
+
+        Parameters:
+            socket_path (str) : Unix socket to listen on (default DEFAULT_SOCKET_PATH)
+            host (str)        : Host to listen on, if serving over TCP
+            port (int)        : TCP port to listen on instead of a Unix socket
+        """
+        if port:
+            server = await asyncio.start_server(
+                self.handle_session, host, port, limit=MAX_LINE_BYTES, backlog=LISTEN_BACKLOG
+            )
+            logger.info(f'Serving exam "{self.served.title}" on {host}:{port}')
+        else:
+            socket_path = socket_path or DEFAULT_SOCKET_PATH
+            remove_stale_socket(socket_path)
+            server = await asyncio.start_unix_server(
+                self.handle_session, socket_path, limit=MAX_LINE_BYTES, backlog=LISTEN_BACKLOG
+            )
+            logger.info(f'Serving exam "{self.served.title}" on {socket_path}')
+
+        # Stop on SIGTERM as on CTRL-C, so the socket is removed
+        stopped = asyncio.get_running_loop().create_future()
+        with suppress(NotImplementedError, AttributeError):
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stopped.set_result, None)
+
+        try:
+            await stopped
+        finally:
+            server.close()
+            if not port and os.path.exists(socket_path):
+                os.remove(socket_path)
+
+    async def handle_session(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Run one exam session for a connected client.
+
+        Parameters:
+            reader (StreamReader) : Client requests
+            writer (StreamWriter) : Client responses
+        """
+        session_id = f'{self.__server_begin}-{os.getpid()}-{next(self.__session_numbers)}'
+        session = ExamSession(self.served, session_id)
+        self.sessions_active += 1
+        logger.debug(f'Exam session {session_id} connected')
+        try:
+            writer.write(b'{"ok": true, "exam": ' + self.served.exam_message + b'}\n')
+            while not writer.is_closing():
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    writer.write(self.__error('Request line too long'))
+                    break
+                if not line:
+                    break
+                writer.write(await self.handle_request(session, line))
+                await writer.drain()
+        except ConnectionError as e:
+            logger.debug(f'Exam session {session_id} connection lost. Exception: {e}')
+        finally:
+            self.sessions_active -= 1
+            if session.is_started and not session.finished:
+                logger.info(f'Exam session {session_id} disconnected before finishing')
+            writer.close()
+
+    async def handle_request(self, session: ExamSession, line: bytes) -> bytes:
+        """Handle one request line of a session.
+
+        Parameters:
+            session (ExamSession) : Session of the client
+            line (bytes)          : JSON request line
+
+        Returns:
+            (bytes) : JSON response line
+        """
+        try:
+            request = json.loads(line)
+            command = request['command']
+        except (ValueError, TypeError, KeyError):
+            command = None
+        if command not in COMMANDS:
+            return self.__error(f'Not a valid request: {line[:80]!r}')
+
+        # Exam time may have run out since the last request
+        if session.is_started and not session.finished and session.timer.poll():
+            await self.__finish(session)
+            return self.__respond(session, error='Exam time has expired')
+
+        # So may the time of the current question, which then counts as not answered. The request is not run,
+        # it was meant for the question that timed out
+        if session.is_started and not session.finished and session.is_question_time_out():
+            session.answer([])
+            if session.finished:
+                await self.__finish(session)
+            return self.__respond(session, error='Question time has expired')
+
+        was_finished = session.finished
+        error = self.__run_command(session, command, request)
+        if session.finished and not was_finished:
+            await self.__finish(session)
+        return self.__respond(session, error=error)
+
+    ###############################################################################################
+
+    def __run_command(self, session: ExamSession, command: str, request: dict) -> Optional[str]:
+        """Run a request command on a session.
+
+        Parameters:
+            session (ExamSession) : Session of the client
+            command (str)         : One of COMMANDS
+            request (dict)        : Request with the command arguments
+
+        Returns:
+            (str) : Error message if the command can not be run now, else None
+        """
+        return self.__commands[command](session, request)
+
+    def __begin(self, session: ExamSession, request: dict) -> Optional[str]:
+        """Begin the exam of a session."""
+        if session.is_started:
+            return 'Exam has already begun'
+        session.begin()
+        return None
+
+    def __answer(self, session: ExamSession, request: dict) -> Optional[str]:
+        """Answer the current question of a session with the request selections."""
+        if not session.is_started or session.finished:
+            return 'Exam is not in progress'
+        if session.timer.is_paused:
+            return 'Exam is paused'
+        selections = request.get('selections')
+        error = self.__check_selections(session.file_question_index, selections)
+        if error:
+            return error
+        session.answer(selections)
+        return None
+
+    def __check_selections(self, index: int, selections: object) -> Optional[str]:
+        """Check answer selections as the interactive exam takes them: as many distinct
+        selections as the question has correct answers, at least one.
+
+        Parameters:
+            index (int)       : Index of the answered question
+            selections (list) : Selected selection indexes of the request
+
+        Returns:
+            (str) : Error message if the selections are not a valid answer, else None
+        """
+        if not isinstance(selections, list) or not selections:
+            return 'No selections given'
+        selection_count = self.served.grader.selection_counts[index]
+        if not all(isinstance(s, int) and not isinstance(s, bool) and 0 <= s < selection_count for s in selections):
+            return f'Selections must be between 0 and {selection_count - 1}'
+        if len(set(selections)) != len(selections):
+            return 'Selections must not repeat'
+        pick_count = max(count_bits(self.served.grader.answer_masks[index]), 1)
+        if len(selections) != pick_count:
+            return f'Pick {pick_count} selections' if pick_count > 1 else 'Pick one selection'
+        return None
+
+    def __pause(self, session: ExamSession, request: dict) -> Optional[str]:
+        """Pause the exam timer of a session."""
+        session.timer.pause()
+        return None
+
+    def __resume(self, session: ExamSession, request: dict) -> Optional[str]:
+        """Resume the exam timer of a session."""
+        session.timer.resume()
+        return None
+
+    def __status(self, session: ExamSession, request: dict) -> Optional[str]:
+        """Nothing to run, the response carries the session status."""
+        return None
+
+    def __quit(self, session: ExamSession, request: dict) -> Optional[str]:
+        """End the exam of a session."""
+        if not session.is_started:
+            return 'Exam has not begun'
+        session.finish()
+        return None
+
+    async def __finish(self, session: ExamSession) -> None:
+        """End a session and keep its attempt record, without blocking other sessions."""
+        session.finish()
+        self.sessions_finished += 1
+        if self.attempts_file:
+            try:
+                await asyncio.to_thread(append_attempt_record, self.attempts_file, session.record)
+            except OSError as e:
+                logger.error(f'Failed to save exam attempt record to "{self.attempts_file}". Exception: {e}')
+
+    ###############################################################################################
+
+    def __respond(self, session: ExamSession, error: Optional[str] = None) -> bytes:
+        """Assemble a response line with the session status, and the current question or final result."""
+        response = {'ok': error is None, 'status': session.get_status()}
+        if error:
+            response['error'] = error
+        if session.finished:
+            response['result'] = session.record
+            return json.dumps(response).encode('utf-8') + b'\n'
+
+        # Pre-encoded question, the same bytes for every session
+        head = json.dumps(response).encode('utf-8')[:-1]
+        if not session.is_started:
+            return head + b'}\n'
+        return head + b', "question": ' + session.question_message + b'}\n'
+
+    @staticmethod
+    def __error(message: str) -> bytes:
+        """Assemble an error response line."""
+        return json.dumps({'ok': False, 'error': message}).encode('utf-8') + b'\n'
+
+
+def remove_stale_socket(socket_path: str) -> None:
+    """Remove a Unix socket left behind by a server that is no longer running.
+
+    Parameters:
+        socket_path (str) : Unix socket path
+
+    Raises:
+        OSError : If the path is not a socket, or a server is still listening on it
+    """
+    try:
+        if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            raise OSError(f'Not a Unix socket: {socket_path}')
+    except FileNotFoundError:
+        return
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            logger.debug(f'Removing stale exam server socket: {socket_path}')
+            os.remove(socket_path)
+            return
+    raise OSError(f'An exam server is already listening on: {socket_path}')
+
+
+def serve_exam(
+    exam_contents: dict,
+    socket_path: Optional[str] = None,
+    host: str = '127.0.0.1',
+    port: Optional[int] = None,
+    attempts_file: Optional[str] = None,
+    seed: Optional[int] = None,
+) -> None:
+    """Serve an exam to many concurrent sessions until interrupted.
+
+    Parameters:
+        exam_contents (dict) : Loaded exam contents
+        socket_path (str)    : Unix socket to listen on (default DEFAULT_SOCKET_PATH)
+        host (str)           : Host to listen on, if serving over TCP
+        port (int)           : TCP port to listen on instead of a Unix socket
+        attempts_file (str)  : JSONL file to append a record of each finished exam attempt to, if any
+        seed (int)           : Seed of the question draw and shuffles of every session, None for a random one each
+    """
+    server = ExamServer(exam_contents, attempts_file, seed)
+    try:
+        asyncio.run(server.serve(socket_path, host, port))
+    except KeyboardInterrupt:
+        pass
+    logger.info(f'Exam server stopped, {server.sessions_finished} exams finished')
+
+
+###############################################################################################
+
+
+def connect_socket(
+    socket_path: Optional[str] = None, host: str = '127.0.0.1', port: Optional[int] = None
+) -> socket.socket:
+    """Connect to an exam server.
+
+    Parameters:
+        socket_path (str) : Unix socket of the server (default DEFAULT_SOCKET_PATH)
+        host (str)        : Host of the server, if connecting over TCP
+        port (int)        : TCP port of the server instead of a Unix socket
+
+    Returns:
+        (socket) : Connected socket
+    """
+    if port:
+        return socket.create_connection((host, port))
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.connect(socket_path or DEFAULT_SOCKET_PATH)
+    return client
+
+
+def run_text_client(
+    connection: socket.socket, read_input: Callable[[str], str] = input, write_output: Callable[[str], None] = print
+) -> Optional[dict]:
+    """Take an exam from an exam server in plain line mode, for any terminal.
+
+    Selections are entered by number, several separated by commas. "p" pauses,
+    "r" resumes, "q" ends the exam.
+
+    Parameters:
+        connection (socket)    : Socket connected to the exam server
+        read_input (callable)  : Prompts for and returns one line of user input
+        write_output (callable): Writes one line of text for the user
+
+    Returns:
+        (dict) : Exam result, None if the connection was closed before the exam ended
+    """
+    with connection.makefile('rb') as responses:
+
+        def request(message: dict) -> dict:
+            connection.sendall(json.dumps(message).encode('utf-8') + b'\n')
+            line = responses.readline()
+            if not line:
+                raise ConnectionError('Exam server closed the connection')
+            return json.loads(line)
+
+        exam = json.loads(responses.readline())['exam']
+        write_output(exam['exam_title'])
+        write_output(
+            f'{exam["exam_questions_count"]} questions, {exam["exam_allowed_time"]} seconds, passing score {exam["exam_passing_score"]} %'
+        )
+        read_input('Press ENTER to begin the exam ')
+
+        response = request({'command': 'begin'})
+        while 'result' not in response:
+            if response.get('error'):
+                write_output(f'! {response["error"]}')
+            status = response['status']
+            question = response['question']
+            write_output('')
+            write_output(
+                f'[ {status["question_index"] + 1} / {status["questions_count"]} ]  [ {status["exam_time"]:.0f}s / {status["exam_time"] + status["remaining_time"]:.0f}s ]'
+            )
+            write_output(question['question'])
+            for index, selection in enumerate(question['selection']):
+                write_output(f'  {index + 1}) {selection}')
+
+            text = (
+                read_input(
+                    f'Pick {question["question_min_selection_count"]} > ' if question['question_multiselect'] else '> '
+                )
+                .strip()
+                .lower()
+            )
+            if text in ('p', 'r', 'q'):
+                response = request({'command': {'p': 'pause', 'r': 'resume', 'q': 'quit'}[text]})
+                continue
+            try:
+                selections = [int(part) - 1 for part in text.replace(' ', ',').split(',') if part]
+            except ValueError:
+                write_output('! Enter the selection number, several separated by commas')
+                continue
+            response = request({'command': 'answer', 'selections': selections})
+
+        result = response['result']
+        if response.get('error'):
+            write_output(f'! {response["error"]}')
+        write_output('')
+        write_output(
+            f'{result["questions_correct"]} of {len(result["answers"])} correct, {result["evaluation_percent"]:.1f} %, {result["evaluation_label"]}'
+        )
+        return result
@@ -2,18 +2,34 @@
 
 import logging
 import os
+import signal
+import sys
+from typing import Optional
 
 from . import ExamTerminal
+from .screen_manager import ScreenManager
 
 logger = logging.getLogger()
 
 
-def exam_terminal(exam_file_contents: dict) -> int:
+def exam_terminal(
+    exam_file_contents: dict,
+    attempts_file: Optional[str] = None,
+    results_format: str = 'pdf',
+    journal_path: Optional[str] = None,
+    resume: bool = False,
+    seed: Optional[int] = None,
+) -> int:
     """
     Beginning of program. Called from __main__.py
 
     Parameters:
         exam_file_contents (dict): Pre-loaded exam contents
+        attempts_file (str)      : JSONL file to append a record of each exam attempt to, if any
+        results_format (str)     : Default format to save exam results in (pdf, json, jsonl, csv)
+        journal_path (str)       : Journal file to auto save exam progress to, if any
+        resume (bool)            : If True, continue the unfinished exam in the journal file
+        seed (int)               : Seed of the question draw and shuffles of every attempt, None for random ones
     Returns:
         exit code (int): Program exit code
 
@@ -21,6 +37,44 @@ def exam_terminal(exam_file_contents: dict) -> int:
     current_working_dir = os.getcwd()
     logger.debug(f'Current directory: {current_working_dir}')
 
+    # A closed terminal (ie. dropped SSH session) exits normally, so the exam journal is flushed
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, exit_on_hangup)
+
+    # One curses screen session for all menus, questions, and results
+    screen = ScreenManager()
+    return screen.run(exam_session, exam_file_contents, attempts_file, results_format, journal_path, resume, seed)
+
+
+def exit_on_hangup(signal_number: int, frame) -> None:
+    """Signal handler, exit the program when the terminal hangs up."""
+    logger.debug(f'Received signal {signal_number}, exiting ...')
+    sys.exit(1)
+
+
+def exam_session(
+    screen: ScreenManager,
+    exam_file_contents: dict,
+    attempts_file: Optional[str] = None,
+    results_format: str = 'pdf',
+    journal_path: Optional[str] = None,
+    resume: bool = False,
+    seed: Optional[int] = None,
+) -> int:
+    """Run menus, exam attempts, and results within an open screen session.
+
+    Parameters:
+        screen (ScreenManager)   : Open curses screen session
+        exam_file_contents (dict): Pre-loaded exam contents
+        attempts_file (str)      : JSONL file to append a record of each exam attempt to, if any
+        results_format (str)     : Default format to save exam results in (pdf, json, jsonl, csv)
+        journal_path (str)       : Journal file to auto save exam progress to, if any
+        resume (bool)            : If True, continue the unfinished exam in the journal file
+        seed (int)               : Seed of the question draw and shuffles of every attempt, None for random ones
+    Returns:
+        exit code (int): Program exit code
+
+    """
     # TODO: Smarter menu navigation
 
     # Number of attempts
@@ -28,7 +82,17 @@ def exam_terminal(exam_file_contents: dict) -> int:
 
     while True:
         # Create the exam object and loading the exam file
-        exam = ExamTerminal.ExamTerminal(exam_file_contents, exam_attempt)
+        # Only the first attempt can continue an interrupted exam
+        exam = ExamTerminal.ExamTerminal(
+            exam_file_contents,
+            exam_attempt,
+            screen,
+            attempts_file,
+            results_format,
+            journal_path,
+            resume and not exam_attempt,
+            seed,
+        )
 
         # Show the intro
         main_menu_selection = exam.show_menu()
@@ -40,9 +104,10 @@ def exam_terminal(exam_file_contents: dict) -> int:
             # Show exam results
             result_menu_selection = exam.show_result()
 
-            # If selected export the results to pdf
+            # If selected export the results in the selected format
             if result_menu_selection[0] == 'save':
-                exam.export_results_to_pdf()
+                exam.export_results()
+                results_format = exam.results_format
                 break
             elif result_menu_selection[0] == 'menu':
                 pass
@@ -0,0 +1,207 @@
+"""Deadline based exam timer."""
+
+import logging
+import threading
+from time import monotonic
+from typing import Callable, Optional
+
+logger = logging.getLogger()
+
+
+class ExamTimer:
+    """Keeps track of elapsed exam time, paused time, and the exam deadline.
+
+    All times are computed on demand from a monotonic clock. An optional
+    watcher thread sleeps on a condition variable and only wakes up at
+    pause/resume/stop transitions or when the exam deadline is reached.
+
+    Usage:
+        timer = ExamTimer(allowed_time=120, on_timeout=callback)
+        timer.start()
+        timer.pause()
+        timer.resume()
+        timer.elapsed_time
+        timer.stop()
+    """
+
+    def __init__(
+        self,
+        allowed_time: float,
+        clock: Callable[[], float] = monotonic,
+        on_timeout: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Object constructor method.
+
+        Parameters:
+            allowed_time (float) : Allowed exam time in seconds
+            clock (callable)     : Clock returning seconds, must never go backwards (default time.monotonic)
+            on_timeout (callable): Called once from the watcher thread when the exam time is up
+        """
+        self.allowed_time = allowed_time
+        self.clock = clock
+        self.on_timeout = on_timeout
+
+        self.paused_count = 0
+
+        self._condition = threading.Condition()
+        self._watcher: Optional[threading.Thread] = None
+
+        self._begin_time: Optional[float] = None
+        self._end_time: Optional[float] = None
+        self._pause_begin_time: Optional[float] = None
+        self._paused_total = 0.0
+        self._time_out = False
+
+    ###############################################################################################
+
+    def start(self, watcher: bool = True, elapsed_time: float = 0.0, paused_time: float = 0.0) -> None:
+        """Start the exam timer, optionally continuing from an earlier run of the same exam.
+
+        Parameters:
+            watcher (bool)       : If True, start a thread that waits for the exam deadline
+            elapsed_time (float) : Seconds of exam time already used
+            paused_time (float)  : Seconds the exam already spent paused
+        """
+        with self._condition:
+            self._begin_time = self.clock() - elapsed_time - paused_time
+            self._end_time = None
+            self._pause_begin_time = None
+            self._paused_total = paused_time
+            self._time_out = False
+
+        if watcher:
+            self._watcher = threading.Thread(target=self.__watch_deadline, args=(), daemon=True)
+            self._watcher.start()
+
+    def stop(self) -> None:
+        """Stop the exam timer and freeze all elapsed times."""
+        with self._condition:
+            self.__stop(self.clock())
+            self._condition.notify_all()
+
+        if self._watcher and self._watcher is not threading.current_thread():
+            self._watcher.join()
+        self._watcher = None
+
+    def pause(self) -> None:
+        """Pause the exam timer. Pausing an already paused timer does nothing."""
+        with self._condition:
+            if not self.is_running or self._pause_begin_time is not None:
+                return
+            self._pause_begin_time = self.clock()
+            self.paused_count += 1
+            self._condition.notify_all()
+
+    def resume(self) -> None:
+        """Resume the paused exam timer. Resuming a running timer does nothing."""
+        with self._condition:
+            if not self.is_running or self._pause_begin_time is None:
+                return
+            self._paused_total += self.clock() - self._pause_begin_time
+            self._pause_begin_time = None
+            self._condition.notify_all()
+
+    def poll(self) -> bool:
+        """Check the exam deadline right now, without waiting for the watcher thread.
+
+        Returns:
+            (bool) : True if exam time is up, else False
+        """
+        with self._condition:
+            return self.__check_deadline()
+
+    ###############################################################################################
+
+    @property
+    def is_running(self) -> bool:
+        """True if the timer was started and not yet stopped or timed out."""
+        return self._begin_time is not None and self._end_time is None
+
+    @property
+    def is_paused(self) -> bool:
+        """True if the timer is currently paused."""
+        return self._pause_begin_time is not None
+
+    @property
+    def is_time_out(self) -> bool:
+        """True if the exam time is up."""
+        return self.poll()
+
+    @property
+    def global_elapsed_time(self) -> float:
+        """Seconds since start of exam, including paused time."""
+        if self._begin_time is None:
+            return 0.0
+        now = self._end_time if self._end_time is not None else self.clock()
+        return now - self._begin_time
+
+    @property
+    def paused_elapsed_time(self) -> float:
+        """Seconds the exam has spent paused."""
+        paused_total = self._paused_total
+        if self._pause_begin_time is not None:
+            now = self._end_time if self._end_time is not None else self.clock()
+            paused_total += now - self._pause_begin_time
+        return paused_total
+
+    @property
+    def elapsed_time(self) -> float:
+        """Seconds of exam time used, not counting paused time."""
+        if self.poll():
+            return self.allowed_time
+        return self.global_elapsed_time - self.paused_elapsed_time
+
+    @property
+    def remaining_time(self) -> float:
+        """Seconds of exam time left before the deadline."""
+        return max(self.allowed_time - self.elapsed_time, 0.0)
+
+    ###############################################################################################
+
+    def __stop(self, now: float) -> None:
+        """Freeze the timer at the given clock time. Caller must hold the condition lock."""
+        if not self.is_running:
+            return
+        if self._pause_begin_time is not None:
+            self._paused_total += now - self._pause_begin_time
+            self._pause_begin_time = None
+        self._end_time = now
+
+    def __check_deadline(self) -> bool:
+        """Evaluate if exam deadline has passed. Caller must hold the condition lock.
+
+        Returns:
+            (bool) : True if exam time is up, else False
+        """
+        if self._time_out:
+            return True
+        if not self.is_running or self._pause_begin_time is not None:
+            return False
+
+        # Deadline in clock time, moved back by all time spent paused
+        deadline = self._begin_time + self._paused_total + self.allowed_time
+        if self.clock() > deadline:
+            logger.debug('Exam timer deadline reached')
+            self._time_out = True
+            self.__stop(deadline)
+            self._condition.notify_all()
+        return self._time_out
+
+    def __watch_deadline(self) -> None:
+        """Watcher thread. Sleeps until the next deadline or state transition."""
+        logger.debug('Starting exam timer watcher thread ...')
+        with self._condition:
+            while self.is_running:
+                if self.__check_deadline():
+                    break
+                if self._pause_begin_time is not None:
+                    # Nothing can time out while paused, wait for resume or stop
+                    self._condition.wait()
+                else:
+                    deadline = self._begin_time + self._paused_total + self.allowed_time
+                    self._condition.wait(timeout=max(deadline - self.clock(), 0.0) + 0.001)
+            time_out = self._time_out
+
+        if time_out and self.on_timeout:
+            self.on_timeout()
+        logger.debug('Exam timer watcher thread ended')
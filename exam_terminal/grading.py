@@ -0,0 +1,299 @@
+"""Headless exam grading, independent of the interactive curses exam."""
+
+import json
+import logging
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any, Optional, TextIO
+
+from exam_terminal.answer_evaluation import indexes_to_mask, is_correct, selection_mask
+from exam_terminal.question_bank import parse_question
+from exam_terminal.scoring import ExamScore, ExamScoring
+
+logger = logging.getLogger()
+
+# Number of answer sheets graded together
+DEFAULT_BATCH_SIZE = 1024
+
+
+def evaluate_score(questions_correct: float, questions_count: float, passing_score: float) -> dict:
+    """Evaluate an exam score against the exam passing score.
+
+    Parameters:
+        questions_correct (float) : Number of correctly answered questions, or points scored
+        questions_count (float)   : Total number of questions, or highest possible points
+        passing_score (float)     : Passing score in percent
+
+    Returns:
+        (dict) : evaluation_percent, evaluation_label ("PASSED" or "FAILED"), and evaluation_bool
+    """
+    evaluation_percent = (questions_correct / questions_count) * 100 if questions_count else 0.0
+    evaluation_bool = evaluation_percent >= passing_score
+    return {
+        'evaluation_percent': evaluation_percent,
+        'evaluation_label': 'PASSED' if evaluation_bool else 'FAILED',
+        'evaluation_bool': evaluation_bool,
+    }
+
+
+class ExamGrader:
+    """Grades answer sheets against a parsed exam.
+
+    An answer sheet is a dict with an identifier and the selected selection
+    indexes of each question, either as a list in question order or a dict
+    keyed by question number. Unanswered questions are null or left out.
+
+        {"id": "student-1", "answers": [[0], [0, 4, 5], null, [1]]}
+        {"id": "student-2", "answers": {"0": [0], "3": [1]}}
+
+    Usage:
+        grader = ExamGrader(exam_contents)
+        for result in grader.grade_sheets(sheets):
+            print(result['evaluation_label'])
+    """
+
+    def __init__(self, exam_contents: dict) -> None:
+        """Object constructor method.
+
+        Parameters:
+            exam_contents (dict) : Loaded exam contents, questions are parsed if needed
+        """
+        self.questions = [parse_question(question, index) for index, question in enumerate(exam_contents['questions'])]
+        self.questions_count = len(self.questions)
+        self.passing_score = exam_contents['exam']['exam_passing_score']
+        self.answer_masks = [indexes_to_mask(question['question_answer_indexes']) for question in self.questions]
+        self.selection_counts = [len(question['selection']) for question in self.questions]
+        self.scoring = ExamScoring.from_exam_contents(exam_contents, self.questions)
+
+    def get_answers(self, sheet: dict) -> list:
+        """Get the selected indexes of every question of an answer sheet, in question order.
+
+        Parameters:
+            sheet (dict) : Answer sheet
+
+        Returns:
+            (list) : Selected selection indexes for each question, None if not answered
+        """
+        answers = sheet.get('answers') or []
+        if isinstance(answers, dict):
+            return [answers.get(str(index), answers.get(index)) for index in range(self.questions_count)]
+        return list(answers[: self.questions_count]) + [None] * (self.questions_count - len(answers))
+
+    def grade_answer(self, index: int, answered_indexes: Optional[Iterable[int]]) -> bool:
+        """Check if the selected answers of one question are correct.
+
+        An answer is correct if exactly all correct selections were selected.
+
+        Parameters:
+            index (int)             : Question index
+            answered_indexes (list) : Indexes of the selected selections, None if not answered
+
+        Returns:
+            (bool) : True if correct, else False
+        """
+        if answered_indexes is None:
+            return False
+        selected_mask = selection_mask(answered_indexes, self.selection_counts[index])
+        return selected_mask is not None and is_correct(selected_mask, self.answer_masks[index])
+
+    def __make_result(self, sheet: dict, questions_correct: int, score: Optional[ExamScore] = None) -> dict:
+        """Assemble the grading result of one answer sheet. A score is only listed if it is not just the correct answers."""
+        result = {
+            'id': sheet.get('id'),
+            'questions_correct': questions_correct,
+            'questions_count': self.questions_count,
+        }
+        if score is None:
+            result.update(evaluate_score(questions_correct, self.questions_count, self.passing_score))
+        else:
+            result['score'] = score.get_summary()
+            result.update(evaluate_score(score.points, self.scoring.max_points, self.passing_score))
+        return result
+
+    def grade_sheet(self, sheet: dict) -> dict:
+        """Grade a single answer sheet.
+
+        Parameters:
+            sheet (dict) : Answer sheet
+
+        Returns:
+            (dict) : Sheet id, questions_correct, questions_count, and evaluation
+        """
+        questions_correct = 0
+        if self.scoring.is_default:
+            for answered, selection_count, answer_mask in zip(
+                self.get_answers(sheet), self.selection_counts, self.answer_masks
+            ):
+                if answered is not None:
+                    selected_mask = selection_mask(answered, selection_count)
+                    questions_correct += selected_mask is not None and is_correct(selected_mask, answer_mask)
+            return self.__make_result(sheet, questions_correct)
+
+        score = self.scoring.new_score()
+        for index, answered in enumerate(self.get_answers(sheet)):
+            if answered is not None:
+                selected_mask = selection_mask(answered, self.selection_counts[index])
+                questions_correct += selected_mask is not None and is_correct(selected_mask, self.answer_masks[index])
+                score.add(index, selected_mask, self.answer_masks[index])
+        return self.__make_result(sheet, questions_correct, score)
+
+    def grade_batch(self, sheets: list) -> list:
+        """Grade a list of answer sheets, one after another.
+
+        Parameters:
+            sheets (list) : Answer sheets
+
+        Returns:
+            (list) : Grading result of each sheet, in the same order
+        """
+        return [self.grade_sheet(sheet) for sheet in sheets]
+
+    def grade_sheets(self, sheets: Iterable[dict], batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[dict]:
+        """Grade a stream of answer sheets in batches.
+
+        Parameters:
+            sheets (iterable) : Answer sheets
+            batch_size (int)  : Number of sheets graded together
+
+        Returns:
+            (iterator) : Grading result of each sheet, in the same order
+        """
+        sheets = iter(sheets)
+        while True:
+            batch = list(islice(sheets, batch_size))
+            if not batch:
+                return
+            yield from self.grade_batch(batch)
+
+
+def read_answer_sheets(file: Iterable[str], first_line_number: int = 1) -> Iterator[dict]:
+    """Read answer sheets from a JSONL file, one JSON answer sheet per line.
+
+    Lines that are not valid JSON, or not a JSON object, are logged and skipped.
+
+    Parameters:
+        file (obj)              : Open text file, or any lines of text
+        first_line_number (int) : Line number of the first line, for logging
+
+    Returns:
+        (iterator) : Answer sheets
+    """
+    for line_number, line in enumerate(file, start=first_line_number):
+        text = line.strip()
+        if not text:
+            continue
+        try:
+            sheet = json.loads(text)
+        except ValueError as e:
+            logger.error(f'Skipping answer sheet on line {line_number}, not valid JSON. Exception: {e}')
+            continue
+        if not isinstance(sheet, dict):
+            logger.error(f'Skipping answer sheet on line {line_number}, not a JSON object')
+            continue
+        yield sheet
+
+
+def write_results(results: Iterable[dict], file: TextIO) -> int:
+    """Write grading results as JSONL, one JSON result per line.
+
+    Parameters:
+        results (iterable) : Grading results
+        file (obj)         : Open text file
+
+    Returns:
+        (int) : Number of results written
+    """
+    count = 0
+    for result in results:
+        file.write(json.dumps(result) + '\n')
+        count += 1
+    return count
+
+
+def grade_answer_sheets(exam_contents: dict, sheets_file: TextIO, results_file: TextIO, **kwargs: Any) -> int:
+    """Grade a JSONL stream of answer sheets and write a JSONL stream of results.
+
+    Parameters:
+        exam_contents (dict) : Loaded exam contents
+        sheets_file (obj)    : Open JSONL answer sheets file
+        results_file (obj)   : Open JSONL results file
+
+    Returns:
+        (int) : Number of graded answer sheets
+    """
+    grader = ExamGrader(exam_contents)
+    return write_results(grader.grade_sheets(read_answer_sheets(sheets_file), **kwargs), results_file)
+
+
+###############################################################################################
+
+# Grader of each worker process, set up once per process
+_worker_grader: Optional[ExamGrader] = None
+
+
+def _init_grading_worker(grader: ExamGrader) -> None:
+    """Keep the grader sent to this worker process when it started."""
+    global _worker_grader  # noqa: PLW0603
+    _worker_grader = grader
+
+
+def _grade_lines_in_worker(first_line_number: int, lines: list) -> list:
+    """Parse and grade a shard of JSONL answer sheet lines in a worker process.
+
+    Returns:
+        (list) : JSONL lines of grading results
+    """
+    results = _worker_grader.grade_batch(list(read_answer_sheets(lines, first_line_number)))
+    return [json.dumps(result) + '\n' for result in results]
+
+
+def grade_answer_sheets_parallel(
+    exam_contents: dict,
+    sheets_file: TextIO,
+    results_file: TextIO,
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """Grade a JSONL stream of answer sheets across a pool of worker processes.
+
+    The parsed exam is sent to each worker once, when it starts. Input lines are
+    sharded in batches, parsed and graded by the workers, and written out in the
+    original order. Only a few batches per worker are in flight at a time.
+
+    Parameters:
+        exam_contents (dict) : Loaded exam contents
+        sheets_file (obj)    : Open JSONL answer sheets file
+        results_file (obj)   : Open JSONL results file
+        workers (int)        : Number of worker processes (default number of CPUs)
+        batch_size (int)     : Number of answer sheets per shard
+
+    Returns:
+        (int) : Number of graded answer sheets
+    """
+    # Only needed when grading in parallel, pulls in multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    grader = ExamGrader(exam_contents)
+    logger.debug(f'Grading answer sheets with {workers} worker processes ...')
+
+    count = 0
+    in_flight: deque = deque()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_grading_worker, initargs=(grader,)) as executor:
+        line_number = 1
+        while True:
+            lines = list(islice(sheets_file, batch_size))
+            if lines:
+                in_flight.append(executor.submit(_grade_lines_in_worker, line_number, lines))
+                line_number += len(lines)
+
+            # Write out the oldest shard once enough are queued, or all of them at the end
+            while in_flight and (len(in_flight) >= workers * 4 or not lines):
+                results = in_flight.popleft().result()
+                results_file.writelines(results)
+                count += len(results)
+
+            if not lines:
+                return count
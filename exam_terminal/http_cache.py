@@ -0,0 +1,169 @@
+"""On-disk HTTP cache for remote exam files."""
+
+import hashlib
+import json
+import logging
+import os
+from time import time
+from typing import Optional
+
+logger = logging.getLogger()
+
+# Seconds a cached remote exam file is used without asking the server again
+DEFAULT_TTL = 300
+
+
+def get_default_cache_dir() -> str:
+    """Get the default directory for cached remote exam files.
+
+    Can be set with the EXAM_TERMINAL_CACHE_DIR environment variable.
+
+    Returns:
+        (str) : Cache directory path
+    """
+    if os.environ.get('EXAM_TERMINAL_CACHE_DIR'):
+        return os.environ['EXAM_TERMINAL_CACHE_DIR']
+    base_dir = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base_dir, 'exam-terminal', 'http')
+
+
+class HttpCache:
+    """Keeps downloaded remote exam files with their ETag and Last-Modified validators.
+
+    Usage:
+        cache = HttpCache(ttl=600)
+        entry = cache.load(url)
+        if entry and cache.is_fresh(entry):
+            content = cache.read_content(url)
+        headers = cache.get_conditional_headers(entry)  # For the GET request
+        cache.save(url, response.content, response.headers)
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: float = DEFAULT_TTL, offline: bool = False) -> None:
+        """Object constructor method.
+
+        Parameters:
+            cache_dir (str) : Directory to keep cached files in (default from get_default_cache_dir())
+            ttl (float)     : Seconds a cached file is used without revalidating with the server
+            offline (bool)  : If True, never contact the server, only serve cached files
+        """
+        self.cache_dir = cache_dir or get_default_cache_dir()
+        self.ttl = ttl
+        self.offline = offline
+
+    def __get_paths(self, url: str) -> tuple[str, str]:
+        """Get the metadata and content file paths of a URL."""
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f'{key}.json'), os.path.join(self.cache_dir, f'{key}.body')
+
+    @staticmethod
+    def __write_atomic(file_path: str, data: bytes) -> None:
+        """Write a file so that other processes never see it half written."""
+        temp_file_path = f'{file_path}.{os.getpid()}.tmp'
+        with open(temp_file_path, 'wb') as file:
+            file.write(data)
+        os.replace(temp_file_path, file_path)
+
+    ###############################################################################################
+
+    def load(self, url: str) -> dict:
+        """Load the cache entry metadata of a URL.
+
+        Parameters:
+            url (str) : Remote file URL
+
+        Returns:
+            (dict) : Cache entry metadata, empty if not cached
+        """
+        metadata_path, content_path = self.__get_paths(url)
+        try:
+            with open(metadata_path) as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if entry.get('url') != url or not os.path.exists(content_path):
+            return {}
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        """Check if a cache entry can be used without asking the server.
+
+        Parameters:
+            entry (dict) : Cache entry metadata
+
+        Returns:
+            (bool) : True if it is within TTL or in offline mode, else False
+        """
+        if not entry:
+            return False
+        return self.offline or time() - entry.get('fetched_time', 0) < self.ttl
+
+    def read_content(self, url: str) -> Optional[bytes]:
+        """Read the cached file content of a URL.
+
+        Parameters:
+            url (str) : Remote file URL
+
+        Returns:
+            (bytes) : Cached file content, None if not cached
+        """
+        _, content_path = self.__get_paths(url)
+        try:
+            with open(content_path, 'rb') as file:
+                return file.read()
+        except OSError:
+            return None
+
+    @staticmethod
+    def get_conditional_headers(entry: dict) -> dict:
+        """Get the request headers that let the server answer "304 Not Modified".
+
+        Parameters:
+            entry (dict) : Cache entry metadata, may be empty
+
+        Returns:
+            (dict) : If-None-Match and If-Modified-Since request headers
+        """
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def save(self, url: str, content: bytes, headers) -> None:
+        """Store a downloaded file with its validators.
+
+        Parameters:
+            url (str)      : Remote file URL
+            content (bytes): Downloaded file content
+            headers (dict) : HTTP response headers
+        """
+        metadata_path, content_path = self.__get_paths(url)
+        entry = {
+            'url': url,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'fetched_time': time(),
+        }
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            self.__write_atomic(content_path, content)
+            self.__write_atomic(metadata_path, json.dumps(entry).encode('utf-8'))
+            logger.debug(f'Saved remote file to HTTP cache: {content_path}')
+        except OSError as e:
+            logger.debug(f'Failed to save remote file to HTTP cache. Exception: {e}')
+
+    def revalidated(self, url: str, entry: dict) -> None:
+        """Restart the TTL of a cache entry after the server answered "304 Not Modified".
+
+        Parameters:
+            url (str)    : Remote file URL
+            entry (dict) : Cache entry metadata
+        """
+        metadata_path, _ = self.__get_paths(url)
+        entry = {**entry, 'fetched_time': time()}
+        try:
+            self.__write_atomic(metadata_path, json.dumps(entry).encode('utf-8'))
+        except OSError as e:
+            logger.debug(f'Failed to update HTTP cache entry. Exception: {e}')
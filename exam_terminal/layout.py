@@ -0,0 +1,127 @@
+"""Cached text wrapping and positioning for screen layouts."""
+
+import logging
+import textwrap
+from collections import OrderedDict
+from typing import Any, Callable
+
+logger = logging.getLogger()
+
+
+class QuestionLayout:
+    """Wrapped lines and row positions of a single question for one terminal width.
+
+    All rows are absolute screen rows (y).
+    """
+
+    def __init__(self, question_text: str, selections: list, info: str, width: int, start_y: int) -> None:
+        """Object constructor method.
+
+        Parameters:
+            question_text (str) : The question text
+            selections (list)   : Text of each selection
+            info (str)          : Extra question information line, empty if none
+            width (int)         : Terminal width in characters
+            start_y (int)       : Line/row number at which question starts
+        """
+        wrapper_question = textwrap.TextWrapper(width=width - 5)
+        wrapper_selection = textwrap.TextWrapper(width=width - 10)
+
+        # Question lines
+        self.question_lines = wrapper_question.wrap(text=question_text)
+        self.question_y = start_y - 1
+
+        # Question information line directly under the last question line
+        self.info = info
+        self.info_y = start_y + max(len(self.question_lines) - 1, 0)
+        line_offset = 1 if info else 0
+
+        # Separator between question and selections
+        self.separator_y = len(self.question_lines) + 3 + line_offset
+
+        # Selections, each with its own range of rows
+        self.selection_lines: list[list[str]] = []
+        self.selection_rows: list[range] = []
+        selection_offset = len(self.question_lines) + 3 + line_offset
+        for selection in selections:
+            selection_wrap = wrapper_selection.wrap(text=selection)
+            selection_y = start_y + selection_offset - 1
+            self.selection_lines.append(selection_wrap)
+            self.selection_rows.append(range(selection_y, selection_y + len(selection_wrap)))
+            selection_offset += len(selection_wrap) + 1
+
+
+class LayoutCache:
+    """Computes layouts once per (item, terminal width) and keeps the most recently used ones.
+
+    Layouts are dropped on a resize or a new exam attempt, and the least
+    recently used one once more than max_size are cached.
+
+    Usage:
+        layout = LayoutCache()
+        lines = layout.wrap(text, width=70)
+        question_layout = layout.question(question, term_width, info, start_y)
+        layout.invalidate()  # On curses.KEY_RESIZE
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        """Object constructor method.
+
+        Parameters:
+            max_size (int) : Most layouts kept at once
+        """
+        self.max_size = max_size
+        self.cache: OrderedDict = OrderedDict()
+
+    def invalidate(self) -> None:
+        """Drop all cached layouts."""
+        logger.debug(f'Invalidating {len(self.cache)} cached layouts')
+        self.cache.clear()
+
+    def get(self, key: Any, builder: Callable[[], Any]) -> Any:
+        """Get a cached layout, building it if it is not cached yet.
+
+        Parameters:
+            key (Any)          : Hashable key identifying the layout, including terminal width
+            builder (callable) : Builds the layout when it is not cached
+
+        Returns:
+            (Any) : The layout
+        """
+        try:
+            self.cache.move_to_end(key)
+            return self.cache[key]
+        except KeyError:
+            layout = self.cache[key] = builder()
+            if len(self.cache) > self.max_size:
+                self.cache.popitem(last=False)
+            return layout
+
+    def wrap(self, text: str, width: int) -> list[str]:
+        """Wrap text into lines of given width.
+
+        Parameters:
+            text (str)  : Text to wrap
+            width (int) : Maximum line width in characters
+
+        Returns:
+            (list) : Wrapped lines of text
+        """
+        return self.get(('wrap', text, width), lambda: textwrap.wrap(text, width=width))
+
+    def question(self, question: dict, width: int, info: str, start_y: int) -> QuestionLayout:
+        """Wrap and position a question and its selections.
+
+        Parameters:
+            question (dict) : The question information
+            width (int)     : Terminal width in characters
+            info (str)      : Extra question information line, empty if none
+            start_y (int)   : Line/row number at which question starts
+
+        Returns:
+            (QuestionLayout) : Wrapped and positioned question
+        """
+        return self.get(
+            ('question', question['question_number'], width, info, start_y),
+            lambda: QuestionLayout(question['question'], question['selection'], info, width, start_y),
+        )
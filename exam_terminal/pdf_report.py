@@ -0,0 +1,436 @@
+"""Paginated PDF exam result report: summary page and per-question breakdown.
+
+Imports fpdf, which is slow to import, so only import this module when rendering.
+"""
+
+import logging
+import os
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Callable, Optional
+
+from fpdf import FPDF
+
+from exam_terminal import utility
+from exam_terminal.result_export import assemble_exam_results, get_report_file_name, write_atomic
+
+logger = logging.getLogger()
+
+PAGE_WIDTH = 210
+PAGE_HEIGHT = 297
+PAGE_LEFT_MARGIN = 10
+PAGE_RIGHT_MARGIN = 10
+PAGE_TOP_MARGIN = 10
+PAGE_BOTTOM_MARGIN = 20
+
+PAGE_X_AREA = PAGE_WIDTH - PAGE_LEFT_MARGIN - PAGE_RIGHT_MARGIN
+
+# Question blocks stay above the watermark line
+CONTENT_BOTTOM_Y = PAGE_HEIGHT - PAGE_BOTTOM_MARGIN - 12
+
+# Summary result text is truncated to this many characters (terminal width limit minus label column)
+SUMMARY_TEXT_WIDTH = 54
+
+
+def to_latin1(text: str) -> str:
+    """Replace characters the built-in PDF fonts can not show.
+
+    Parameters:
+        text (str) : Any text
+
+    Returns:
+        (str) : Text with only latin-1 characters
+    """
+    return str(text).encode('latin-1', 'replace').decode('latin-1')
+
+
+class ResultsReport(FPDF):
+    """Exam result report. One summary page, followed by pages with a breakdown of each question.
+
+    Page chrome (border, header and watermark) is the same on every page. It is
+    drawn once, then its PDF drawing instructions are copied onto each later page.
+
+    Usage:
+        report = ResultsReport(exam, software_name)
+        report.add_summary_page(results, text_width=54)
+        report.add_questions(questions)
+        pdf_bytes = report.render()
+    """
+
+    def __init__(self, exam: dict, software_name: str, cache_chrome: bool = True) -> None:
+        """Object constructor method.
+
+        Parameters:
+            exam (dict)          : Evaluated exam information
+            software_name (str)  : Software name and version for the watermark
+            cache_chrome (bool)  : If False, draw the page chrome on every page (ie. for comparison)
+        """
+        super().__init__(orientation='P', unit='mm', format='A4')
+        self.exam = exam
+        self.software_name = software_name
+        self.cache_chrome = cache_chrome
+
+        # PDF drawing instructions of each piece of page chrome, by name
+        self.chrome_cache: dict[str, bytes] = {}
+
+        # Question pages have a header, the summary page has its own title
+        self.is_question_page = False
+
+        self.set_author('Author Test Terminal')
+        self.set_creator('Creator Test Terminal')
+        self.set_subject('Exam Results')
+
+        # Same results always render to the same bytes
+        self.set_creation_date(datetime.fromtimestamp(exam['exam_end_timestamp'], timezone.utc))
+
+        self.set_margins(left=PAGE_LEFT_MARGIN, top=PAGE_TOP_MARGIN, right=PAGE_RIGHT_MARGIN)
+        self.set_auto_page_break(False)
+
+    ###############################################################################################
+
+    def __draw_cached(self, name: str, draw_function: Callable[[], None]) -> None:
+        """Draw a piece of page chrome, or copy its drawing instructions if it was drawn before.
+
+        Drawing happens in a local graphics context, so copied instructions do
+        not change the font, colors or line width of the rest of the page.
+
+        Reads and writes the page contents through fpdf internals (_out() and
+        pages), which is why fpdf2 is pinned to 2.7 in requirements.txt and the Pipfile.
+        """
+        cached = self.chrome_cache.get(name)
+        if cached is not None:
+            self._out(cached)
+            return
+
+        contents = self.pages[self.page].contents
+        start = len(contents)
+        with self.local_context():
+            draw_function()
+        if self.cache_chrome:
+            # Without the trailing new line, added back by _out()
+            self.chrome_cache[name] = bytes(contents[start:-1])
+
+    def __draw_frame(self) -> None:
+        """Draw the page border and the software watermark."""
+        self.line(10, 10, 200, 10)
+        self.line(10, 277, 200, 277)
+        self.line(10, 10, 10, 277)
+        self.line(200, 10, 200, 277)
+
+        self.set_text_color(100, 100, 100)
+        self.set_font('Helvetica', 'I', 8)
+        self.set_xy(x=PAGE_LEFT_MARGIN + 3, y=PAGE_HEIGHT - PAGE_BOTTOM_MARGIN - 8)
+        self.cell(w=0, h=5, txt=to_latin1(f'Created with {self.software_name}'), border=0, align='L')
+
+    def __draw_question_header(self) -> None:
+        """Draw the header of question breakdown pages."""
+        self.set_text_color(0, 0, 0)
+        self.set_font('Helvetica', 'B', 11)
+        self.set_xy(x=PAGE_LEFT_MARGIN + 3, y=PAGE_TOP_MARGIN + 2)
+        self.cell(
+            w=PAGE_X_AREA - 6, h=8, txt=to_latin1(f'Exam Results: {self.exam["exam_title"]}')[:90], border=0, align='L'
+        )
+        self.line(PAGE_LEFT_MARGIN, PAGE_TOP_MARGIN + 12, PAGE_WIDTH - PAGE_RIGHT_MARGIN, PAGE_TOP_MARGIN + 12)
+
+    def header(self) -> None:
+        """Draw the page chrome. Called by fpdf for every new page."""
+        self.__draw_cached('frame', self.__draw_frame)
+        if self.is_question_page:
+            self.__draw_cached('question_header', self.__draw_question_header)
+
+    def footer(self) -> None:
+        """Draw the page number. Called by fpdf at the end of every page."""
+        with self.local_context():
+            self.set_text_color(100, 100, 100)
+            self.set_font('Helvetica', 'I', 8)
+            self.set_xy(x=PAGE_WIDTH - PAGE_RIGHT_MARGIN - 43, y=PAGE_HEIGHT - PAGE_BOTTOM_MARGIN - 8)
+            self.cell(w=40, h=5, txt=f'Page {self.page_no()} of {self.str_alias_nb_pages}', border=0, align='R')
+
+    ###############################################################################################
+
+    def add_summary_page(self, results: list, text_width: int) -> None:
+        """Add the exam summary page.
+
+        Parameters:
+            results (list)   : Label, text, font width, and lines to skip of each result item
+            text_width (int) : Result text is truncated to this many characters
+        """
+        self.is_question_page = False
+        self.add_page(orientation='P', format='A4', same=False)
+
+        # Set the color depending on exam result label
+        if self.exam['evaluation_bool']:
+            self.set_fill_color(r=220, g=255, b=220)
+        else:
+            self.set_fill_color(r=255, g=220, b=220)
+
+        # Add Title
+        self.set_text_color(0, 0, 0)
+        self.set_font('Helvetica', 'B', 18)
+        self.set_xy(x=PAGE_LEFT_MARGIN, y=PAGE_TOP_MARGIN)
+        self.cell(w=PAGE_X_AREA, h=20, txt='Exam Results', border=1, align='C', fill=1)
+
+        # Add result label
+        self.set_font('Helvetica', '', 24)
+        self.set_xy(x=PAGE_WIDTH - PAGE_RIGHT_MARGIN - 70, y=PAGE_HEIGHT - PAGE_BOTTOM_MARGIN - 40)
+        self.cell(w=60, h=30, txt=self.exam['evaluation_label'], border=1, align='C', fill=1)
+
+        # Add Content
+        start_x = [20, 77]
+        start_y = 40
+        line_height = 8
+        for item in results:
+            self.set_font('Helvetica', 'B', 11)
+            self.set_xy(x=start_x[0], y=start_y)
+            self.cell(w=60, h=line_height, txt=to_latin1(item['label']), border=0, align='L')
+
+            if item['font_width'] == 'fixed':
+                self.set_font('Courier', '', 11)
+            else:
+                self.set_font('Helvetica', '', 11)
+            self.set_xy(x=start_x[1], y=start_y)
+            self.cell(
+                w=60,
+                h=line_height,
+                txt=to_latin1(utility.truncate_text(item['text'], text_width)),
+                border=0,
+                align='L',
+            )
+
+            start_y += item['skip_lines'] * 8
+
+    def __wrap(self, text: str, width: float) -> list:
+        """Split text into lines that fit a width with the current font."""
+        text = to_latin1(text)
+        # Most selections fit on one line, measuring is much faster than line breaking
+        if '\n' not in text and self.get_string_width(text) <= width - 2 * self.c_margin:
+            return [text]
+        return self.multi_cell(w=width, h=5, txt=text, split_only=True) or ['']
+
+    def add_question(self, question: dict) -> None:
+        """Add the breakdown of one question: question, selections, chosen and correct answers, and time taken.
+
+        A question is moved to the next page as a whole, unless it does not fit on a page at all.
+
+        Parameters:
+            question (dict) : Question with its answer information
+        """
+        line_height = 5
+        question_x = PAGE_LEFT_MARGIN + 5
+        selection_x = question_x + 14
+        question_width = PAGE_X_AREA - 10
+        selection_width = PAGE_X_AREA - 24
+
+        answered = question.get('answered', False)
+        answered_indexes = set(question.get('answered_indexes') or []) if answered else set()
+        answer_indexes = set(question['question_answer_indexes'])
+
+        # Wrap everything first, to know the height of the question block
+        self.set_font('Helvetica', '', 10)
+        question_lines = self.__wrap(question['question'], question_width)
+        self.set_font('Helvetica', '', 9)
+        selection_lines = [self.__wrap(selection, selection_width) for selection in question['selection']]
+        block_height = line_height * (2 + len(question_lines) + sum(len(lines) for lines in selection_lines)) + 4
+
+        if self.get_y() + block_height > CONTENT_BOTTOM_Y and self.get_y() > PAGE_TOP_MARGIN + 20:
+            self.add_page()
+            self.set_y(PAGE_TOP_MARGIN + 16)
+        y = self.get_y()
+
+        # Question number, result and time taken
+        if not answered:
+            status, status_color = 'Not answered', (120, 120, 120)
+        elif question.get('answered_correctly'):
+            status, status_color = 'Correct', (0, 130, 0)
+        else:
+            status, status_color = 'Incorrect', (200, 0, 0)
+        self.set_font('Helvetica', 'B', 10)
+        self.set_text_color(0, 0, 0)
+        self.set_xy(x=question_x, y=y)
+        self.cell(w=30, h=line_height, txt=f'Question {question["question_number"] + 1}', border=0, align='L')
+        self.set_text_color(*status_color)
+        self.cell(w=40, h=line_height, txt=status, border=0, align='L')
+        if answered and 'answered_question_time' in question:
+            self.set_font('Helvetica', '', 9)
+            self.set_text_color(100, 100, 100)
+            self.set_xy(x=PAGE_WIDTH - PAGE_RIGHT_MARGIN - 55, y=y)
+            self.cell(w=50, h=line_height, txt=f'Time: {question["answered_question_time"]:.1f}s', border=0, align='R')
+        y += line_height
+
+        # Question text
+        self.set_font('Helvetica', '', 10)
+        self.set_text_color(0, 0, 0)
+        for line in question_lines:
+            self.set_xy(x=question_x, y=y)
+            self.cell(w=question_width, h=line_height, txt=line, border=0, align='L')
+            y += line_height
+        y += line_height / 2
+
+        # Selections, marked as chosen and/or correct
+        self.set_font('Helvetica', '', 9)
+        for index, lines in enumerate(selection_lines):
+            chosen = index in answered_indexes
+            correct = index in answer_indexes
+            if correct:
+                self.set_text_color(0, 130, 0)
+            elif chosen:
+                self.set_text_color(200, 0, 0)
+            else:
+                self.set_text_color(60, 60, 60)
+            marker = f'{"[x]" if chosen else "[  ]"}{" *" if correct else ""}'
+            self.set_xy(x=question_x + 2, y=y)
+            self.cell(w=12, h=line_height, txt=marker, border=0, align='L')
+            for line in lines:
+                self.set_xy(x=selection_x, y=y)
+                self.cell(w=selection_width, h=line_height, txt=line, border=0, align='L')
+                y += line_height
+
+        self.set_y(y + line_height)
+
+    def add_questions(self, questions: list, progress: Optional[Callable[[int, int], None]] = None) -> None:
+        """Add the breakdown of each question, starting on a new page.
+
+        Parameters:
+            questions (list)    : Questions with their answer information
+            progress (callable) : Called with the number of questions done and the total, after each question
+        """
+        if not questions:
+            return
+        self.is_question_page = True
+        self.add_page()
+        self.set_y(PAGE_TOP_MARGIN + 16)
+
+        # Legend
+        self.set_font('Helvetica', 'I', 8)
+        self.set_text_color(100, 100, 100)
+        self.set_x(PAGE_LEFT_MARGIN + 5)
+        self.cell(w=0, h=5, txt='[x] Chosen answer      * Correct answer', border=0, align='L')
+        self.set_y(self.get_y() + 8)
+
+        for done, question in enumerate(questions, start=1):
+            self.add_question(question)
+            if progress:
+                progress(done, len(questions))
+
+    def render(self) -> bytes:
+        """Finish the document.
+
+        Returns:
+            (bytes) : PDF document
+        """
+        return bytes(self.output())
+
+
+def build_results_report(
+    exam: dict,
+    results: list,
+    questions: list,
+    software_name: str,
+    text_width: int = SUMMARY_TEXT_WIDTH,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> ResultsReport:
+    """Lay out the full exam result report.
+
+    Parameters:
+        exam (dict)         : Evaluated exam information
+        results (list)      : Summary result items (label, text, font_width, skip_lines)
+        questions (list)    : Questions with their answer information
+        software_name (str) : Software name and version for the watermark
+        text_width (int)    : Summary result text is truncated to this many characters
+        progress (callable) : Called with the number of questions done and the total
+
+    Returns:
+        (ResultsReport) : Report, ready to render
+    """
+    report = ResultsReport(exam, software_name)
+    report.add_summary_page(results, text_width)
+    report.add_questions(questions, progress)
+    logger.debug(f'Laid out exam results report with {report.page_no()} pages')
+    return report
+
+
+def render_results_report(
+    exam: dict,
+    results: list,
+    questions: list,
+    software_name: str,
+    text_width: int = SUMMARY_TEXT_WIDTH,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> bytes:
+    """Render the full exam result report, see build_results_report().
+
+    Returns:
+        (bytes) : PDF document
+    """
+    return build_results_report(exam, results, questions, software_name, text_width, progress).render()
+
+
+###############################################################################################
+
+
+def render_record_report(record: dict, output_dir: str) -> tuple[str, float, int]:
+    """Render the PDF report of a serialized exam result record and save it.
+
+    Parameters:
+        record (dict)    : Exam result record, as saved by result_export
+        output_dir (str) : Directory to save the report in
+
+    Returns:
+        (tuple) : Report file path, seconds taken, and number of pages
+    """
+    begin_time = perf_counter()
+    questions = record['questions']
+    results = assemble_exam_results(record['exam'], [question for question in questions if question.get('answered')])
+    report = build_results_report(
+        record['exam'], list(results.values()), questions, utility.load_software_name_version()
+    )
+    file_path = os.path.join(output_dir, get_report_file_name(record))
+    write_atomic(file_path, report.render())
+    return file_path, perf_counter() - begin_time, report.page_no()
+
+
+def _render_record_report_safely(record: dict, output_dir: str) -> tuple:
+    """Render a record report in a worker process, returning the error instead of raising it.
+
+    Returns:
+        (tuple) : Report file path, seconds taken, number of pages, and error message (empty if none)
+    """
+    try:
+        return (*render_record_report(record, output_dir), '')
+    except Exception as e:
+        return '', 0.0, 0, f'Failed to render report of result record "{record.get("id")}". Exception: {e!r}'
+
+
+def render_record_reports(records: Iterable[dict], output_dir: str, workers: Optional[int] = None) -> Iterator[tuple]:
+    """Render the PDF reports of many exam result records across a pool of worker processes.
+
+    Only a few records per worker are in flight at a time, reports are yielded
+    in the same order as the records.
+
+    Parameters:
+        records (iterable) : Exam result records
+        output_dir (str)   : Directory to save the reports in
+        workers (int)      : Number of worker processes (default number of CPUs), 1 renders in this process
+
+    Returns:
+        (iterator) : Report file path, seconds taken, number of pages, and error message (empty if none)
+    """
+    workers = workers or os.cpu_count() or 1
+    os.makedirs(output_dir, exist_ok=True)
+    if workers == 1:
+        for record in records:
+            yield _render_record_report_safely(record, output_dir)
+        return
+
+    logger.debug(f'Rendering result reports with {workers} worker processes ...')
+    in_flight: deque = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for record in records:
+            in_flight.append(executor.submit(_render_record_report_safely, record, output_dir))
+            if len(in_flight) >= workers * 2:
+                yield in_flight.popleft().result()
+        while in_flight:
+            yield in_flight.popleft().result()
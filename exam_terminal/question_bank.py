@@ -0,0 +1,310 @@
+"""Lazily parsed question bank for very large exam files."""
+
+import logging
+import re
+import threading
+from collections.abc import Sequence
+from typing import BinaryIO, Callable, Optional
+
+from exam_terminal import utility
+
+logger = logging.getLogger()
+
+# Local exam files at least this large are loaded lazily
+LAZY_LOAD_MIN_BYTES = 1_000_000
+
+TOP_LEVEL_KEY = re.compile(rb'^([^\s#\-][^:]*):(.*)$')
+
+
+def parse_question(question: dict, index: int) -> dict:
+    """Parse and supplement a single exam question.
+
+    Parameters:
+        question (dict) : Question as loaded from the exam file
+        index (int)     : Question number, starting at zero
+
+    Returns:
+        question (dict) : The same question with answer and answered status information
+    """
+    # Store the question number
+    question['question_number'] = index
+
+    # Set answered status
+    question['answered'] = False
+
+    # Already parsed (ie. compiled exam file or later exam attempt), answers are known
+    if 'question_answer_bool' in question:
+        return question
+
+    # Create empty list for answer indexes
+    question['question_answer_indexes'] = []
+    question['question_answer_bool'] = []
+
+    # Looping over selection for each question
+    for i, s in enumerate(question['selection']):
+        # Check if a answer was passed with selection
+        if isinstance(s, dict):
+            # Get the first key
+            first_key = next(iter(s))
+
+            # Save the correct answer
+            if s[first_key]:
+                # Is True (correct answer)
+                question['question_answer_indexes'].append(i)
+                question['question_answer_bool'].append(True)
+            else:
+                # Is False (incorrect answer)
+                question['question_answer_bool'].append(False)
+
+            # Just keep the key
+            question['selection'][i] = first_key
+
+        else:
+            # No value, assumed False answer
+            question['question_answer_bool'].append(False)
+
+    # Determine if it is a multi-selection question
+    question['question_multiselect'] = sum(question['question_answer_bool']) > 1
+    question['question_min_selection_count'] = sum(question['question_answer_bool'])
+
+    return question
+
+
+def scan_question_offsets(
+    file: BinaryIO, questions_offset: int, add_offsets: Callable[[int, int], None]
+) -> Optional[int]:
+    """Find the byte range of every question in the questions list of a YAML exam file, without parsing it.
+
+    Parameters:
+        file (obj)             : Exam file opened in binary mode
+        questions_offset (int) : Byte offset of the first line after the top level "questions:" key
+        add_offsets (callable) : Called with the start and end byte offsets of each question, in order
+
+    Returns:
+        (int) : Byte offset of anything after the questions list (other top level keys), None if nothing
+    """
+    item_indent = None
+    item_start = None
+    trailing_offset = None
+    offset = questions_offset
+    file.seek(offset)
+    for line in file:
+        line_offset = offset
+        offset += len(line)
+        stripped = line.lstrip()
+        if not stripped.strip() or stripped.startswith(b'#'):
+            continue
+
+        # Another top level key ends the questions list
+        if TOP_LEVEL_KEY.match(line):
+            trailing_offset = line_offset
+            break
+
+        # First list item sets the indentation of all items
+        indent = len(line) - len(stripped)
+        if item_indent is None:
+            item_indent = indent
+        if indent != item_indent or not (stripped.startswith(b'- ') or stripped.rstrip() == b'-'):
+            continue
+
+        if item_start is not None:
+            add_offsets(item_start, line_offset)
+        item_start = line_offset
+    else:
+        line_offset = offset
+
+    if item_start is not None:
+        add_offsets(item_start, line_offset)
+    return trailing_offset
+
+
+def read_examfile_header(local_file_path: str) -> tuple[bytes, Optional[int]]:
+    """Read the top of a YAML exam file, up to its block list of questions.
+
+    Parameters:
+        local_file_path (str) : Path to a local exam file
+
+    Returns:
+        (tuple) : YAML text before the questions, and the byte offset of the first line after the
+                  top level "questions:" key (None if the questions are not a block list, then the text is the whole file)
+    """
+    with open(local_file_path, 'rb') as file:
+        header = b''
+        questions_offset = 0
+        for line in file:
+            questions_offset += len(line)
+            match = TOP_LEVEL_KEY.match(line)
+            if match and match.group(1).strip() == b'questions' and not match.group(2).strip():
+                return header, questions_offset
+            header += line
+    return header, None
+
+
+class LazyQuestionBank(Sequence):
+    """Question list of a YAML exam file that parses each question only when it is accessed.
+
+    A background thread indexes the byte range of every question in one pass
+    over the file. Questions are parsed on first access, then kept, so changes
+    made to a question dict stick around.
+
+    Usage:
+        bank = LazyQuestionBank('exam.yml', questions_offset)
+        bank[0]['question']
+        len(bank)  # Waits until indexing is done
+    """
+
+    def __init__(self, file_path: str, questions_offset: int) -> None:
+        """Object constructor method. Starts indexing right away.
+
+        Parameters:
+            file_path (str)        : Path to the YAML exam file
+            questions_offset (int) : Byte offset of the first line after the top level "questions:" key
+        """
+        self.file_path = file_path
+        self.questions_offset = questions_offset
+
+        # Start and end byte offsets of each question
+        self.offsets: list[tuple[int, int]] = []
+
+        # Byte offset of anything after the questions list (other top level keys)
+        self.trailing_offset: Optional[int] = None
+
+        self.is_indexed = False
+        self.parse_question: Optional[Callable[[dict, int], dict]] = None
+
+        self._parsed: dict[int, dict] = {}
+        self._condition = threading.Condition()
+
+        self._indexer = threading.Thread(target=self.__index_questions, args=(), daemon=True)
+        self._indexer.start()
+
+    ###############################################################################################
+
+    def __index_questions(self) -> None:
+        """Find the byte range of every question in the questions list."""
+        logger.debug(f'Indexing questions of exam file: {self.file_path} ...')
+        with open(self.file_path, 'rb') as file:
+            self.trailing_offset = scan_question_offsets(file, self.questions_offset, self.__add_offsets)
+
+        with self._condition:
+            self.is_indexed = True
+            self._condition.notify_all()
+        logger.debug(f'Indexed {len(self.offsets)} questions')
+
+    def __add_offsets(self, start: int, end: int) -> None:
+        """Store the byte range of one question and wake up anyone waiting for it."""
+        with self._condition:
+            self.offsets.append((start, end))
+            self._condition.notify_all()
+
+    def wait_until_indexed(self) -> None:
+        """Block until every question has been indexed."""
+        with self._condition:
+            self._condition.wait_for(lambda: self.is_indexed)
+
+    @property
+    def indexed_count(self) -> int:
+        """Number of questions indexed so far."""
+        return len(self.offsets)
+
+    def trailing_contents(self) -> dict:
+        """Parse any top level keys that come after the questions list.
+
+        Returns:
+            (dict) : Parsed top level keys, empty if there are none
+        """
+        self.wait_until_indexed()
+        if self.trailing_offset is None:
+            return {}
+        with open(self.file_path, 'rb') as file:
+            file.seek(self.trailing_offset)
+            return utility.load_yaml(file.read()) or {}
+
+    def reset(self, parse_question: Optional[Callable[[dict, int], dict]] = None) -> None:
+        """Forget all parsed questions, for example for a new exam attempt.
+
+        Parameters:
+            parse_question (callable) : Applied to each question dict and its index right after it is loaded
+        """
+        with self._condition:
+            self._parsed.clear()
+            self.parse_question = parse_question
+
+    ###############################################################################################
+
+    def __len__(self) -> int:
+        """Total number of questions. Waits until indexing is done."""
+        self.wait_until_indexed()
+        return len(self.offsets)
+
+    def __getitem__(self, index):
+        """Get a question dict, parsing it if it was not accessed before.
+
+        Parameters:
+            index (int or slice) : Question index or slice of indexes
+
+        Returns:
+            (dict or list) : Question dict, or a list of question dicts for a slice
+        """
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        with self._condition:
+            if index in self._parsed:
+                return self._parsed[index]
+            self._condition.wait_for(lambda: index < len(self.offsets) or self.is_indexed)
+            if index >= len(self.offsets):
+                raise IndexError('question index out of range')
+            start, end = self.offsets[index]
+
+        # Opened per question, no file handle is held while the exam waits on the user
+        with open(self.file_path, 'rb') as file:
+            file.seek(start)
+            question = utility.load_yaml(file.read(end - start))[0]
+        if self.parse_question:
+            question = self.parse_question(question, index)
+
+        with self._condition:
+            return self._parsed.setdefault(index, question)
+
+    def __iter__(self):
+        """Iterate over all questions in order, parsing each one as it is reached."""
+        index = 0
+        while True:
+            try:
+                yield self[index]
+            except IndexError:
+                return
+            index += 1
+
+
+def load_examfile_contents_lazily(local_file_path: str) -> dict:
+    """Load the exam information right away and the questions lazily.
+
+    Exam files with questions in flow style (questions: [...]) are loaded all at once.
+
+    Parameters:
+        local_file_path (str) : Path to a local file to be loaded
+
+    Returns:
+        file_contents (Dict) : The contents of the file, with questions as a LazyQuestionBank
+    """
+    logger.debug(f"Lazily loading specified local exam file: '{local_file_path}' ...")
+    try:
+        header, questions_offset = read_examfile_header(local_file_path)
+        if questions_offset is None:
+            # No block list of questions (ie. "questions: [...]"), load entire file
+            logger.debug('Questions are not a block list, loading entire file')
+            return utility.load_yaml(header) or {}
+
+        file_contents = utility.load_yaml(header) or {}
+        file_contents['questions'] = LazyQuestionBank(local_file_path, questions_offset)
+        if 'exam' not in file_contents:
+            file_contents.update(file_contents['questions'].trailing_contents())
+        logger.debug('Successfully loaded local exam file information, questions are loading')
+    except Exception as e:
+        logger.error(f"Failed to load specified local exam file: '{local_file_path}'. Exception: {e}")
+        return {}
+    return file_contents
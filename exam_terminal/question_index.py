@@ -0,0 +1,378 @@
+"""On-disk inverted index of question tags and difficulty, to assemble exams from large question banks."""
+
+import logging
+import marshal
+import os
+import random
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable, Sequence
+from datetime import date
+from typing import Optional
+
+from exam_terminal import utility
+from exam_terminal.question_bank import read_examfile_header, scan_question_offsets
+from exam_terminal.result_export import write_atomic
+
+logger = logging.getLogger()
+
+INDEX_FILE_EXTENSION = '.examidx'
+INDEX_MAGIC = b'EXAMIDX\x01\n'
+
+# Exam information of an assembled exam, where the first question bank has none
+DEFAULT_EXAM = {
+    'exam_title': 'Assembled Exam',
+    'exam_description': 'Questions assembled from question banks',
+    'exam_author': '',
+    'exam_edit_date': '',
+    'exam_allowed_time': 60,
+    'exam_allowed_time_units': 'minutes',
+    'exam_passing_score': 70,
+}
+
+# Indentation of the questions list items in an assembled exam file
+QUESTION_INDENT = b'  '
+
+
+def normalize_label(value) -> str:
+    """Get the form a tag or difficulty is indexed and looked up in, case and surrounding spaces do not matter.
+
+    Parameters:
+        value (any) : Tag or difficulty as listed in the exam file
+
+    Returns:
+        (str) : Normalized label
+    """
+    return str(value).strip().lower()
+
+
+def get_question_labels(question: dict) -> tuple[list[str], Optional[str]]:
+    """Get the tags and difficulty of a question.
+
+    Exam file fields, both optional:
+
+        - question: ...
+          question_tags: [networking, security]   # Or a single tag
+          question_difficulty: hard
+
+    Parameters:
+        question (dict) : Question as loaded from the exam file
+
+    Returns:
+        (tuple) : Normalized tags, and normalized difficulty (None if not listed)
+    """
+    tags = question.get('question_tags') or []
+    if not isinstance(tags, list):
+        tags = [tags]
+    difficulty = question.get('question_difficulty')
+    return sorted({normalize_label(tag) for tag in tags if tag is not None}), normalize_label(
+        difficulty
+    ) if difficulty is not None else None
+
+
+def get_index_file_path(bank_path: str) -> str:
+    """Get the path of the index of a question bank, stored next to it.
+
+    Parameters:
+        bank_path (str) : Path to a local question bank (exam file)
+
+    Returns:
+        (str) : Path to the index file
+    """
+    return os.path.abspath(bank_path) + INDEX_FILE_EXTENSION
+
+
+def get_bank_key(bank_path: str) -> dict:
+    """Get the values identifying the current version of a question bank, without reading it.
+
+    Parameters:
+        bank_path (str) : Path to a local question bank
+
+    Returns:
+        (dict) : Absolute path, modification time and size of the file
+    """
+    stat = os.stat(bank_path)
+    return {
+        'source_path': os.path.abspath(bank_path),
+        'source_mtime_ns': stat.st_mtime_ns,
+        'source_size': stat.st_size,
+    }
+
+
+def build_bank_index(bank_path: str) -> dict:
+    """Index the tags and difficulty of every question of a question bank, then save the index next to it.
+
+    Each question is parsed on its own, the whole bank is never held in memory.
+    Questions without question text or selections are left out.
+
+    Parameters:
+        bank_path (str) : Path to a local question bank, its questions must be a block list
+
+    Returns:
+        (dict) : Bank index, with question byte ranges and the question numbers of each tag and difficulty
+    """
+    bank_key = get_bank_key(bank_path)
+    _, questions_offset = read_examfile_header(bank_path)
+    if questions_offset is None:
+        raise ValueError(
+            f'Questions of question bank are not a block list ("questions:" followed by "- question: ..."): {bank_path}'
+        )
+
+    scanned = array('Q')
+    offsets = array('Q')
+    tags: dict[str, array] = {}
+    difficulties: dict[str, array] = {}
+    with open(bank_path, 'rb') as file:
+        scan_question_offsets(file, questions_offset, lambda start, end: scanned.extend((start, end)))
+        for start, end in zip(scanned[::2], scanned[1::2]):
+            file.seek(start)
+            loaded = utility.load_yaml(file.read(end - start))
+            question = loaded[0] if isinstance(loaded, list) and loaded else None
+            if not isinstance(question, dict) or 'question' not in question or not question.get('selection'):
+                logger.warning(f'Leaving out invalid question at byte {start} of question bank: {bank_path}')
+                continue
+
+            number = len(offsets) // 2
+            offsets.extend((start, end))
+            question_tags, difficulty = get_question_labels(question)
+            for tag in question_tags:
+                tags.setdefault(tag, array('I')).append(number)
+            if difficulty is not None:
+                difficulties.setdefault(difficulty, array('I')).append(number)
+
+    # Arrays are kept as bytes in native byte order, an index is only read where it was built
+    index = {
+        **bank_key,
+        'offsets': offsets.tobytes(),
+        'tags': {tag: numbers.tobytes() for tag, numbers in tags.items()},
+        'difficulties': {difficulty: numbers.tobytes() for difficulty, numbers in difficulties.items()},
+    }
+    index_file_path = get_index_file_path(bank_path)
+    try:
+        write_atomic(index_file_path, INDEX_MAGIC + marshal.dumps(index))
+        logger.debug(f'Saved question bank index: {index_file_path}')
+    except OSError as e:
+        logger.warning(
+            f'Failed to save question bank index "{index_file_path}", it is rebuilt next time. Exception: {e}'
+        )
+    return index
+
+
+def load_bank_index(bank_path: str) -> Optional[dict]:
+    """Load the saved index of a question bank, if it is up to date.
+
+    Parameters:
+        bank_path (str) : Path to a local question bank
+
+    Returns:
+        (dict) : Bank index, None if stale or missing
+    """
+    index_file_path = get_index_file_path(bank_path)
+    try:
+        with open(index_file_path, 'rb') as file:
+            data = file.read()
+        if not data.startswith(INDEX_MAGIC):
+            logger.debug(f'Unknown question bank index format: {index_file_path}')
+            return None
+        index = marshal.loads(data[len(INDEX_MAGIC) :])
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        logger.debug(f'No usable question bank index "{index_file_path}". Exception: {e}')
+        return None
+
+    if any(index.get(key) != value for key, value in get_bank_key(bank_path).items()):
+        logger.debug(f'Question bank index is stale: {index_file_path}')
+        return None
+    return index
+
+
+def parse_pick(pick: str) -> tuple[int, tuple[str, ...], Optional[str]]:
+    """Parse a pick of questions for an assembled exam: a count, then the tags and difficulty to match.
+
+    Examples: "20:networking", "10:difficulty=hard", "5:security,difficulty=easy", "10" (any question)
+
+    Parameters:
+        pick (str) : Count and comma separated filter terms. A term is a tag, "tag=<tag>" or "difficulty=<difficulty>"
+
+    Returns:
+        (tuple) : Number of questions, tags all matched, and difficulty matched (None for any)
+    """
+    count_text, _, terms = pick.partition(':')
+    try:
+        count = int(count_text)
+    except ValueError:
+        raise ValueError(f'Pick "{pick}" must start with a number of questions, ie. "20:networking"') from None
+    if count < 1:
+        raise ValueError(f'Pick "{pick}" must be of at least one question')
+
+    tags = []
+    difficulty = None
+    for term in filter(None, (term.strip() for term in terms.split(','))):
+        key, separator, value = term.partition('=')
+        if not separator:
+            key, value = 'tag', term
+        key = key.strip().lower()
+        if key == 'tag':
+            tags.append(normalize_label(value))
+        elif key == 'difficulty' and difficulty is None:
+            difficulty = normalize_label(value)
+        else:
+            raise ValueError(
+                f'Unknown filter "{term}" in pick "{pick}", must be a tag, "tag=<tag>" or one "difficulty=<difficulty>"'
+            )
+    return count, tuple(tags), difficulty
+
+
+class QuestionIndex:
+    """Tags and difficulty of the questions of one or more question banks, to find and read questions without loading the banks.
+
+    Each bank has its own index file next to it, built on first use and
+    again whenever the bank changes. Questions are numbered across all banks,
+    in bank order.
+
+    Usage:
+        index = QuestionIndex(['networking.yml', 'security.yml'])
+        numbers = index.pick([parse_pick('20:networking'), parse_pick('10:difficulty=hard')], seed)
+        index.write_exam_file('exam.yml', numbers)
+    """
+
+    def __init__(self, bank_paths: Sequence[str], rebuild: bool = False) -> None:
+        """Object constructor method. Loads, or builds, the index of each bank.
+
+        Parameters:
+            bank_paths (list) : Paths to local question banks (exam files)
+            rebuild (bool)    : If True, index every bank again even if its index is up to date
+        """
+        self.bank_paths = [os.path.abspath(bank_path) for bank_path in bank_paths]
+        self.indexes: list[dict] = []
+        self.offsets: list[memoryview] = []
+        self.bases: list[int] = []
+        self.built_count = 0
+
+        questions_count = 0
+        for bank_path in self.bank_paths:
+            index = None if rebuild else load_bank_index(bank_path)
+            if index is None:
+                logger.debug(f'Indexing question bank: {bank_path} ...')
+                index = build_bank_index(bank_path)
+                self.built_count += 1
+            self.indexes.append(index)
+            self.offsets.append(memoryview(index['offsets']).cast('Q'))
+            self.bases.append(questions_count)
+            questions_count += len(self.offsets[-1]) // 2
+        self.questions_count = questions_count
+
+    def __len__(self) -> int:
+        """Number of questions in all banks."""
+        return self.questions_count
+
+    def find(self, tags: Iterable[str] = (), difficulty: Optional[str] = None) -> set[int]:
+        """Find the questions with all of the given tags, and the given difficulty.
+
+        Parameters:
+            tags (list)      : Normalized tags the questions must all have, none for any
+            difficulty (str) : Normalized difficulty the questions must have, None for any
+
+        Returns:
+            (set) : Question numbers
+        """
+        tags = list(tags)
+        found: set[int] = set()
+        for index, base, offsets in zip(self.indexes, self.bases, self.offsets):
+            postings = [index['tags'].get(tag, b'') for tag in tags]
+            if difficulty is not None:
+                postings.append(index['difficulties'].get(difficulty, b''))
+            if not postings:
+                found.update(range(base, base + len(offsets) // 2))
+                continue
+            numbers = set(memoryview(postings[0]).cast('I'))
+            for posting in postings[1:]:
+                numbers.intersection_update(memoryview(posting).cast('I'))
+            found.update(base + number for number in numbers)
+        return found
+
+    def pick(self, picks: Iterable[tuple[int, tuple[str, ...], Optional[str]]], seed: int) -> list[int]:
+        """Draw questions for each pick, in pick order. A question is picked at most once.
+
+        Parameters:
+            picks (list) : Number of questions, tags and difficulty of each pick, see parse_pick()
+            seed (int)   : Seed of the random draw, the same seed picks the same questions
+
+        Returns:
+            (list) : Question numbers, in pick order
+        """
+        rng = random.Random(seed)
+        picked: list[int] = []
+        taken: set[int] = set()
+        for count, tags, difficulty in picks:
+            candidates = sorted(self.find(tags, difficulty) - taken)
+            if len(candidates) < count:
+                labels = ', '.join([*tags, *([f'difficulty={difficulty}'] if difficulty is not None else [])]) or 'any'
+                raise ValueError(f'Only {len(candidates)} questions left matching "{labels}", {count} wanted')
+            chosen = rng.sample(candidates, count)
+            picked.extend(chosen)
+            taken.update(chosen)
+        return picked
+
+    def read_question_text(self, number: int) -> bytes:
+        """Read the YAML text of one question from its bank, as the questions list item it is there.
+
+        Parameters:
+            number (int) : Question number
+
+        Returns:
+            (bytes) : YAML text of the question, with list item indentation removed
+        """
+        if not 0 <= number < self.questions_count:
+            raise IndexError('question number out of range')
+        bank = bisect_right(self.bases, number) - 1
+        local = number - self.bases[bank]
+        start, end = self.offsets[bank][2 * local], self.offsets[bank][2 * local + 1]
+        with open(self.bank_paths[bank], 'rb') as file:
+            file.seek(start)
+            text = file.read(end - start)
+
+        # Items of another bank may be indented differently, all items of the assembled exam must line up
+        lines = text.splitlines(keepends=True)
+        indent = len(lines[0]) - len(lines[0].lstrip(b' '))
+        return b''.join(line[min(indent, len(line) - len(line.lstrip(b' '))) :] for line in lines)
+
+    def get_exam_information(self) -> dict:
+        """Get the exam information of an assembled exam, from the first question bank that has any.
+
+        Returns:
+            (dict) : Contents of the "exam" section
+        """
+        exam = dict(DEFAULT_EXAM, exam_edit_date=date.today().strftime('%m/%d/%Y'))
+        for bank_path in self.bank_paths:
+            header, _ = read_examfile_header(bank_path)
+            bank_exam = (utility.load_yaml(header) or {}).get('exam')
+            if isinstance(bank_exam, dict):
+                exam.update(bank_exam)
+                break
+        return exam
+
+    def write_exam_file(
+        self, file_path: str, numbers: Iterable[int], exam: Optional[dict] = None, comment: str = ''
+    ) -> None:
+        """Write a ready to run exam file with the given questions, copied as they are written in their banks.
+
+        Parameters:
+            file_path (str) : Path of the exam file
+            numbers (list)  : Question numbers, in exam order
+            exam (dict)     : Contents of the "exam" section, default from get_exam_information()
+            comment (str)   : Comment line at the top of the file, if any
+        """
+        import yaml
+
+        exam = exam if exam is not None else self.get_exam_information()
+        parts = [f'# {comment}\n'.encode()] if comment else []
+        parts.append(b'---\n')
+        parts.append(yaml.safe_dump({'exam': exam}, sort_keys=False, allow_unicode=True, width=1000).encode('utf-8'))
+        parts.append(b'\nquestions:\n')
+        for number in numbers:
+            text = self.read_question_text(number)
+            lines = text.splitlines(keepends=True)
+            parts.extend(QUESTION_INDENT + line if line.strip() else line for line in lines)
+            if not text.endswith(b'\n'):
+                parts.append(b'\n')
+        write_atomic(file_path, b''.join(parts))
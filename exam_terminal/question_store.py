@@ -0,0 +1,416 @@
+"""Compact columnar store of parsed exam questions and their answered state."""
+
+import logging
+import math
+from array import array
+from collections.abc import Iterable, Iterator, MutableMapping, Sequence
+from typing import Any, Callable, Optional
+
+from exam_terminal.answer_evaluation import count_bits, indexes_to_mask, mask_to_indexes
+
+logger = logging.getLogger()
+
+# Not set timestamps and times are NaN
+UNSET = math.nan
+
+# Answered state flags, one byte per question
+_ANSWERED = 1
+_CORRECT = 2
+_HAS_CORRECT = 4
+_TIMEOUT = 8
+_SELECTING = 16
+
+# Question keys the store keeps in its own columns, everything else is kept as is
+STORED_KEYS = frozenset(
+    (
+        'question',
+        'selection',
+        'question_number',
+        'question_allowed_time',
+        'question_weight',
+        'question_section',
+        'question_answer_indexes',
+        'question_answer_bool',
+        'question_multiselect',
+        'question_min_selection_count',
+        'answered',
+        'answered_indexes',
+        'answered_correct_bool',
+        'answered_correctly',
+        'answered_timeout',
+        'question_presented_timestamp',
+        'answered_timestamp',
+        'answered_exam_time',
+        'answered_question_time',
+    )
+)
+
+
+def _append_column(column, value: int):
+    """Append a value to an unsigned 64 bit column, widening it to a list for larger masks.
+
+    Returns:
+        (array or list) : The column, which may be a new list
+    """
+    try:
+        column.append(value)
+    except OverflowError:
+        column = list(column)
+        column.append(value)
+    return column
+
+
+def _set_column(column, index: int, value: int):
+    """Set a value of an unsigned 64 bit column, widening it to a list for larger masks.
+
+    Returns:
+        (array or list) : The column, which may be a new list
+    """
+    try:
+        column[index] = value
+    except OverflowError:
+        column = list(column)
+        column[index] = value
+    return column
+
+
+def _parse_selections(selection_list: Iterable, pool: dict) -> tuple[tuple, int]:
+    """Selection texts and correct answers of a question. A selection with a value
+    is a correct answer if the value is true.
+
+    Parameters:
+        selection_list (iterable) : Selections as loaded from the exam file
+        pool (dict)               : Selection texts seen so far, repeated ones are stored once
+
+    Returns:
+        (tuple) : Selection texts, and bitmask of correct selections
+    """
+    selections = []
+    answer_mask = 0
+    for i, selection in enumerate(selection_list):
+        text = selection
+        if isinstance(selection, dict):
+            text = next(iter(selection))
+            if selection[text]:
+                answer_mask |= 1 << i
+        selections.append(pool.setdefault(text, text) if type(text) is str else text)
+    return tuple(selections), answer_mask
+
+
+class QuestionStore(Sequence):
+    """Parsed exam questions kept in columns instead of one dict per question.
+
+    Correct answers and selected answers are bitmasks, timestamps are arrays of
+    doubles, and selection texts are interned while the store is built, so
+    repeated selections (ie. "True" and "False") are stored once. Indexing the store gives a
+    QuestionView, which reads and writes like the question dicts it replaces.
+
+    Usage:
+        store = QuestionStore(exam_contents['questions'])
+        store[0]['question']
+        store[0]['answered'] = True
+        store.reset()  # New exam attempt
+    """
+
+    def __init__(self, questions: Iterable[dict] = ()) -> None:
+        """Object constructor method.
+
+        Parameters:
+            questions (iterable) : Question dicts as loaded from the exam file, or already parsed
+        """
+        # Questions, fixed for the exam
+        self.texts: list = []
+        self.selections: list[tuple] = []
+        self.answer_masks: Any = array('Q')
+        self.allowed_times = array('d')
+        self.weights = array('d')
+        self.sections: list = []
+
+        # Any other question keys, only for questions that have them
+        self.extras: dict[int, dict] = {}
+
+        # Answered state, reset for every exam attempt
+        self.flags = bytearray()
+        self.answered_masks: Any = array('Q')
+        self.presented_timestamps = array('d')
+        self.answered_timestamps = array('d')
+        self.answered_exam_times = array('d')
+        self.answered_question_times = array('d')
+
+        # Only kept while building, unlike sys.intern() it does not hold on to every unique text
+        pool: dict = {}
+        for question in questions:
+            self.append(question, pool)
+
+    def append(self, question: dict, pool: Optional[dict] = None) -> None:
+        """Parse a question dict and add it to the end of the store. The dict is not changed.
+
+        Parameters:
+            question (dict) : Question as loaded from the exam file, or already parsed
+            pool (dict)     : Selection texts and selection lists seen so far, repeated ones are stored once
+        """
+        if pool is None:
+            pool = {}
+        index = len(self.texts)
+        selections, answer_mask = _parse_selections(question['selection'], pool)
+
+        # Already parsed (ie. compiled exam file), answers are known
+        if 'question_answer_indexes' in question:
+            answer_mask = indexes_to_mask(question['question_answer_indexes'])
+
+        self.texts.append(question['question'])
+        self.selections.append(pool.setdefault(selections, selections))
+        self.answer_masks = _append_column(self.answer_masks, answer_mask)
+
+        extras = {key: value for key, value in question.items() if key not in STORED_KEYS}
+        self.__append_checked_columns(question, pool, extras)
+        if extras:
+            self.extras[index] = extras
+
+        self.flags.append(0)
+        self.answered_masks.append(0)
+        for column in (
+            self.presented_timestamps,
+            self.answered_timestamps,
+            self.answered_exam_times,
+            self.answered_question_times,
+        ):
+            column.append(UNSET)
+
+    def __append_checked_columns(self, question: dict, pool: dict, extras: dict) -> None:
+        """Append the question keys that have their own column, if valid.
+
+        Parameters:
+            question (dict) : Question being added
+            pool (dict)     : Texts seen so far, repeated ones are stored once
+            extras (dict)   : Other question keys, invalid values are added to it as is
+        """
+        for key, (column, is_valid, unset) in _CHECKED_COLUMNS.items():
+            value = question.get(key)
+            if is_valid(value):
+                getattr(self, column).append(pool.setdefault(value, value) if type(value) is str else value)
+                continue
+            getattr(self, column).append(unset)
+            if key in question:
+                # Kept as is, ie. a question time that is not a whole number shows no question timer
+                extras[key] = value
+
+    def reset(self) -> None:
+        """Forget all answers, for example for a new exam attempt."""
+        count = len(self.texts)
+        self.flags = bytearray(count)
+        self.answered_masks = array('Q', bytes(8 * count))
+        self.presented_timestamps = array('d', [UNSET]) * count
+        self.answered_timestamps = array('d', [UNSET]) * count
+        self.answered_exam_times = array('d', [UNSET]) * count
+        self.answered_question_times = array('d', [UNSET]) * count
+
+    def is_multiselect(self, index: int) -> bool:
+        """True if a question has more than one correct selection."""
+        return count_bits(self.answer_masks[index]) > 1
+
+    def set_answered_mask(self, index: int, mask: int) -> None:
+        """Set the selected selections of a question as a bitmask.
+
+        Parameters:
+            index (int) : Question index
+            mask (int)  : Bitmask of selected selections
+        """
+        self.answered_masks = _set_column(self.answered_masks, index, mask)
+        self.flags[index] |= _SELECTING
+
+    ###############################################################################################
+
+    def __len__(self) -> int:
+        """Number of questions."""
+        return len(self.texts)
+
+    def __getitem__(self, index):
+        """Get a question view.
+
+        Parameters:
+            index (int or slice) : Question index or slice of indexes
+
+        Returns:
+            (QuestionView or list) : Question view, or a list of question views for a slice
+        """
+        if isinstance(index, slice):
+            return [QuestionView(self, i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('question index out of range')
+        return QuestionView(self, index)
+
+    def __iter__(self) -> Iterator['QuestionView']:
+        """Iterate over question views in order."""
+        for index in range(len(self)):
+            yield QuestionView(self, index)
+
+
+###################################################################################################
+
+
+def _get_flag(flag: int) -> Callable[['QuestionStore', int], bool]:
+    return lambda store, index: bool(store.flags[index] & flag)
+
+
+def _set_flag(flag: int, has_flag: int = 0) -> Callable[['QuestionStore', int, Any], None]:
+    def setter(store: QuestionStore, index: int, value: Any) -> None:
+        store.flags[index] = (store.flags[index] & ~flag | has_flag) | (flag if value else 0)
+
+    return setter
+
+
+def _time_column(name: str) -> tuple[Callable, Callable, Callable]:
+    return (
+        lambda store, index: getattr(store, name)[index],
+        lambda store, index, value: getattr(store, name).__setitem__(index, value),
+        lambda store, index: not math.isnan(getattr(store, name)[index]),
+    )
+
+
+def _always(store: QuestionStore, index: int) -> bool:
+    return True
+
+
+def _is_whole_number(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_text(value: Any) -> bool:
+    return isinstance(value, str)
+
+
+# Store column, check and not set value of question keys that have their own column if valid
+_CHECKED_COLUMNS: dict[str, tuple[str, Callable[[Any], bool], Any]] = {
+    'question_allowed_time': ('allowed_times', _is_whole_number, UNSET),
+    'question_weight': ('weights', _is_number, UNSET),
+    'question_section': ('sections', _is_text, None),
+}
+
+
+# Getter, setter (None if derived) and presence check of each stored question key
+_FIELDS: dict[str, tuple[Callable, Any, Callable]] = {
+    'question': (
+        lambda store, index: store.texts[index],
+        lambda store, index, value: store.texts.__setitem__(index, value),
+        _always,
+    ),
+    'selection': (lambda store, index: list(store.selections[index]), None, _always),
+    'question_number': (lambda store, index: index, None, _always),
+    'question_allowed_time': (
+        lambda store, index: int(store.allowed_times[index]),
+        lambda store, index, value: store.allowed_times.__setitem__(index, value),
+        lambda store, index: not math.isnan(store.allowed_times[index]),
+    ),
+    'question_weight': (
+        lambda store, index: store.weights[index],
+        lambda store, index, value: store.weights.__setitem__(index, value),
+        lambda store, index: not math.isnan(store.weights[index]),
+    ),
+    'question_section': (
+        lambda store, index: store.sections[index],
+        lambda store, index, value: store.sections.__setitem__(index, value),
+        lambda store, index: store.sections[index] is not None,
+    ),
+    'question_answer_indexes': (lambda store, index: mask_to_indexes(store.answer_masks[index]), None, _always),
+    'question_answer_bool': (
+        lambda store, index: [bool(store.answer_masks[index] >> i & 1) for i in range(len(store.selections[index]))],
+        None,
+        _always,
+    ),
+    'question_multiselect': (lambda store, index: store.is_multiselect(index), None, _always),
+    'question_min_selection_count': (lambda store, index: count_bits(store.answer_masks[index]), None, _always),
+    'answered': (_get_flag(_ANSWERED), _set_flag(_ANSWERED), _always),
+    'answered_indexes': (
+        lambda store, index: mask_to_indexes(store.answered_masks[index]),
+        lambda store, index, value: store.set_answered_mask(index, indexes_to_mask(value)),
+        lambda store, index: bool(store.flags[index] & _SELECTING),
+    ),
+    'answered_correctly': (
+        _get_flag(_CORRECT),
+        _set_flag(_CORRECT, _HAS_CORRECT),
+        lambda store, index: bool(store.flags[index] & _HAS_CORRECT),
+    ),
+    'answered_timeout': (_get_flag(_TIMEOUT), _set_flag(_TIMEOUT), _get_flag(_TIMEOUT)),
+    'question_presented_timestamp': _time_column('presented_timestamps'),
+    'answered_timestamp': _time_column('answered_timestamps'),
+    'answered_exam_time': _time_column('answered_exam_times'),
+    'answered_question_time': _time_column('answered_question_times'),
+}
+
+
+class QuestionView(MutableMapping):
+    """Dict-like view of one question of a QuestionStore, for code written against question dicts.
+
+    Values are read from and written to the store columns. Lists returned by
+    the view (ie. "answered_indexes") are copies, assign them back to change
+    the question.
+    """
+
+    __slots__ = ('store', 'index')
+
+    def __init__(self, store: QuestionStore, index: int) -> None:
+        """Object constructor method.
+
+        Parameters:
+            store (QuestionStore) : Store the question is kept in
+            index (int)           : Question index
+        """
+        self.store = store
+        self.index = index
+
+    def __getitem__(self, key: str) -> Any:
+        field = _FIELDS.get(key)
+        if field is None or not field[2](self.store, self.index):
+            extras = self.store.extras.get(self.index)
+            if extras is None or key not in extras:
+                raise KeyError(key)
+            return extras[key]
+        return field[0](self.store, self.index)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        field = _FIELDS.get(key)
+        if field is None:
+            self.store.extras.setdefault(self.index, {})[key] = value
+            return
+        if field[1] is None:
+            raise TypeError(f'Question key "{key}" is derived from the exam file and can not be set')
+        if key in _CHECKED_COLUMNS:
+            self.store.extras.get(self.index, {}).pop(key, None)
+            column, is_valid, unset = _CHECKED_COLUMNS[key]
+            if not is_valid(value):
+                getattr(self.store, column)[self.index] = unset
+                self.store.extras.setdefault(self.index, {})[key] = value
+                return
+        field[1](self.store, self.index, value)
+
+    def __delitem__(self, key: str) -> None:
+        extras = self.store.extras.get(self.index)
+        if key in _FIELDS or extras is None or key not in extras:
+            raise KeyError(key)
+        del extras[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for key, field in _FIELDS.items():
+            if field[2](self.store, self.index):
+                yield key
+        yield from self.store.extras.get(self.index, {})
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, QuestionView):
+            return self.store is other.store and self.index == other.index
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f'QuestionView({dict(self)!r})'
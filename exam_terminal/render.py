@@ -0,0 +1,74 @@
+"""Retained-mode screen rendering with damage tracking."""
+
+import curses
+import logging
+from typing import Any
+
+logger = logging.getLogger()
+
+
+class RetainedFrame:
+    """Keeps the static parts of a curses screen drawn between frames.
+
+    Static regions (border, text, selections) are only erased and redrawn when
+    the state they depend on changes. Dynamic lines (timers, progress bars) are
+    erased and redrawn individually on every frame. Frames are pushed out with
+    noutrefresh/doupdate so curses only sends the characters that changed.
+
+    Usage:
+        frame = RetainedFrame()
+        if frame.is_damaged(scr, selection_index, paused):
+            ... draw static regions ...
+        frame.erase_line(scr, y)
+        ... draw dynamic line ...
+        frame.present(scr)
+    """
+
+    def __init__(self) -> None:
+        """Object constructor method."""
+        self.state: Any = None
+
+    def invalidate(self) -> None:
+        """Force the static regions to be redrawn on the next frame."""
+        self.state = None
+
+    def is_damaged(self, scr, *state: Any) -> bool:
+        """Check if the static regions need to be redrawn. If so, erase the screen.
+
+        The terminal size is always part of the state, so a resize redraws everything.
+
+        Parameters:
+            scr (obj)    : Handle for curses terminal screen handle
+            state (Any)  : Anything the static regions depend on, must be comparable
+
+        Returns:
+            (bool) : True if static regions were erased and must be drawn, else False
+        """
+        state = (scr.getmaxyx(), *state)
+        if state == self.state:
+            return False
+        self.state = state
+        scr.erase()
+        return True
+
+    @staticmethod
+    def erase_line(scr, y: int) -> None:
+        """Blank a single line inside the screen border.
+
+        Parameters:
+            scr (obj) : Handle for curses terminal screen handle
+            y (int)   : The line/row number from top of the screen
+        """
+        term_height, term_width = scr.getmaxyx()
+        if 0 < y < term_height - 1:
+            scr.addstr(y, 1, ' ' * (term_width - 2))
+
+    @staticmethod
+    def present(scr) -> None:
+        """Push the frame to the terminal, only sending what changed.
+
+        Parameters:
+            scr (obj) : Handle for curses terminal screen handle
+        """
+        scr.noutrefresh()
+        curses.doupdate()
@@ -0,0 +1,450 @@
+"""Machine-readable exam result export (JSON, JSONL and CSV), and reading the results back."""
+
+import csv
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from statistics import mean, median, stdev
+from time import gmtime, strftime
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:
+    # Windows, appends rely on O_APPEND alone
+    fcntl = None
+
+logger = logging.getLogger()
+
+# Exam result formats, the first one is the default
+RESULT_FORMATS = ('pdf', 'json', 'jsonl', 'csv')
+
+# All exam results in JSONL format are appended to this one file
+RESULTS_JSONL_FILENAME = 'Exam_Results.jsonl'
+
+# Question fields included in exported results, if present
+QUESTION_FIELDS = (
+    'question_number',
+    'question',
+    'selection',
+    'question_answer_indexes',
+    'question_multiselect',
+    'question_tags',
+    'question_difficulty',
+    'answered',
+    'answered_indexes',
+    'answered_correctly',
+    'question_presented_timestamp',
+    'answered_timestamp',
+    'answered_exam_time',
+    'answered_question_time',
+)
+
+# Columns of CSV results, one row per question
+CSV_EXAM_COLUMNS = (
+    'exam_title',
+    'exam_begin_datestring',
+    'exam_end_datestring',
+    'evaluation_percent',
+    'evaluation_label',
+)
+CSV_QUESTION_COLUMNS = (
+    'question_number',
+    'question',
+    'answered',
+    'answered_indexes',
+    'question_answer_indexes',
+    'answered_correctly',
+    'answered_question_time',
+    'answered_exam_time',
+)
+
+
+def get_result_file_path(exam_contents: dict, results_format: str, directory: str = '.') -> str:
+    """Get the path of the exam result file for a result format.
+
+    Files are named after the exam attempt (begin time, process, and attempt
+    number), so two exams ending in the same minute never overwrite each other.
+
+    Parameters:
+        exam_contents (dict)  : Evaluated exam contents
+        results_format (str)  : One of RESULT_FORMATS
+        directory (str)       : Directory to save the file in
+
+    Returns:
+        (str) : Absolute path of the result file
+    """
+    if results_format == 'jsonl':
+        return os.path.abspath(os.path.join(directory, RESULTS_JSONL_FILENAME))
+    attempt_id = exam_contents['exam'].get('exam_attempt_id')
+    if not attempt_id:
+        attempt_id = datetime.fromtimestamp(exam_contents['exam']['exam_end_timestamp']).strftime('%Y%m%d-%H%M%S')
+    return os.path.abspath(os.path.join(directory, f'Exam_Result_Summary_{attempt_id}.{results_format}'))
+
+
+def get_result_record(exam_contents: dict, questions: Iterable[dict]) -> dict:
+    """Collect the exam information, evaluation and answers into one serializable record.
+
+    A result record holds everything needed to present the results later,
+    for example to render its PDF report with "exam-terminal report":
+
+        {"id": "...", "exam": {"exam_title": ..., "evaluation_label": ...}, "questions": [{"question": ..., "answered": true, ...}]}
+
+    Parameters:
+        exam_contents (dict) : Evaluated exam contents
+        questions (iterable) : Questions to include
+
+    Returns:
+        (dict) : Exam result record
+    """
+    return {
+        'id': exam_contents['exam'].get('exam_attempt_id'),
+        'exam': dict(exam_contents['exam']),
+        'questions': [
+            {field: question[field] for field in QUESTION_FIELDS if field in question} for question in questions
+        ],
+    }
+
+
+def get_report_file_name(record: dict) -> str:
+    """Get the PDF report file name of a result record.
+
+    The name only depends on the record, so rendering the same results again
+    gives the same file, and different attempts never share a name.
+
+    Parameters:
+        record (dict) : Exam result record
+
+    Returns:
+        (str) : File name
+    """
+    title = re.sub(r'[^A-Za-z0-9]+', '_', str(record['exam'].get('exam_title') or 'Exam')).strip('_')[:40] or 'Exam'
+    record_id = (
+        record.get('id')
+        or hashlib.sha256(json.dumps(record, sort_keys=True, default=str).encode('utf-8')).hexdigest()[:16]
+    )
+    return f'{title}_{re.sub(r"[^A-Za-z0-9.-]+", "_", str(record_id))}_Exam_Result_Report.pdf'
+
+
+def read_result_records(paths: Iterable[str]) -> Iterator[dict]:
+    """Read exam result records from JSON files, JSONL files, and directories of them.
+
+    Parameters:
+        paths (iterable) : Paths to .json or .jsonl result files, or directories containing them
+
+    Returns:
+        (iterator) : Exam result records, invalid ones are logged and skipped
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            file_paths = [
+                os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith(('.json', '.jsonl'))
+            ]
+        else:
+            file_paths = [path]
+
+        for file_path in file_paths:
+            try:
+                with open(file_path) as file:
+                    if file_path.endswith('.jsonl'):
+                        for line_number, line in enumerate(file, start=1):
+                            if not line.strip():
+                                continue
+                            try:
+                                yield json.loads(line)
+                            except ValueError as e:
+                                logger.error(
+                                    f'Skipping result record on line {line_number} of "{file_path}", not valid JSON. Exception: {e}'
+                                )
+                    else:
+                        yield json.load(file)
+            except (OSError, ValueError) as e:
+                logger.error(f'Skipping result file "{file_path}". Exception: {e}')
+
+
+def assemble_exam_results(exam: dict, answered_questions: list) -> dict:
+    """Evaluate the exam results for presentation.
+
+    Parameters:
+        exam (dict)               : Evaluated exam information
+        answered_questions (list) : Answered questions, with their answer information
+
+    Returns:
+        results (dict) : Combined and formatted exam results for presentation
+    """
+    results = {}
+    index = 0
+
+    results[index] = {
+        'label': 'Exam Title:',
+        'text': exam['exam_title'],  # TODO: Wrap or truncate
+        'color': 'default',
+        'decor': 'bold',
+        'font_width': '',
+        'skip_lines': 1,
+    }
+    index += 1
+
+    results[index] = {
+        'label': 'Result:',
+        'text': exam['evaluation_label'],
+        'color': 'blue',
+        'decor': 'bold',
+        'font_width': '',
+        'skip_lines': 2,
+    }
+    index += 1
+
+    results[index] = {
+        'label': 'Correct:',
+        'text': f'{exam["evaluation_percent"]:3.1f}% ({exam["exam_questions_correct"]} of {exam["exam_questions_count"]}) (Needed: {exam["exam_passing_score"]}%)',
+        'color': 'default',
+        'decor': 'normal',
+        'font_width': '',
+        'skip_lines': 1,
+    }
+    index += 1
+
+    # Only listed for exams not scored by the number of correct answers, see scoring.ExamScoring
+    score = exam.get('exam_score')
+    if score:
+        results[index] = {
+            'label': 'Score:',
+            'text': f'{score["points"]:g} of {score["max_points"]:g} points ({score["scoring"].replace("_", " ")})',
+            'color': 'default',
+            'decor': 'normal',
+            'font_width': '',
+            'skip_lines': 1,
+        }
+        index += 1
+
+        if score['sections']:
+            results[index] = {
+                'label': 'Sections:',
+                'text': ', '.join(f'{name} {section["percent"]:.0f}%' for name, section in score['sections'].items()),
+                'color': 'default',
+                'decor': 'normal',
+                'font_width': '',
+                'skip_lines': 1,
+            }
+            index += 1
+
+    results[index] = {
+        'label': 'Questions Answered:',
+        'text': f'{exam["exam_questions_answered"]} of {exam["exam_questions_count"]}',
+        'color': 'default',
+        'decor': 'normal',
+        'font_width': '',
+        'skip_lines': 1,
+    }
+    index += 1
+
+    results[index] = {
+        'label': 'Exam Complete Time:',
+        'text': f'{strftime("%H:%M:%S", gmtime(exam["exam_elapsed_time"]))}',
+        'color': 'default',
+        'decor': 'normal',
+        'font_width': '',
+        'skip_lines': 1,
+    }
+    index += 1
+
+    results[index] = {
+        'label': 'Exam Time Range:',
+        'text': f'{exam["exam_begin_datestring"]} -> {exam["exam_end_datestring"]}',
+        'color': 'default',
+        'decor': 'normal',
+        'font_width': '',
+        'skip_lines': 2,
+    }
+    index += 1
+
+    results[index] = {
+        'label': 'Number of Times Paused:',
+        'text': str(exam['exam_paused_count']),
+        'color': 'default',
+        'decor': 'normal',
+        'font_width': '',
+        'skip_lines': 1,
+    }
+    index += 1
+
+    results[index] = {
+        'label': 'Elapsed Paused Time:',
+        'text': f'{strftime("%H:%M:%S", gmtime(exam["exam_paused_elapsed_time"]))}',
+        'color': 'default',
+        'decor': 'normal',
+        'font_width': '',
+        'skip_lines': 1,
+    }
+    index += 1
+
+    width = 33
+    answer_distribution = ['.'] * width
+    for question in answered_questions:
+        answer_distribution[int((question['answered_exam_time'] / exam['exam_elapsed_time']) * width) - 1] = 'x'
+    results[index] = {
+        'label': 'Answers Over Exam Time:',
+        'text': f'[ 0.0s ]{"".join(answer_distribution)}[ {exam["exam_elapsed_time"]:.1f}s ]',
+        'color': 'default',
+        'decor': 'normal',
+        'font_width': 'fixed',
+        'skip_lines': 1,
+    }
+    index += 1
+
+    answer_times = []
+    for question in answered_questions:
+        answer_times.append(question['answered_question_time'])
+    if answer_times:
+        end_time = max(answer_times) * 1.25
+    else:
+        end_time = 1
+    width = 33
+    answer_distribution = ['.'] * width
+    for answer_time in answer_times:
+        answer_distribution[int((answer_time / end_time) * width) - 1] = 'x'
+    results[index] = {
+        'label': 'Answer Times:',
+        'text': f'[ 0.0s ]{"".join(answer_distribution)}[ {end_time:.1f}s ]',
+        'color': 'default',
+        'decor': 'normal',
+        'font_width': 'fixed',
+        'skip_lines': 1,
+    }
+    index += 1
+
+    if len(answer_times) > 1:
+        times_mean = mean(answer_times)
+        times_std = stdev(answer_times)
+        times_median = median(answer_times)
+
+    else:
+        times_mean = 0
+        times_std = 0
+        times_median = 0
+
+    results[index] = {
+        'label': 'Average Time Per Answer:',
+        'text': f'{times_mean:.1f} +/- {times_std:.2f} seconds',
+        'color': 'default',
+        'decor': 'normal',
+        'font_width': '',
+        'skip_lines': 1,
+    }
+    index += 1
+
+    results[index] = {
+        'label': 'Median Time Per Answer:',
+        'text': f'{times_median:.1f} seconds',
+        'color': 'default',
+        'decor': 'normal',
+        'font_width': '',
+        'skip_lines': 1,
+    }
+    index += 1
+
+    return results
+
+
+###############################################################################################
+
+
+def write_atomic(file_path: str, data: bytes) -> None:
+    """Write a file so that other processes never see it half written.
+
+    Parameters:
+        file_path (str) : Path of the file
+        data (bytes)    : File content
+    """
+    temp_file_path = f'{file_path}.{os.getpid()}.tmp'
+    with open(temp_file_path, 'wb') as file:
+        file.write(data)
+    os.replace(temp_file_path, file_path)
+
+
+def append_jsonl(file_path: str, record: dict) -> None:
+    """Append one JSON record line to a JSONL file, safe with many concurrent writers.
+
+    The line is written with a single append under an exclusive file lock, so
+    lines from different processes never interleave.
+
+    Parameters:
+        file_path (str) : Path to the JSONL file
+        record (dict)   : Record to append
+    """
+    data = (json.dumps(record, default=str) + '\n').encode('utf-8')
+    fd = os.open(file_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        if fcntl:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        # Closing releases the lock
+        os.close(fd)
+
+
+def format_results_csv(record: dict) -> str:
+    """Format an exam result record as CSV, one row per question.
+
+    Parameters:
+        record (dict) : Exam result record
+
+    Returns:
+        (str) : CSV text with header
+    """
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(CSV_EXAM_COLUMNS + CSV_QUESTION_COLUMNS)
+    exam_values = [record['exam'].get(column) for column in CSV_EXAM_COLUMNS]
+    for question in record['questions']:
+        question_values = []
+        for column in CSV_QUESTION_COLUMNS:
+            value = question.get(column)
+            if isinstance(value, list):
+                value = ' '.join(str(v) for v in value)
+            question_values.append(value)
+        writer.writerow(exam_values + question_values)
+    return output.getvalue()
+
+
+def export_results(
+    exam_contents: dict, questions: Iterable[dict], results_format: str, directory: str = '.'
+) -> Optional[str]:
+    """Export exam results as JSON, JSONL or CSV.
+
+    JSON and CSV results are written to a new file per exam. JSONL results are
+    appended to one shared file, one exam per line.
+
+    Parameters:
+        exam_contents (dict) : Evaluated exam contents
+        questions (iterable) : Questions to include
+        results_format (str) : "json", "jsonl", or "csv"
+        directory (str)      : Directory to save the file in
+
+    Returns:
+        (str) : Path of the written file, None if failed
+    """
+    file_path = get_result_file_path(exam_contents, results_format, directory)
+    record = get_result_record(exam_contents, questions)
+    try:
+        if results_format == 'json':
+            write_atomic(file_path, json.dumps(record, indent=2, default=str).encode('utf-8'))
+        elif results_format == 'jsonl':
+            append_jsonl(file_path, record)
+        elif results_format == 'csv':
+            write_atomic(file_path, format_results_csv(record).encode('utf-8'))
+        else:
+            raise ValueError(f'Unknown exam results format "{results_format}"')
+        logger.debug(f'Successfully saved exam results: {file_path}')
+    except (OSError, ValueError) as e:
+        logger.error(f'Failed to save exam results to "{file_path}". Exception: {e}')
+        return None
+    return file_path
@@ -0,0 +1,251 @@
+"""Exam scoring with question weights, partial credit, negative marking and section subscores."""
+
+import logging
+from array import array
+from collections.abc import Iterable, Mapping
+from typing import Callable, Optional
+
+from exam_terminal.answer_evaluation import is_correct, partial_credit
+
+logger = logging.getLogger()
+
+# Weight of questions that do not list one
+DEFAULT_WEIGHT = 1.0
+
+DEFAULT_SCORING_RULE = 'all_or_nothing'
+
+
+def all_or_nothing(selected_mask: int, answer_mask: int) -> float:
+    """Full credit if exactly all correct selections were selected, else none.
+
+    Parameters:
+        selected_mask (int) : Bitmask of selected selections
+        answer_mask (int)   : Bitmask of correct selections
+
+    Returns:
+        (float) : 1.0 or 0.0
+    """
+    return 1.0 if is_correct(selected_mask, answer_mask) else 0.0
+
+
+# Scoring rules by name, as listed under "exam_scoring" in the exam file.
+# A rule gives the fraction of the question weight earned for a selection, between 0.0 and 1.0.
+SCORING_RULES: dict[str, Callable[[int, int], float]] = {
+    'all_or_nothing': all_or_nothing,
+    'partial_credit': partial_credit,
+}
+
+
+def register_scoring_rule(name: str, rule: Callable[[int, int], float]) -> None:
+    """Add a scoring rule, to be used by exam files that list it under "exam_scoring".
+
+    Parameters:
+        name (str)      : Rule name
+        rule (callable) : Called with the selected and the correct selection bitmasks, returns the credit earned
+    """
+    SCORING_RULES[name] = rule
+
+
+class ExamScoring:
+    """Scoring settings of an exam: the scoring rule, negative marking, and the weight and section of each question.
+
+    Exam file settings, all optional:
+
+        exam:
+          exam_scoring: partial_credit   # Or all_or_nothing (default)
+          exam_negative_marking: 0.25    # Fraction of the weight lost for a wrong answer
+        questions:
+          - question: ...
+            question_weight: 2           # Default 1
+            question_section: Networking
+
+    Usage:
+        scoring = ExamScoring.from_exam_contents(exam_contents)
+        score = scoring.new_score()
+        score.add(index, selected_mask, answer_mask)
+    """
+
+    def __init__(self, rule: str = DEFAULT_SCORING_RULE, negative_marking: float = 0.0) -> None:
+        """Object constructor method.
+
+        Parameters:
+            rule (str)               : Name of a scoring rule in SCORING_RULES
+            negative_marking (float) : Fraction of the question weight lost for a wrong answer
+        """
+        if rule not in SCORING_RULES:
+            raise ValueError(f'Unknown scoring rule "{rule}", must be one of: {", ".join(SCORING_RULES)}')
+        self.rule_name = rule
+        self.rule = SCORING_RULES[rule]
+        self.negative_marking = negative_marking
+
+        self.weights = array('d')
+        self.sections: list[Optional[str]] = []
+        self.section_max_points: dict[str, float] = {}
+        self.known_max_points = 0.0
+        self.is_weighted = False
+
+        # Total number of questions, may be more than the ones added so far (ie. lazily loaded questions)
+        self.questions_count = 0
+
+    @classmethod
+    def from_exam_contents(cls, exam_contents: dict, questions: Optional[Iterable[Mapping]] = None) -> 'ExamScoring':
+        """Get the scoring settings of an exam. Invalid settings are logged and left at their defaults.
+
+        Parameters:
+            exam_contents (dict) : Loaded exam contents
+            questions (iterable) : Questions to add right away (default none, add them with add_question())
+
+        Returns:
+            (ExamScoring) : Scoring settings
+        """
+        exam = exam_contents.get('exam', {})
+        rule = exam.get('exam_scoring', DEFAULT_SCORING_RULE)
+        if rule not in SCORING_RULES:
+            logger.error(f'Unknown exam_scoring "{rule}", using "{DEFAULT_SCORING_RULE}"')
+            rule = DEFAULT_SCORING_RULE
+        negative_marking = exam.get('exam_negative_marking', 0.0)
+        if (
+            not isinstance(negative_marking, (int, float))
+            or isinstance(negative_marking, bool)
+            or negative_marking < 0
+        ):
+            logger.error(f'exam_negative_marking must be a number of at least zero, got "{negative_marking}"')
+            negative_marking = 0.0
+
+        scoring = cls(rule, float(negative_marking))
+        for question in questions or ():
+            scoring.add_question(question.get('question_weight', DEFAULT_WEIGHT), question.get('question_section'))
+        return scoring
+
+    def add_question(self, weight: float = DEFAULT_WEIGHT, section: Optional[str] = None) -> None:
+        """Add the next question.
+
+        Parameters:
+            weight (float) : Highest points of the question, as listed under "question_weight"
+            section (str)  : Section the question counts towards, as listed under "question_section"
+        """
+        if not isinstance(weight, (int, float)) or isinstance(weight, bool) or not weight >= 0:
+            logger.error(
+                f'Question {len(self.weights) + 1} question_weight must be a number of at least zero, got "{weight}"'
+            )
+            weight = DEFAULT_WEIGHT
+        section = str(section) if section is not None else None
+
+        self.weights.append(weight)
+        self.sections.append(section)
+        self.known_max_points += weight
+        self.is_weighted = self.is_weighted or weight != DEFAULT_WEIGHT
+        if section is not None:
+            self.section_max_points[section] = self.section_max_points.get(section, 0.0) + weight
+        self.questions_count = max(self.questions_count, len(self.weights))
+
+    def __len__(self) -> int:
+        """Number of questions added."""
+        return len(self.weights)
+
+    @property
+    def max_points(self) -> float:
+        """Highest possible score. Questions not added yet count with the default weight."""
+        return self.known_max_points + max(self.questions_count - len(self.weights), 0) * DEFAULT_WEIGHT
+
+    @property
+    def is_default(self) -> bool:
+        """True if the score is simply the number of correct answers."""
+        return (
+            self.rule_name == DEFAULT_SCORING_RULE
+            and not self.negative_marking
+            and not self.is_weighted
+            and not self.section_max_points
+        )
+
+    def question_points(self, index: int, selected_mask: Optional[int], answer_mask: int) -> float:
+        """Points earned for the answer of one question.
+
+        Parameters:
+            index (int)         : Question index
+            selected_mask (int) : Bitmask of selected selections, None if the answer is not valid
+            answer_mask (int)   : Bitmask of correct selections
+
+        Returns:
+            (float) : Points, negative for a wrong answer with negative marking
+        """
+        weight = self.weights[index]
+        credit = self.rule(selected_mask, answer_mask) if selected_mask is not None else 0.0
+        if credit > 0:
+            return weight * credit
+        return -weight * self.negative_marking if self.negative_marking else 0.0
+
+    def new_score(self) -> 'ExamScore':
+        """Start the score of a new exam attempt."""
+        return ExamScore(self)
+
+
+class ExamScore:
+    """Running score of one exam attempt, updated as each answer comes in.
+
+    Usage:
+        score = scoring.new_score()
+        score.add(index, selected_mask, answer_mask)
+        score.percent
+    """
+
+    __slots__ = ('scoring', 'points', 'answered_max_points', 'section_points')
+
+    def __init__(self, scoring: ExamScoring) -> None:
+        """Object constructor method.
+
+        Parameters:
+            scoring (ExamScoring) : Scoring settings of the exam
+        """
+        self.scoring = scoring
+        self.points = 0.0
+        self.answered_max_points = 0.0
+        self.section_points: dict[str, float] = {}
+
+    def add(self, index: int, selected_mask: Optional[int], answer_mask: int) -> float:
+        """Score the answer of one question.
+
+        Parameters:
+            index (int)         : Question index
+            selected_mask (int) : Bitmask of selected selections, None if the answer is not valid
+            answer_mask (int)   : Bitmask of correct selections
+
+        Returns:
+            (float) : Points earned for the answer
+        """
+        points = self.scoring.question_points(index, selected_mask, answer_mask)
+        self.points += points
+        self.answered_max_points += self.scoring.weights[index]
+        section = self.scoring.sections[index]
+        if section is not None:
+            self.section_points[section] = self.section_points.get(section, 0.0) + points
+        return points
+
+    @property
+    def percent(self) -> float:
+        """Score so far in percent of the highest possible exam score."""
+        max_points = self.scoring.max_points
+        return self.points / max_points * 100 if max_points else 0.0
+
+    def get_summary(self) -> dict:
+        """Get the score, the highest possible score and the subscore of each section.
+
+        Returns:
+            (dict) : points, max_points, percent, scoring rule, negative_marking, and sections with their own points
+        """
+        sections = {}
+        for section, max_points in self.scoring.section_max_points.items():
+            points = self.section_points.get(section, 0.0)
+            sections[section] = {
+                'points': round(points, 3),
+                'max_points': round(max_points, 3),
+                'percent': round(points / max_points * 100, 3) if max_points else 0.0,
+            }
+        return {
+            'points': round(self.points, 3),
+            'max_points': round(self.scoring.max_points, 3),
+            'percent': round(self.percent, 3),
+            'scoring': self.scoring.rule_name,
+            'negative_marking': self.scoring.negative_marking,
+            'sections': sections,
+        }
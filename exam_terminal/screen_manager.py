@@ -0,0 +1,76 @@
+"""Single curses session shared by all exam-terminal views."""
+
+import curses
+import logging
+from typing import Any, Callable
+
+from exam_terminal import utility
+
+logger = logging.getLogger()
+
+
+class ScreenManager:
+    """Owns one curses session and switches views (menu, question, result) inside it.
+
+    Terminal initialization, terminal modes, and colors are set up only once
+    per session instead of once per view.
+
+    Usage:
+        screen = ScreenManager()
+        screen.run(some_function)  # some_function(screen) is called inside the session
+        screen.show(exam.draw_menu)
+    """
+
+    def __init__(self) -> None:
+        """Object constructor method."""
+        self.scr = None
+        self.color: dict = {}
+        self.decor: dict = {}
+
+    def run(self, session_function: Callable[..., Any], *args: Any) -> Any:
+        """Open the curses session and run a function within it.
+
+        Parameters:
+            session_function (callable): Called with this screen manager and passed args
+
+        Returns:
+            (Any) : Whatever the session function returns
+        """
+        return curses.wrapper(self.__session, session_function, *args)
+
+    def __session(self, scr, session_function: Callable[..., Any], *args: Any) -> Any:
+        """Set up the curses session once and hand it to the session function.
+
+        Parameters:
+            scr (obj)                  : Handle for curses terminal screen handle
+            session_function (callable): Called with this screen manager and passed args
+        """
+        logger.debug('Opening curses screen session ...')
+        self.scr = scr
+
+        # Hiding the cursor
+        curses.curs_set(0)
+
+        # Load curses colors
+        self.color, self.decor = utility.load_curses_colors_decor()
+
+        # Turn off echo
+        curses.noecho()
+
+        try:
+            return session_function(self, *args)
+        finally:
+            logger.debug('Closing curses screen session')
+            self.scr = None
+
+    def show(self, draw_function: Callable[..., Any], *args: Any) -> Any:
+        """Switch to another view within the open session.
+
+        Parameters:
+            draw_function (callable): View drawing function, called with the screen handle and passed args
+
+        Returns:
+            (Any) : Whatever the view drawing function returns
+        """
+        self.scr.erase()
+        return draw_function(self.scr, *args)
@@ -0,0 +1,108 @@
+"""Event driven input and redraw loop of the curses screens."""
+
+import curses
+import logging
+import math
+import os
+import signal
+import sys
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger()
+
+# Key passed to a screen step when it was woken up by a timer tick instead of a key press
+NO_KEY = -1
+
+
+def update_terminal_size() -> bool:
+    """Let curses know about a changed terminal size. Curses then queues a KEY_RESIZE key.
+
+    Returns:
+        (bool) : True if the terminal size changed, else False
+    """
+    try:
+        columns, lines = os.get_terminal_size(sys.__stdout__.fileno())
+    except (OSError, ValueError, AttributeError):
+        return False
+    if not curses.is_term_resized(lines, columns):
+        return False
+    curses.resizeterm(lines, columns)
+    return True
+
+
+def run_screen(scr, step: Callable[[int], Any], next_tick: Optional[Callable[[], Optional[float]]] = None) -> Any:
+    """Run a curses screen until its step function returns a result.
+
+    The step function handles one key and draws the screen, and returns None to
+    keep the screen going. It is called once with key 0 to draw the first frame,
+    then for every key press as soon as it comes in, and with NO_KEY whenever a
+    timer tick is due. Nothing is polled: the loop sleeps until the terminal
+    input is readable, the terminal is resized, or the next tick.
+
+    Parameters:
+        scr (obj)           : Handle for curses terminal screen handle
+        step (callable)     : Called with a key code, returns the screen result or None
+        next_tick (callable): Returns seconds until the screen next changes on its own, None if it never does
+
+    Returns:
+        (Any) : Result returned by the step function
+    """
+    # Imported on the first screen, not at startup, asyncio is slow to import
+    import asyncio
+
+    return asyncio.run(_run_screen(scr, step, next_tick))
+
+
+async def _run_screen(scr, step: Callable[[int], Any], next_tick: Optional[Callable[[], Optional[float]]]) -> Any:
+    """Asyncio side of run_screen(), with input and timer ticks as separate event sources."""
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    wakeup = asyncio.Event()
+
+    def on_resize() -> None:
+        update_terminal_size()
+        wakeup.set()
+
+    input_fd = sys.__stdin__.fileno()
+    resize_signal = getattr(signal, 'SIGWINCH', None)
+    scr.nodelay(True)
+    loop.add_reader(input_fd, wakeup.set)
+    if resize_signal:
+        loop.add_signal_handler(resize_signal, on_resize)
+
+    try:
+        result = step(0)
+        while result is None:
+            # Keys curses already read ahead (ie. typed during the previous screen) do not wake the loop
+            wakeup.clear()
+            k = scr.getch()
+            if k != NO_KEY:
+                result = step(k)
+                continue
+
+            try:
+                await asyncio.wait_for(wakeup.wait(), next_tick() if next_tick else None)
+            except asyncio.TimeoutError:
+                result = step(NO_KEY)
+        return result
+    finally:
+        loop.remove_reader(input_fd)
+        if resize_signal:
+            loop.remove_signal_handler(resize_signal)
+        scr.nodelay(False)
+
+
+def seconds_to_next_change(value: float, resolution: float = 1.0) -> float:
+    """Seconds until a time value, as displayed rounded to a resolution, shows something else.
+
+    Parameters:
+        value (float)      : Current time value in seconds
+        resolution (float) : Resolution the value is displayed with (ie. 1.0 for "{:.0f}", 0.1 for "{:.1f}")
+
+    Returns:
+        (float) : Seconds until the displayed value changes
+    """
+    # Rounded values change half way between two steps, wake up just after
+    next_change = (math.floor(value / resolution - 0.5) + 1.5) * resolution
+    return next_change - value + 0.001
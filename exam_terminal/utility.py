@@ -1,14 +1,16 @@
 import curses
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
 
-import requests
-import yaml
+from exam_terminal.http_cache import HttpCache
 
 url = str
 logger = logging.getLogger()
 
+# YAML loader and its backend name, imported on first use
+_yaml_loader: Optional[tuple[Any, str]] = None
+
 
 def load_curses_colors_decor() -> tuple[dict, dict]:
     """Load curses colors and decorations and load them in a usable
@@ -98,6 +100,8 @@ def load_keys() -> dict[str, Any]:
         'PAUSE': (ord('p'), ord('P')),
         'RESUME': (ord('r'), ord('R')),
         'QUIT': (27, ord('q'), ord('Q')),
+        'FORMAT': (ord('f'), ord('F')),
+        'RESIZE': (curses.KEY_RESIZE,),
     }
     return keys
 
@@ -254,6 +258,44 @@ def draw_vertical_seperator(scr, x: int, color: list) -> None:
     # NOTE: Currently unused but may come in handy
 
 
+def get_yaml_loader() -> tuple[Any, str]:
+    """Get the fastest available safe YAML loader. PyYAML is only imported when first needed.
+
+    Uses the libyaml based loader if PyYAML was built with it.
+
+    Returns:
+        loader (obj)  : YAML safe loader class
+        backend (str) : Name of the loader backend
+    """
+    global _yaml_loader  # noqa: PLW0603
+    if _yaml_loader is None:
+        import yaml
+
+        try:
+            _yaml_loader = (yaml.CSafeLoader, 'libyaml (CSafeLoader)')
+        except AttributeError:
+            _yaml_loader = (yaml.SafeLoader, 'pure Python (SafeLoader)')
+    return _yaml_loader
+
+
+def load_yaml(stream: Any) -> Any:
+    """Safely load YAML content with the fastest available loader.
+
+    Parameters:
+        stream (Any) : YAML text, bytes, or open file
+
+    Returns:
+        (Any) : The loaded YAML content
+    """
+    loader_class, backend = get_yaml_loader()
+    logger.debug(f'Loading YAML with {backend} loader')
+    loader = loader_class(stream)
+    try:
+        return loader.get_single_data()
+    finally:
+        loader.dispose()
+
+
 def load_examfile_contents_from_local_file(local_file_path: str) -> dict:
     """Loading a local file exam contents.
 
@@ -267,7 +309,7 @@ def load_examfile_contents_from_local_file(local_file_path: str) -> dict:
     logger.debug(f"Loading specified local exam file: '{local_file_path}' ...")
     try:
         with open(local_file_path) as file:
-            file_contents = yaml.safe_load(file)
+            file_contents = load_yaml(file)
         logger.debug('Successfully loaded local exam file')
     except Exception as e:
         logger.error(f"Failed to load specified local exam file: '{local_file_path}'. Exception: {e}")
@@ -275,12 +317,125 @@ def load_examfile_contents_from_local_file(local_file_path: str) -> dict:
     return file_contents
 
 
-def load_examfile_contents_from_url(remote_file_url: url, allow_redirects: bool = True) -> dict:
+# Largest remote exam file that will be downloaded
+REMOTE_FILE_MAX_BYTES = 1_000_000
+
+
+class RemoteFileTooLargeError(Exception):
+    """Raised when a remote exam file goes past the download size limit."""
+
+
+class CappedResponseReader:
+    """File-like reader over a streamed HTTP response, stopping past a byte limit.
+
+    Lets the YAML parser read the response as it downloads, without ever
+    holding more than the byte limit in memory.
+    """
+
+    def __init__(self, response, max_bytes: int, chunk_size: int = 16384) -> None:
+        """Object constructor method.
+
+        Parameters:
+            response (obj)  : Streamed requests response
+            max_bytes (int) : Most bytes allowed to be read
+            chunk_size (int): Bytes to download at a time
+        """
+        self.chunks = response.iter_content(chunk_size=chunk_size)
+        self.max_bytes = max_bytes
+        self.content = bytearray()
+        self.position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes, downloading more chunks as needed.
+
+        Parameters:
+            size (int) : Number of bytes to read, all if negative
+
+        Returns:
+            (bytes) : Read bytes, empty at end of response
+        """
+        while size < 0 or len(self.content) - self.position < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            if len(self.content) + len(chunk) > self.max_bytes:
+                raise RemoteFileTooLargeError(f'Remote file is larger than {self.max_bytes / 1000000:.1f} MB limit')
+            self.content += chunk
+
+        end = len(self.content) if size < 0 else min(self.position + size, len(self.content))
+        data = bytes(self.content[self.position : end])
+        self.position = end
+        return data
+
+
+def _is_acceptable_remote_file(headers, remote_filename: str) -> bool:
+    """Check if a remote exam file is not too large and of a text or YAML content type.
+
+    Parameters:
+        headers (dict)       : HTTP response headers
+        remote_filename (str): Name of the remote file, for logging
+
+    Returns:
+        (bool) : True if acceptable, else False
+    """
+    # Check if file is below size limit, if the server tells the size
+    content_length = headers.get('Content-length')
+    if content_length and content_length.isdigit():
+        content_length_mb = int(content_length) / 1000000
+        logger.debug(f'Requested file content length: {content_length_mb:.5f} MB)')
+        if int(content_length) > REMOTE_FILE_MAX_BYTES:
+            logger.debug(
+                f'The requested remote file "{remote_filename}" is {content_length_mb:.2f} MB '
+                'and larger than 1.0 MB limit, will not download'
+            )
+            return False
+
+    # Check if content is text or yaml based
+    content_types_accepted = ['text/plain', 'text/x-yaml', 'application/x-yaml', 'text/yaml', 'text/vnd.yaml']
+    content_type = headers.get('content-type')
+    logger.debug(f'Request content type: {content_type}')
+    if not content_type:
+        return False
+    if not any(ext in content_type for ext in content_types_accepted):
+        logger.debug(
+            f'The content type "{content_type}" of the requested file "{remote_filename}" is '
+            f'not one of the following: {content_types_accepted}'
+        )
+        return False
+
+    return True
+
+
+def _load_remote_file_yaml(content) -> dict:
+    """Load the YAML content of a remote exam file.
+
+    Parameters:
+        content (bytes or obj) : Remote file content, or a file-like reader of it
+
+    Returns:
+        file_contents (Dict) : The contents of the file, empty if failed
+    """
+    logger.debug('Loading contents of remote file ...')
+    try:
+        return load_yaml(content)
+    except Exception as error:
+        logger.debug(f'Failed loading requested file. Exception: {error}')
+        return {}
+
+
+def load_examfile_contents_from_url(
+    remote_file_url: url, allow_redirects: bool = True, cache: Optional[HttpCache] = None
+) -> dict:
     """Load a remote exam file contents over HTTP.
 
+    With a cache, a cached copy is used without contacting the server while it
+    is within the cache TTL (or always in offline mode). After that the server
+    is asked with a conditional GET, which does not download an unchanged file.
+
     Parameters:
         remote_file_url (url)  : Remote URL location of file to be loaded
         allow_redirects (bool) : If True allow redirects to another URL (defulat True)
+        cache (HttpCache)      : On-disk HTTP cache for remote exam files, no caching if None
 
     Returns:
         file_contents (Dict) : The contents of the file
@@ -298,55 +453,55 @@ def load_examfile_contents_from_url(remote_file_url: url, allow_redirects: bool
         )
         return {}
 
-    # Get request headers
-    logger.debug(f'Getting remote file HTTP request headers for "{remote_file_url}" ...')
-    try:
-        h = requests.head(remote_file_url)
-    except Exception as error:
-        logger.debug(f'Failed to request headers. Exception: {error}')
-        return {}
-    header = h.headers
+    # Use the cached file if it is recent enough or in offline mode
+    cache_entry = cache.load(remote_file_url) if cache else {}
+    if cache and (cache.is_fresh(cache_entry) or cache.offline):
+        content = cache.read_content(remote_file_url) if cache_entry else None
+        if content is None:
+            logger.debug(f'Offline mode and no cached copy of remote file "{remote_file_url}"')
+            return {}
+        logger.debug(f'Using cached copy of remote file "{remote_file_url}"')
+        return _load_remote_file_yaml(content)
 
-    # Check if file is below size limit
-    content_length = int(header['Content-length']) / 1000000
-    logger.debug(f'Requested file content length: {content_length:.5f} MB)')
-    if content_length > 1.0:
-        logger.debug(
-            f'The requested remote file "{remote_filename}" is {content_length:.2f} MB '
-            'and larger than 1.0 MB limit, will not download'
-        )
-        return {}
+    # Only needed for remote exam files
+    import requests
 
-    # Check if content is text or yaml based
-    content_types_accepted = ['text/plain', 'text/x-yaml', 'application/x-yaml', 'text/yaml', 'text/vnd.yaml']
-    content_type = header.get('content-type')
-    logger.debug(f'Request content type: {content_type}')
-    if not content_type:
-        return {}
-    if not any(ext in content_type for ext in content_types_accepted):
-        logger.debug(
-            f'The content type "{content_type}" of the requested file "{remote_filename}" is '
-            'not one of the following: {content_types_accepted}'
+    # Downloading the file content in one streamed request, unless the cached copy is still current
+    logger.debug(f"Requesting remote file: '{remote_file_url}' ...")
+    try:
+        response = requests.get(
+            remote_file_url,
+            allow_redirects=allow_redirects,
+            headers=HttpCache.get_conditional_headers(cache_entry),
+            stream=True,
         )
+    except Exception as error:
+        logger.debug(f'Failed to request remote file. Exception: {error}')
         return {}
 
-    # Downloading the file content
-    logger.debug(f"Requesting remote file: '{remote_file_url}' ...")
-    response = requests.get(remote_file_url, allow_redirects=allow_redirects)
-
-    # Check if no error from downloading
-    if response.ok:
-        # Loading the yaml file content
-        logger.debug('Loading contents of remote file ...')
-        try:
-            # open(os.path.join(local_dir, remote_filename), 'wb').write(remote_request.content)
-            file_contents = yaml.safe_load(response.content)
-        except Exception as error:
-            logger.debug(f'Failed loading requested file. Exception: {error}')
+    with response:
+        # Cached copy is still current
+        if cache and cache_entry and response.status_code == 304:
+            logger.debug('Remote file not modified, using cached copy')
+            cache.revalidated(remote_file_url, cache_entry)
+            content = cache.read_content(remote_file_url)
+            return _load_remote_file_yaml(content) if content is not None else {}
+
+        # Check if no error from downloading
+        if not response.ok:
+            logger.debug(
+                f"Failed to get remote file '{remote_file_url}'. HTTP request error code {response.status_code}"
+            )
             return {}
-    else:
-        logger.debug(f"Failed to get remote file '{remote_file_url}'. HTTP request error code {response.status_code}")
-        return {}
+        if not _is_acceptable_remote_file(response.headers, remote_filename):
+            return {}
+
+        # Loading the yaml file content while it downloads, stops at the size limit
+        reader = CappedResponseReader(response, REMOTE_FILE_MAX_BYTES)
+        file_contents = _load_remote_file_yaml(reader)
+
+    if file_contents and cache:
+        cache.save(remote_file_url, bytes(reader.content), response.headers)
 
     return file_contents
 
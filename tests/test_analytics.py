@@ -0,0 +1,32 @@
+"""Item analysis over exam attempt records."""
+
+import os
+
+from exam_terminal import analytics, utility
+
+SAMPLE_EXAM = os.path.join(os.path.dirname(__file__), '..', 'exam_terminal', 'exams', 'sample_exam.yml')
+
+
+def test_records_with_out_of_range_indexes_are_skipped():
+    analysis = analytics.ItemAnalysis()
+    records = [
+        {'answers': [[10**9]], 'correct': [True]},
+        {'answers': [[-1]], 'correct': [True]},
+        {'answers': [[True]], 'correct': [True]},
+        {'answers': [[0]], 'question_indexes': [analytics.MAX_QUESTIONS], 'correct': [True]},
+        {'answers': [[0]], 'question_indexes': ['0'], 'correct': [True]},
+        {'answers': [[2], [1]], 'correct': [True, False]},
+    ]
+    assert analysis.add_attempts(records) == 1
+    assert analysis.get_summary()['attempts'] == 1
+
+
+def test_selection_indexes_are_checked_against_the_exam():
+    analysis = analytics.ItemAnalysis(utility.load_examfile_contents_from_local_file(SAMPLE_EXAM))
+    selection_count = analysis.grader.selection_counts[0]
+    records = [
+        {'answers': [[selection_count]]},
+        {'answers': [[0]], 'question_indexes': [analysis.grader.questions_count]},
+        {'answers': [[selection_count - 1]]},
+    ]
+    assert analysis.add_attempts(records) == 1
@@ -0,0 +1,95 @@
+"""Resuming an interrupted exam from its journal.
+
+Whole exams run headlessly, with every question answered with its first selection.
+The interruption is a SystemExit raised from the question screen, as on a terminal hangup.
+"""
+
+import os
+import time
+
+import pytest
+
+from exam_terminal import ExamTerminal, exam_journal, utility
+
+SAMPLE_EXAM = os.path.join(os.path.dirname(__file__), '..', 'exam_terminal', 'exams', 'sample_exam.yml')
+INTERRUPT_AT = 3
+
+
+def make_answerer(interrupt_at=None):
+    """Stand-in for the interactive question screen, optionally hanging up on one question"""
+    shown = []
+
+    def answer_first_selection(question: dict) -> tuple[str, bool]:
+        shown.append(question['question_number'])
+        if question['question_number'] == interrupt_at:
+            raise SystemExit(1)
+        time.sleep(0.05)
+        question['answered_indexes'] = [0]
+        return 'answer', question['question_answer_indexes'] == [0]
+
+    return answer_first_selection, shown
+
+
+def run_exam(journal_path: str, resume: bool = False, interrupt_at=None) -> tuple[ExamTerminal.ExamTerminal, list]:
+    exam = ExamTerminal.ExamTerminal(
+        utility.load_examfile_contents_from_local_file(SAMPLE_EXAM), journal_path=journal_path, resume=resume
+    )
+    exam.show_question, shown = make_answerer(interrupt_at)
+    try:
+        exam.begin_exam()
+    except SystemExit:
+        pass
+    return exam, shown
+
+
+def summary(exam: ExamTerminal.ExamTerminal) -> tuple:
+    questions = exam.exam_contents['questions']
+    answers = [(q.get('answered_indexes'), q.get('answered_correctly')) for q in questions if q.get('answered')]
+    return (
+        exam.questions_complete,
+        exam.questions_correct,
+        exam.questions_wrong,
+        answers,
+        exam.exam_contents['exam']['evaluation_percent'],
+    )
+
+
+def test_resumed_exam_ends_as_uninterrupted(tmp_path):
+    journal_path = str(tmp_path / 'exam.journal')
+    exam, _ = run_exam(journal_path)
+    expected = summary(exam)
+    assert not os.path.exists(journal_path), 'Journal of a finished exam was not removed'
+
+    exam, _ = run_exam(journal_path, interrupt_at=INTERRUPT_AT)
+    interrupted_time = exam.exam_elapsed_time
+    begin_time = exam.exam_begin_time
+
+    # A half written last line, as left by a crash
+    with open(journal_path, 'a') as file:
+        file.write('{"event": "answ')
+
+    exam, shown = run_exam(journal_path, resume=True)
+    assert shown[0] == INTERRUPT_AT
+    assert summary(exam) == expected
+    assert exam.exam_begin_time == begin_time
+    assert interrupted_time - 0.01 <= exam.exam_elapsed_time < interrupted_time + 1.0
+    assert not os.path.exists(journal_path), 'Journal of a finished exam was not removed'
+
+
+def test_running_exam_journal_is_left_alone(tmp_path):
+    journal_path = str(tmp_path / 'exam.journal')
+    running = exam_journal.ExamJournal(journal_path)
+    running.append('begin', exam_title='Running', questions_count=1)
+    time.sleep(0.05)
+    assert exam_journal.is_journal_locked(journal_path)
+    with pytest.raises(BlockingIOError):
+        exam_journal.ExamJournal(journal_path)
+
+    exam = ExamTerminal.ExamTerminal(
+        utility.load_examfile_contents_from_local_file(SAMPLE_EXAM), journal_path=journal_path, resume=True
+    )
+    assert exam.resume_state is None, 'Resumed the journal of a running session'
+    assert [event['event'] for event in exam_journal.load_journal(journal_path)] == ['begin']
+
+    running.remove()
+    assert not exam_journal.is_journal_locked(journal_path)
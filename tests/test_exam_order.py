@@ -0,0 +1,116 @@
+"""Seeded drawing and shuffling of exam questions and selections.
+
+Whole exams run headlessly, with every question answered with its first shown selection.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from exam_terminal import ExamTerminal
+from exam_terminal.exam_order import ExamOrder
+from exam_terminal.grading import ExamGrader
+
+POOL_SIZE = 40
+DRAW_COUNT = 8
+SEED = 1234
+INTERRUPT_AT = 3
+
+
+def make_exam_contents() -> dict:
+    """Loaded exam contents of a synthetic exam drawing and shuffling its questions"""
+    exam = {
+        'exam_title': 'Seeded Exam',
+        'exam_description': 'Questions drawn and shuffled',
+        'exam_author': 'Nobody',
+        'exam_edit_date': '01/01/2030',
+        'exam_allowed_time': 600,
+        'exam_allowed_time_units': 'seconds',
+        'exam_passing_score': 50,
+        'exam_draw_questions': DRAW_COUNT,
+        'exam_shuffle_questions': True,
+        'exam_shuffle_selections': True,
+    }
+    questions = []
+    for q in range(POOL_SIZE):
+        selections = [f'Selection {s} of question {q}' for s in range(2 + q % 5)]
+        selections[q % len(selections)] = {selections[q % len(selections)]: True}
+        questions.append({'question': f'Question {q}', 'selection': selections})
+    return {'exam': exam, 'questions': questions}
+
+
+def order_fingerprint(seed: int) -> list:
+    """Drawn question indexes and the selection order of each"""
+    order = ExamOrder(POOL_SIZE, seed, DRAW_COUNT, shuffle_questions=True, shuffle_selections=True)
+    return [[index, list(order.selection_order(position, 5))] for position, index in enumerate(order.question_indexes)]
+
+
+def run_exam(seed=None, journal_path=None, resume=False, interrupt_at=None) -> tuple[ExamTerminal.ExamTerminal, list]:
+    """Run an exam, recording the question and selections shown"""
+    shown = []
+
+    def answer_first_selection(question) -> tuple[str, bool]:
+        if len(shown) == interrupt_at:
+            raise SystemExit(1)
+        shown.append((question['question'], question['selection']))
+        question['answered_indexes'] = [0]
+        return 'answer', question['question_answer_indexes'] == [0]
+
+    exam = ExamTerminal.ExamTerminal(make_exam_contents(), journal_path=journal_path, resume=resume, seed=seed)
+    exam.show_question = answer_first_selection
+    try:
+        exam.begin_exam()
+    except SystemExit:
+        pass
+    return exam, shown
+
+
+def test_same_seed_draws_same_exam():
+    fingerprint = order_fingerprint(SEED)
+    assert fingerprint == order_fingerprint(SEED)
+    assert fingerprint != order_fingerprint(SEED + 1)
+    assert len({index for index, _ in fingerprint}) == DRAW_COUNT, 'A question was drawn twice'
+
+
+def test_same_seed_draws_same_exam_in_another_process():
+    code = f'import json, test_exam_order; print(json.dumps(test_exam_order.order_fingerprint({SEED})))'
+    # Another hash seed, so nothing may depend on hashing
+    environment = dict(os.environ, PYTHONHASHSEED='12345', PYTHONPATH=os.path.join(os.path.dirname(__file__), '..'))
+    other = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=os.path.dirname(__file__),
+        env=environment,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert json.loads(other.stdout) == order_fingerprint(SEED)
+
+
+def test_seeded_exam_records_answers_in_exam_file_order():
+    exam, shown = run_exam(seed=SEED)
+    _, shown_again = run_exam(seed=SEED)
+    assert shown == shown_again
+    assert len(shown) == exam.questions_total == DRAW_COUNT
+    assert exam.exam_contents['exam']['exam_seed'] == SEED
+
+    record = exam.get_attempt_record()
+    assert record['seed'] == SEED
+    grader = ExamGrader(make_exam_contents())
+    for position, (index, (text, selections)) in enumerate(zip(record['question_indexes'], shown)):
+        question = exam.exam_contents['questions'][position]
+        assert question['question'] == text == f'Question {index}'
+        assert question['selection'][question['answered_indexes'][0]] == selections[0]
+        assert record['answers'][position] == question['answered_indexes']
+        assert grader.grade_answer(index, record['answers'][position]) == record['correct'][position]
+
+
+def test_resumed_exam_is_drawn_from_its_journaled_seed(tmp_path):
+    journal_path = str(tmp_path / 'exam.journal')
+    exam, shown_before = run_exam(journal_path=journal_path, interrupt_at=INTERRUPT_AT)
+    seed = exam.exam_order.seed
+    exam, shown_after = run_exam(journal_path=journal_path, resume=True)
+    assert exam.exam_order.seed == seed
+    _, shown_seeded = run_exam(seed=seed)
+    assert shown_before + shown_after == shown_seeded
@@ -0,0 +1,144 @@
+"""Exam server, many scripted clients taking the exam at once."""
+
+import asyncio
+import copy
+import json
+import os
+import random
+
+import pytest
+
+from exam_terminal import exam_server, utility
+from exam_terminal.grading import ExamGrader
+
+SAMPLE_EXAM = os.path.join(os.path.dirname(__file__), '..', 'exam_terminal', 'exams', 'sample_exam.yml')
+CLIENTS = 50
+
+
+@pytest.fixture
+def exam_contents() -> dict:
+    return utility.load_examfile_contents_from_local_file(SAMPLE_EXAM)
+
+
+async def scripted_client(socket_path: str, seed: int) -> tuple[list, dict]:
+    """Take the whole exam with random selections, returns the answers given and the result"""
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_unix_connection(socket_path)
+
+    async def request(message: dict) -> dict:
+        writer.write(json.dumps(message).encode() + b'\n')
+        await writer.drain()
+        return json.loads(await reader.readline())
+
+    json.loads(await reader.readline())
+    response = await request({'command': 'begin'})
+    answers = []
+    while 'result' not in response:
+        question = response['question']
+        if rng.random() < 0.1:
+            assert (await request({'command': 'pause'}))['status']['paused']
+            rejected = await request({'command': 'answer', 'selections': [0]})
+            assert not rejected['ok'] and rejected['question'] == question
+            await request({'command': 'resume'})
+        selections = rng.sample(range(len(question['selection'])), max(question['question_min_selection_count'], 1))
+        if rng.random() < 0.1:
+            # Answers the interactive exam would not take are rejected, the question stays the same
+            extra = next(index for index in range(len(question['selection'])) if index not in selections)
+            for invalid in ([True], [selections[0], *selections], [*selections, extra]):
+                rejected = await request({'command': 'answer', 'selections': invalid})
+                assert not rejected['ok'] and rejected['question'] == question
+        answers.append(sorted(selections))
+        response = await request({'command': 'answer', 'selections': selections})
+        assert response['ok']
+    writer.close()
+    return answers, response['result']
+
+
+async def serve_clients(server: exam_server.ExamServer, socket_path: str, text_client_input: list) -> tuple:
+    """Serve scripted clients and one line mode client at once, as used by "exam-terminal connect" """
+    serving = asyncio.create_task(server.serve(socket_path=socket_path))
+    while not os.path.exists(socket_path):
+        await asyncio.sleep(0.01)
+
+    def run_text_client() -> tuple[dict, list]:
+        typed = iter(text_client_input)
+        output = []
+        with exam_server.connect_socket(socket_path) as connection:
+            return exam_server.run_text_client(connection, lambda prompt: next(typed), output.append), output
+
+    try:
+        return await asyncio.gather(
+            asyncio.gather(*(scripted_client(socket_path, seed) for seed in range(CLIENTS))),
+            asyncio.to_thread(run_text_client),
+        )
+    finally:
+        serving.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await serving
+
+
+def test_concurrent_clients(tmp_path, exam_contents):
+    socket_path = str(tmp_path / 'exam.sock')
+    attempts_path = str(tmp_path / 'attempts.jsonl')
+    server = exam_server.ExamServer(copy.deepcopy(exam_contents), attempts_file=attempts_path)
+    text_client_input = ['', 'p', '1', 'r', '1', '1,5,6', '2', '2', '2']
+    results, (text_result, output) = asyncio.run(serve_clients(server, socket_path, text_client_input))
+
+    grader = ExamGrader(exam_contents)
+    for answers, result in results:
+        expected = grader.grade_sheet({'answers': answers})
+        assert result['answers'] == answers
+        assert result['questions_correct'] == expected['questions_correct']
+        assert result['evaluation_label'] == expected['evaluation_label']
+    assert len({result['id'] for _, result in results}) == CLIENTS, 'Session ids are not unique'
+
+    assert text_result['answers'][0] == [0] and text_result['answers'][1] == [0, 4, 5]
+    assert any(line.startswith('! Exam is paused') for line in output), 'Answer while paused was not rejected'
+
+    with open(attempts_path) as file:
+        records = [json.loads(line) for line in file]
+    assert len(records) == CLIENTS + 1
+    assert not os.path.exists(socket_path), 'Server socket was not removed'
+
+
+async def take_exam(server: exam_server.ExamServer, session: exam_server.ExamSession) -> dict:
+    """Answer every question of a session correctly, in its shown selection order"""
+    response = json.loads(await server.handle_request(session, b'{"command": "begin"}'))
+    while 'result' not in response:
+        shown = response['question']['selection']
+        question = server.served.grader.questions[session.file_question_index]
+        selections = [shown.index(question['selection'][index]) for index in question['question_answer_indexes']]
+        answer = {'command': 'answer', 'selections': selections or [0]}
+        response = json.loads(await server.handle_request(session, json.dumps(answer).encode()))
+    return response['result']
+
+
+def test_sessions_draw_their_own_questions(exam_contents):
+    exam_contents['exam'].update(exam_draw_questions=3, exam_shuffle_questions=True, exam_shuffle_selections=True)
+    server = exam_server.ExamServer(exam_contents)
+    results = [asyncio.run(take_exam(server, exam_server.ExamSession(server.served, str(n)))) for n in range(10)]
+
+    assert len({result['seed'] for result in results}) == 10
+    assert len({tuple(result['question_indexes']) for result in results}) > 1
+    for result in results:
+        assert len(result['answers']) == len(result['question_indexes']) == 3
+        assert result['questions_correct'] == 3 and result['evaluation_percent'] == 100.0
+
+    seeded = exam_server.ExamServer(exam_contents, seed=1234)
+    first, second = (exam_server.ExamSession(seeded.served, str(n)) for n in range(2))
+    assert list(first.order.question_indexes) == list(second.order.question_indexes)
+    assert first.order.seed == second.order.seed == 1234
+
+
+def test_question_allowed_time(exam_contents, monkeypatch):
+    server = exam_server.ExamServer(exam_contents)
+    session = exam_server.ExamSession(server.served, 'timed')
+    asyncio.run(server.handle_request(session, b'{"command": "begin"}'))
+    allowed_time = server.served.grader.questions[0]['question_allowed_time']
+    begin = session.question_shown_time
+    monkeypatch.setattr(type(session.timer), 'elapsed_time', property(lambda timer: begin + allowed_time + 1))
+
+    response = json.loads(asyncio.run(server.handle_request(session, b'{"command": "answer", "selections": [0]}')))
+    assert not response['ok'] and response['error'] == 'Question time has expired'
+    assert response['status']['question_index'] == 1
+    assert session.answers == [[]] and session.correct == [False]
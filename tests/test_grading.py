@@ -0,0 +1,65 @@
+"""Grading answer sheets without the interactive exam."""
+
+import io
+import json
+import logging
+import os
+
+import pytest
+
+from exam_terminal import analytics, grading, utility
+
+SAMPLE_EXAM = os.path.join(os.path.dirname(__file__), '..', 'exam_terminal', 'exams', 'sample_exam.yml')
+
+# Answer sheet lines, only the first and the last are valid answer sheets
+LINES = [
+    '{"id": "good-1", "answers": [[4], [0, 4, 5], [3], null, [1]]}',
+    '[1, 2]',
+    '"just a string"',
+    '42',
+    'null',
+    '{"id": "broken", "answers": [',
+    '{"id": "good-2", "answers": [[0]]}',
+]
+
+
+@pytest.fixture
+def exam_contents() -> dict:
+    return utility.load_examfile_contents_from_local_file(SAMPLE_EXAM)
+
+
+def test_read_answer_sheets_skips_invalid_lines(caplog):
+    with caplog.at_level(logging.ERROR):
+        sheets = list(grading.read_answer_sheets(LINES))
+    assert [sheet['id'] for sheet in sheets] == ['good-1', 'good-2']
+    for line_number in (2, 3, 4, 5):
+        assert f'line {line_number}, not a JSON object' in caplog.text
+    assert 'line 6, not valid JSON' in caplog.text
+
+
+def test_grade_answer_sheets(exam_contents):
+    results = io.StringIO()
+    assert grading.grade_answer_sheets(exam_contents, io.StringIO('\n'.join(LINES)), results) == 2
+    first, second = (json.loads(line) for line in results.getvalue().splitlines())
+    assert (first['id'], first['questions_correct'], first['questions_count']) == ('good-1', 4, 5)
+    assert (second['id'], second['questions_correct']) == ('good-2', 0)
+    assert not second['evaluation_bool']
+
+
+def test_grade_answer_sheets_parallel_matches_serial(exam_contents):
+    sheets = '\n'.join(LINES * 50) + '\n'
+    serial = io.StringIO()
+    grading.grade_answer_sheets(exam_contents, io.StringIO(sheets), serial)
+    parallel = io.StringIO()
+    count = grading.grade_answer_sheets_parallel(
+        exam_contents, io.StringIO(sheets), parallel, workers=2, batch_size=16
+    )
+    assert count == 100
+    assert parallel.getvalue() == serial.getvalue()
+
+
+def test_analyze_skips_invalid_lines(exam_contents):
+    report = io.StringIO()
+    count = analytics.analyze_attempt_records([io.StringIO('\n'.join(LINES))], report, exam_contents, as_json=True)
+    assert count == 2
+    assert json.loads(report.getvalue())['attempts'] == 2
@@ -0,0 +1,54 @@
+"""Results PDF rendered in the background, and from serialized result records.
+
+Whole exams run headlessly, with every question answered with its first selection.
+"""
+
+import json
+import os
+import time
+
+from exam_terminal import ExamTerminal, pdf_report, result_export, utility
+
+SAMPLE_EXAM = os.path.join(os.path.dirname(__file__), '..', 'exam_terminal', 'exams', 'sample_exam.yml')
+
+
+def answer_first_selection(question: dict) -> tuple[str, bool]:
+    """Stand-in for the interactive question screen"""
+    question['answered_indexes'] = [0]
+    return 'answer', question['question_answer_indexes'] == [0]
+
+
+def run_exam(exam_contents: dict) -> ExamTerminal.ExamTerminal:
+    exam = ExamTerminal.ExamTerminal(exam_contents)
+    exam.show_question = answer_first_selection
+    exam.begin_exam()
+    return exam
+
+
+def render_from_record(exam: ExamTerminal.ExamTerminal, directory: str) -> bytes:
+    """Render the results PDF from the serialized result record, as "exam-terminal report" does"""
+    record = result_export.get_result_record(exam.exam_contents, exam.exam_contents['questions'])
+    file_path, _, _ = pdf_report.render_record_report(json.loads(json.dumps(record, default=str)), directory)
+    with open(file_path, 'rb') as file:
+        return file.read()
+
+
+def test_background_render_matches_synchronous_render(tmp_path):
+    exam = run_exam(utility.load_examfile_contents_from_local_file(SAMPLE_EXAM))
+    assert exam.pdf_render is not None, 'PDF render was not started after the exam was evaluated'
+
+    background = exam.pdf_render.result(timeout=60)
+    time.sleep(1.1)  # A render a second later must not differ (ie. by creation date)
+    assert background.startswith(b'%PDF')
+    assert exam.render_results_pdf() == background
+    assert render_from_record(exam, str(tmp_path)) == background
+
+
+def test_next_exam_attempt_does_not_change_rendering_pdf(tmp_path):
+    exam_contents = utility.load_examfile_contents_from_local_file(SAMPLE_EXAM)
+    exam = run_exam(exam_contents)
+    expected = render_from_record(exam, str(tmp_path))
+
+    # The next exam attempt resets the shared questions while the PDF of the last one is rendering
+    ExamTerminal.ExamTerminal(exam_contents, exam_attempt=1)
+    assert exam.pdf_render.result(timeout=60) == expected
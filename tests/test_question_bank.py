@@ -0,0 +1,73 @@
+"""Lazily loaded question banks of very large exam files."""
+
+import pytest
+
+from exam_terminal import ExamTerminal, question_bank
+from exam_terminal.question_bank import LazyQuestionBank, load_examfile_contents_lazily
+
+QUESTIONS_COUNT = 200
+
+
+@pytest.fixture
+def exam_file(tmp_path) -> str:
+    lines = [
+        'exam:',
+        '  exam_title: "Lazy Exam"',
+        '  exam_description: Questions loaded as they are reached',
+        '  exam_author: Nobody',
+        '  exam_edit_date: "01/01/2030"',
+        '  exam_allowed_time: 10',
+        '  exam_allowed_time_units: minutes',
+        '  exam_passing_score: 60',
+        '  exam_draw_questions: 5',
+        'questions:',
+    ]
+    for q in range(QUESTIONS_COUNT):
+        lines.extend([f'  - question: "Question {q}"', '    selection:', '      - "a": true', '      - "b"'])
+    file_path = tmp_path / 'exam.yml'
+    file_path.write_text('\n'.join(lines) + '\n')
+    return str(file_path)
+
+
+def test_questions_are_parsed_when_reached(exam_file):
+    bank = load_examfile_contents_lazily(exam_file)['questions']
+    assert isinstance(bank, LazyQuestionBank)
+    assert bank[3]['question'] == 'Question 3'
+    assert bank[-1]['question'] == f'Question {QUESTIONS_COUNT - 1}'
+    assert len(bank) == QUESTIONS_COUNT
+    assert [question['question'] for question in bank[:2]] == ['Question 0', 'Question 1']
+    with pytest.raises(IndexError):
+        bank[QUESTIONS_COUNT]
+
+
+def test_no_file_handle_is_left_open(exam_file, monkeypatch):
+    opened = []
+
+    def tracking_open(*args, **kwargs):
+        opened.append(open(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(question_bank, 'open', tracking_open, raising=False)
+    bank = load_examfile_contents_lazily(exam_file)['questions']
+    bank.wait_until_indexed()
+    bank[0]
+    bank.trailing_contents()
+    assert opened and all(file.closed for file in opened)
+
+
+def test_questions_are_drawn_when_the_exam_begins(exam_file):
+    exam = ExamTerminal.ExamTerminal(load_examfile_contents_lazily(exam_file), seed=1234)
+    assert exam.exam_order is None, 'Lazily loaded questions were drawn before the exam began'
+
+    asked = []
+
+    def answer_first_selection(question: dict) -> tuple[str, bool]:
+        asked.append(question['question'])
+        question['answered_indexes'] = [0]
+        return 'answer', True
+
+    exam.show_question = answer_first_selection
+    exam.begin_exam()
+    assert exam.exam_order.seed == 1234
+    assert exam.questions_total == len(asked) == 5
+    assert asked == [f'Question {index}' for index in exam.exam_order.question_indexes]
@@ -0,0 +1,105 @@
+"""Assembling exams from indexed question banks."""
+
+import os
+
+import pytest
+
+from exam_terminal import ExamTerminal, question_index, utility
+from exam_terminal.question_index import QuestionIndex, get_question_labels, parse_pick
+
+TAGS = ('networking', 'security', 'storage')
+DIFFICULTIES = ('easy', 'medium', 'hard')
+PICKS = ['20:networking', '10:difficulty=hard', '5:security', '3:networking,difficulty=easy', '2']
+
+
+@pytest.fixture
+def banks(tmp_path) -> list:
+    """A large bank with an exam section, and a small one with a less indented questions list"""
+    lines = [
+        'exam:',
+        '  exam_title: "Bank A"',
+        '  exam_description: Synthetic question bank',
+        '  exam_author: Check',
+        '  exam_edit_date: "01/01/2030"',
+        '  exam_allowed_time: 10',
+        '  exam_allowed_time_units: minutes',
+        '  exam_passing_score: 60',
+        'questions:',
+    ]
+    for q in range(3000):
+        lines.append(f'  - question: "A{q}"')
+        lines.append(f'    question_tags: [{TAGS[q % 3]}{", Security" if q % 7 == 0 else ""}]')
+        lines.append(f'    question_difficulty: {DIFFICULTIES[q % 5 % 3]}')
+        lines.append('    selection:')
+        lines.extend(['      - "x": true', '      - "y"'])
+    lines.append('  - question: "Invalid, no selections"')
+    bank_a = tmp_path / 'a.yml'
+    bank_a.write_text('\n'.join(lines) + '\n')
+
+    lines = ['questions:']
+    for q in range(200):
+        lines.extend(['- question: |', f'    B{q}', '    second line', '  question_tags: Networking'])
+        lines.extend(['  selection:', '  - p', '  - q: true'])
+    bank_b = tmp_path / 'b.yml'
+    bank_b.write_text('\n'.join(lines) + '\n')
+    return [str(bank_a), str(bank_b)]
+
+
+def assemble(banks: list, file_path: str, seed: int) -> QuestionIndex:
+    index = QuestionIndex(banks)
+    index.write_exam_file(file_path, index.pick([parse_pick(pick) for pick in PICKS], seed))
+    return index
+
+
+def test_assembled_questions_match_picks(banks, tmp_path, monkeypatch):
+    index = QuestionIndex(banks)
+    assert index.built_count == 2 and len(index) == 3200
+
+    # Once indexed, only the exam information is parsed, picked questions are copied as they are
+    loads = []
+    load_yaml = utility.load_yaml
+    monkeypatch.setattr(utility, 'load_yaml', lambda stream: loads.append(stream) or load_yaml(stream))
+    exam_file = str(tmp_path / 'exam.yml')
+    index = assemble(banks, exam_file, 1234)
+    monkeypatch.undo()
+    assert index.built_count == 0, 'Up to date indexes were built again'
+    assert len(loads) == 1
+
+    contents = utility.load_examfile_contents_from_local_file(exam_file)
+    questions = contents['questions']
+    assert len(questions) == 40
+    assert len({question['question'] for question in questions}) == 40, 'A question was picked twice'
+    position = 0
+    for pick in PICKS:
+        count, tags, difficulty = parse_pick(pick)
+        for question in questions[position : position + count]:
+            question_tags, question_difficulty = get_question_labels(question)
+            assert set(tags) <= set(question_tags)
+            assert difficulty is None or question_difficulty == difficulty
+        position += count
+    assert any(question['question'].startswith('B') for question in questions), 'Nothing picked from the second bank'
+    assert contents['exam']['exam_title'] == 'Bank A'
+
+    # The exam file runs as is
+    assert ExamTerminal.ExamTerminal(contents).questions_total == 40
+
+
+def test_same_seed_assembles_same_exam_file(banks, tmp_path):
+    assemble(banks, str(tmp_path / 'exam.yml'), 1234)
+    assemble(banks, str(tmp_path / 'again.yml'), 1234)
+    assert (tmp_path / 'exam.yml').read_bytes() == (tmp_path / 'again.yml').read_bytes()
+
+
+def test_changed_bank_is_indexed_again(banks):
+    QuestionIndex(banks)
+    with open(banks[1], 'a') as file:
+        file.write('- question: New\n  question_tags: networking\n  selection:\n  - a: true\n')
+    index = QuestionIndex(banks)
+    assert index.built_count == 1 and len(index) == 3201
+    assert os.path.exists(question_index.get_index_file_path(banks[0]))
+
+
+def test_pick_more_than_match(banks):
+    index = QuestionIndex(banks)
+    with pytest.raises(ValueError):
+        index.pick([parse_pick('1000:security,difficulty=hard')], 1)